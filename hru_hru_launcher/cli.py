@@ -0,0 +1,280 @@
+# hru_hru_launcher/cli.py
+"""
+Headless command-line interface for scripted setups:
+
+    python -m hru_hru_launcher.cli install 1.20.1 --loader fabric
+    python -m hru_hru_launcher.cli launch 1.20.1 --username Steve
+    python -m hru_hru_launcher.cli verify 1.20.1 --repair
+    python -m hru_hru_launcher.cli mods sync --version 1.20.1 --loader fabric --project AANobbMI
+    python -m hru_hru_launcher.cli list forge
+
+It uses the same install and launch code as the window (LaunchSession) and
+never imports PySide6. Every command writes one JSON object per line to
+stdout ("progress", "log", "output", "result", ...); diagnostics go to stderr.
+"""
+import sys
+import json
+import time
+import argparse
+import logging
+import threading
+
+from requests.exceptions import RequestException
+
+from hru_hru_launcher.config import settings as launcher_settings
+from hru_hru_launcher.config import resources
+from hru_hru_launcher.core.launch_session import LaunchSession, InterruptedError
+from hru_hru_launcher.core.downloader import DownloadCancelled
+from hru_hru_launcher.core.version_index import get_version_index
+from hru_hru_launcher.core.version_catalog import parse_installed_id
+from hru_hru_launcher.core import catalog_cache
+from hru_hru_launcher.core import jvm_profiles
+from hru_hru_launcher.core import mod_manager
+from hru_hru_launcher.core import verifier
+from hru_hru_launcher.utils.paths import get_minecraft_directory
+
+EXIT_OK = 0
+EXIT_ERROR = 1
+EXIT_CANCELLED = 130
+
+PROGRESS_INTERVAL = 0.25
+
+
+class JsonReporter:
+    """Writes JSON lines to stdout. Progress events are limited to a few per second."""
+
+    def __init__(self, stream=None, game_output=True):
+        self.stream = stream or sys.stdout
+        self.game_output = game_output
+        self._lock = threading.Lock()
+        self._last_progress = (0.0, None)
+
+    def emit(self, event, **fields):
+        line = json.dumps(dict(event=event, **fields), ensure_ascii=False)
+        with self._lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+    def progress(self, current, total, status):
+        now = time.monotonic()
+        last_time, last_status = self._last_progress
+        if status == last_status and now - last_time < PROGRESS_INTERVAL and (not total or current < total):
+            return
+        self._last_progress = (now, status)
+        self.emit("progress", current=current, total=total, status=status)
+
+    def log(self, message):
+        self.emit("log", message=message)
+
+    def output(self, lines):
+        if self.game_output:
+            self.emit("output", lines=lines)
+
+    def callback(self):
+        """minecraft_launcher_lib-style callback dict."""
+        status = {"text": ""}
+
+        def set_status(text):
+            status["text"] = text
+            self.progress(0, 0, text)
+
+        def set_progress(value, max_value=0):
+            if max_value > 0:
+                self.progress(value, max_value, status["text"])
+
+        return {"setStatus": set_status, "setProgress": set_progress}
+
+
+def _run_interruptible(session, target):
+    """
+    Runs target in a worker thread so Ctrl+C stops the session cleanly
+    (finished files stay in the install journal, partial ones as .part files) instead of killing it mid-write.
+    """
+    outcome = {}
+
+    def runner():
+        try:
+            outcome["value"] = target()
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=runner, daemon=True)
+    thread.start()
+    while thread.is_alive():
+        try:
+            thread.join(0.2)
+        except KeyboardInterrupt:
+            session.stop()
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome.get("value")
+
+
+def _mod_loader(args):
+    return args.loader if args.loader != "vanilla" else None
+
+
+def _new_session(args, reporter, settings, username="Player", options=None):
+    return LaunchSession(
+        args.version, username, args.minecraft_dir, settings.get("clientToken"),
+        memory_gb=getattr(args, "memory", None) or settings.get("memory", 4),
+        fullscreen=getattr(args, "fullscreen", False),
+        options=options, lang=args.lang, mod_loader=_mod_loader(args),
+        on_progress=reporter.progress, on_log=reporter.log, on_output=reporter.output,
+        on_process_started=lambda pid: reporter.emit("process_started", pid=pid),
+    )
+
+
+def cmd_install(args, reporter, settings):
+    session = _new_session(args, reporter, settings)
+    try:
+        version_id = _run_interruptible(session, session.install)
+    except (InterruptedError, DownloadCancelled):
+        reporter.emit("result", result="cancelled", message="Install progress was saved and will resume on the next run.")
+        return EXIT_CANCELLED
+    except RequestException as e:
+        reporter.emit("result", result="error", type="network_error", message=str(e))
+        return EXIT_ERROR
+    except Exception as e:
+        reporter.emit("result", result="error", type="generic", message=str(e))
+        return EXIT_ERROR
+    reporter.emit("result", result="success", version_id=version_id)
+    return EXIT_OK
+
+
+def cmd_launch(args, reporter, settings):
+    version_type = args.loader
+    profile_key = jvm_profiles.config_key(version_type, args.version)
+    options = {
+        "executablePath": args.java or settings.get("java_path") or None,
+        "jvmArguments": (args.jvm_args if args.jvm_args is not None else settings.get("jvm_args", "")).split(),
+        "jvmProfile": args.jvm_profile or settings.get("jvm_profiles", {}).get(profile_key, jvm_profiles.PROFILE_AUTO),
+        "useCds": settings.get("use_cds", False) if args.cds is None else args.cds,
+        "resourceSampleInterval": settings.get("resource_sample_interval_ms", 1000),
+        "processPriority": settings.get("process_priority", {}).get(profile_key),
+        "resolutionWidth": args.width,
+        "resolutionHeight": args.height,
+    }
+    session = _new_session(args, reporter, settings, username=args.username, options=options)
+    result, details = _run_interruptible(session, session.run)
+    reporter.emit("result", result=result, details=details, timing=session.timer.to_record(result))
+    if result == "success":
+        return EXIT_OK
+    return EXIT_CANCELLED if result == "cancelled" else EXIT_ERROR
+
+
+def cmd_verify(args, reporter, settings):
+    cancelled = threading.Event()
+    is_running = lambda: not cancelled.is_set()
+    try:
+        if args.repair:
+            repaired = verifier.repair_version(args.version, args.minecraft_dir, reporter.callback(), is_running, log=reporter.log)
+            reporter.emit("result", result="success", version_id=args.version, repaired=repaired)
+            return EXIT_OK
+        broken = verifier.verify_version(args.version, args.minecraft_dir, reporter.callback(), is_running)
+    except KeyboardInterrupt:
+        cancelled.set()
+        reporter.emit("result", result="cancelled")
+        return EXIT_CANCELLED
+    except Exception as e:
+        reporter.emit("result", result="error", message=str(e))
+        return EXIT_ERROR
+    for task, reason in broken:
+        reporter.emit("broken", path=task["path"], reason=reason)
+    reporter.emit("result", result="success" if not broken else "broken", version_id=args.version, broken=len(broken))
+    return EXIT_OK if not broken else EXIT_ERROR
+
+
+def cmd_mods_sync(args, reporter, settings):
+    lang_dict = resources.LANGUAGES[args.lang]
+    try:
+        results = mod_manager.sync_mods(
+            args.minecraft_dir, args.version, args.loader, lang_dict,
+            project_ids=args.project or None, prune=args.prune, log=reporter.log,
+        )
+    except (IOError, OSError) as e:
+        reporter.emit("result", result="error", message=str(e))
+        return EXIT_ERROR
+    for entry in results:
+        reporter.emit("mod", **entry)
+    failed = [entry for entry in results if entry["action"] == "failed"]
+    reporter.emit("result", result="error" if failed else "success", failed=len(failed), total=len(results), api=mod_manager.api_stats())
+    return EXIT_ERROR if failed else EXIT_OK
+
+
+def cmd_list(args, reporter, settings):
+    if args.type == "installed":
+        records = [parse_installed_id(version_id) for version_id in get_version_index(args.minecraft_dir).get_installed_ids()]
+        versions = [{"id": r.id, "mc_version": r.mc_version, "loader": r.loader} for r in records]
+    else:
+        try:
+            versions, _ = catalog_cache.refresh_catalog(args.type)
+        except Exception as e:
+            reporter.emit("result", result="error", type="network_error", message=str(e))
+            return EXIT_ERROR
+    reporter.emit("versions", type=args.type, versions=versions)
+    return EXIT_OK
+
+
+def build_parser(settings):
+    parser = argparse.ArgumentParser(prog="python -m hru_hru_launcher.cli", description="Hru Hru Launcher without the window. Prints JSON lines.")
+    parser.add_argument("--minecraft-dir", default=get_minecraft_directory(), help="game folder (default: the standard .minecraft)")
+    parser.add_argument("--lang", choices=sorted(resources.LANGUAGES), default=settings.get("language", "en"))
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_version_args(command):
+        command.add_argument("version", help="Minecraft version; Forge builds look like 1.20.1-47.2.0")
+        command.add_argument("--loader", choices=["vanilla", "forge", "fabric"], default="vanilla")
+
+    install = commands.add_parser("install", help="install a version and its mod loader")
+    add_version_args(install)
+    install.set_defaults(handler=cmd_install)
+
+    launch = commands.add_parser("launch", help="install if needed and run the game until it exits")
+    add_version_args(launch)
+    launch.add_argument("--username", default=settings.get("last_username") or "Player")
+    launch.add_argument("--memory", type=int, help="heap size in GB")
+    launch.add_argument("--java", help="Java executable (default: picked automatically)")
+    launch.add_argument("--jvm-args", help="extra JVM arguments as one string")
+    launch.add_argument("--jvm-profile", choices=jvm_profiles.PROFILE_IDS)
+    launch.add_argument("--cds", dest="cds", action="store_true", default=None, help="use a class-data archive")
+    launch.add_argument("--no-cds", dest="cds", action="store_false")
+    launch.add_argument("--fullscreen", action="store_true")
+    launch.add_argument("--width")
+    launch.add_argument("--height")
+    launch.add_argument("--no-game-output", action="store_true", help="do not print the game's own output")
+    launch.set_defaults(handler=cmd_launch)
+
+    verify = commands.add_parser("verify", help="check an installed version's files")
+    verify.add_argument("version", help="installed version id")
+    verify.add_argument("--repair", action="store_true", help="re-download broken files")
+    verify.set_defaults(handler=cmd_verify)
+
+    mods = commands.add_parser("mods", help="manage Modrinth mods")
+    mods_commands = mods.add_subparsers(dest="mods_command", required=True)
+    sync = mods_commands.add_parser("sync", help="update tracked mods and install the listed projects")
+    sync.add_argument("--version", required=True, help="Minecraft version the mods are for")
+    sync.add_argument("--loader", choices=["forge", "fabric"], required=True)
+    sync.add_argument("--project", action="append", help="Modrinth project id or slug to install (repeatable)")
+    sync.add_argument("--prune", action="store_true", help="remove tracked mods that are not listed with --project")
+    sync.set_defaults(handler=cmd_mods_sync)
+
+    list_command = commands.add_parser("list", help="list installed versions or a version catalog")
+    list_command.add_argument("type", nargs="?", choices=["installed", "vanilla", "forge", "fabric"], default="installed")
+    list_command.set_defaults(handler=cmd_list)
+    return parser
+
+
+def main(argv=None):
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s [%(levelname)s] %(message)s", stream=sys.stderr)
+    settings = launcher_settings.load_settings()
+    args = build_parser(settings).parse_args(argv)
+    if getattr(args, "command", None) == "mods" and args.prune and not args.project:
+        logging.error("--prune needs the full list of wanted mods given with --project.")
+        return EXIT_ERROR
+    reporter = JsonReporter(game_output=not getattr(args, "no_game_output", False))
+    return args.handler(args, reporter, settings)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -51,7 +51,7 @@ LANGUAGES = {
         "error_occurred": "Произошла ошибка: ", "error_dialog_title": "Обнаружена Ошибка", "fix_button": "Исправить",
         "cancel_button": "Отмена", "error_file_corruption_title": "Повреждение Файлов",
         "error_file_corruption_desc": "Похоже, что основные файлы версии '{version_id}' повреждены или отсутствуют.",
-        "error_file_corruption_fix": "Рекомендуется полностью переустановить эту версию. Все ваши миры и настройки сохранятся.",
+        "error_file_corruption_fix": "Лаунчер проверит файлы этой версии и скачает заново только повреждённые. Все ваши миры и настройки сохранятся.",
         "error_java_path_title": "Неверный Путь Java", "error_java_path_desc": "Лаунчер не смог найти Java по указанному пути.",
         "error_java_path_fix": "Предлагается сбросить путь к Java на автоматическое определение и повторить запуск.",
         "error_jvm_args_title": "Неверный Аргумент JVM", "error_jvm_args_desc": "Игра не запустилась из-за неверного аргумента, переданного Java.",
@@ -72,12 +72,33 @@ LANGUAGES = {
         "error_scanning_versions": "Ошибка при сканировании версий.", "open_folder": "Папка", "repair": "Починить",
         "delete": "Удалить", "version_id_tooltip": "ID Версии", "folder_name_tooltip": "Имя папки",
         "confirm_delete_title": "Подтвердите удаление", "confirm_delete_text": "Вы уверены, что хотите удалить версию '{version_id}'? Это действие необратимо.",
-        "confirm_repair_title": "Подтвердите восстановление", "confirm_repair_text": "Это удалит все файлы версии '{version_id}', и они будут скачаны заново при следующем запуске. Продолжить?",
+        "confirm_repair_title": "Подтвердите восстановление", "confirm_repair_text": "Файлы версии '{version_id}' будут проверены, повреждённые и отсутствующие будут скачаны заново. Продолжить?",
         "version_type_label": "Тип: {type}", "tooltip_settings": "Настройки", "tooltip_console": "Консоль",
         "select_version_dialog_title": "Выберите версию", "select_version_prompt": "Для версии {base_version} найдено несколько вариантов. Выберите, к какому применить действие.",
         "action_button_delete": "Удалить выбранное", "action_button_repair": "Починить выбранное", "action_button_open_folder": "Открыть папку выбранного",
         "delete_selected": "Удалить выбранное",
         "confirm_multi_delete_title": "Подтвердите удаление",
+        "console_filter_all": "Все сообщения", "console_filter_warnings": "Предупреждения и ошибки", "console_filter_errors": "Только ошибки",
+        "console_mirror_to_log": "Дублировать вывод консоли в лог лаунчера",
+        "repair_complete": "Восстановление {version_id} завершено: заменено файлов: {count}.", "repair_nothing_to_fix": "Все файлы {version_id} в порядке.",
+        "repair_failed_title": "Ошибка восстановления", "repair_failed_text": "Не удалось проверить версию '{version_id}': {error}\n\nПереустановить её полностью?",
+        "jvm_profile": "Профиль настройки JVM ({version})", "jvm_profile_auto": "Авто (по памяти и версии Java)",
+        "jvm_profile_g1_client": "G1 — для игры", "jvm_profile_large_heap": "ZGC/Shenandoah — для большого объёма памяти",
+        "jvm_profile_low_memory": "Экономия памяти", "jvm_profile_none": "Без настройки (только -Xmx/-Xms)",
+        "use_cds": "Ускорять запуск игры архивом классов (Java 13+)",
+        "launch_history": "История запусков", "export_json": "Экспорт в JSON", "close": "Закрыть", "history_date": "Дата", "history_result": "Результат",
+        "history_base_install": "Установка", "history_loader_install": "Загрузчик", "history_command_build": "Команда",
+        "history_spawn": "Старт процесса", "history_first_output": "Первый вывод", "history_ready": "Главное меню",
+        "history_regression_hint": "Время, превышающее медиану прошлых запусков этой версии более чем на 25%, выделено.",
+        "history_exported": "Экспортировано запусков: {count} в {path}",
+        "background_prefetch": "Устанавливать выбранную версию в фоне",
+        "launcher_log": "Лаунчер", "stop_instance": "Остановить", "instance_starting": "Запуск...", "instance_peak_ram": "пик ОЗУ",
+        "instance_success": "Завершён", "instance_cancelled": "Остановлен", "instance_error": "Ошибка",
+        "max_instances_reached": "Уже запущено копий игры: {count}.",
+        "history_heap": "Куча", "history_peak_ram": "Пик ОЗУ", "history_ram_growth": "Рост ОЗУ",
+        "process_priority": "Приоритет процесса игры ({version})", "cpu_affinity_placeholder": "Все ядра (напр. 0-3,6)", "invalid_affinity_title": "Неверный список ядер",
+        "priority_idle": "Низкий", "priority_below_normal": "Ниже среднего", "priority_normal": "Обычный", "priority_above_normal": "Выше среднего", "priority_high": "Высокий",
+        "io_priority_idle": "Диск: фоновый", "io_priority_low": "Диск: низкий", "io_priority_normal": "Диск: обычный",
         "confirm_multi_delete_text": "Вы уверены, что хотите удалить следующие {count} версий?\n\n - {versions}"
     },
     "en": {
@@ -103,7 +124,7 @@ LANGUAGES = {
         "error_occurred": "An error occurred: ", "error_dialog_title": "Error Detected", "fix_button": "Fix It",
         "cancel_button": "Cancel", "error_file_corruption_title": "File Corruption",
         "error_file_corruption_desc": "It seems the core files for version '{version_id}' are corrupt or missing.",
-        "error_file_corruption_fix": "It is recommended to completely reinstall this version. All your worlds and settings will be saved.",
+        "error_file_corruption_fix": "The launcher will check the files of this version and redownload only the broken ones. All your worlds and settings will be saved.",
         "error_java_path_title": "Invalid Java Path", "error_java_path_desc": "The launcher could not find Java at the specified path.",
         "error_java_path_fix": "We suggest resetting the Java path to automatic detection and trying to launch again.",
         "error_jvm_args_title": "Invalid JVM Argument", "error_jvm_args_desc": "The game failed to launch due to an incorrect argument passed to Java.",
@@ -124,12 +145,33 @@ LANGUAGES = {
         "error_scanning_versions": "Error while scanning versions.", "open_folder": "Folder", "repair": "Repair",
         "delete": "Delete", "version_id_tooltip": "Version ID", "folder_name_tooltip": "Folder name",
         "confirm_delete_title": "Confirm Deletion", "confirm_delete_text": "Are you sure you want to delete version '{version_id}'? This action cannot be undone.",
-        "confirm_repair_title": "Confirm Repair", "confirm_repair_text": "This will delete all files for version '{version_id}' and they will be redownloaded on the next launch. Continue?",
+        "confirm_repair_title": "Confirm Repair", "confirm_repair_text": "The files of version '{version_id}' will be checked and any broken or missing ones will be redownloaded. Continue?",
         "version_type_label": "Type: {type}", "tooltip_settings": "Settings", "tooltip_console": "Console",
         "select_version_dialog_title": "Select Version", "select_version_prompt": "Multiple variants found for {base_version}. Please choose which one to affect.",
         "action_button_delete": "Delete Selected", "action_button_repair": "Repair Selected", "action_button_open_folder": "Open Selected Folder",
         "delete_selected": "Delete Selected",
         "confirm_multi_delete_title": "Confirm Deletion",
+        "console_filter_all": "All messages", "console_filter_warnings": "Warnings and errors", "console_filter_errors": "Errors only",
+        "console_mirror_to_log": "Mirror console output to the launcher log",
+        "repair_complete": "Repair of {version_id} finished: {count} files replaced.", "repair_nothing_to_fix": "All files of {version_id} are intact.",
+        "repair_failed_title": "Repair Failed", "repair_failed_text": "Could not verify version '{version_id}': {error}\n\nReinstall it completely?",
+        "jvm_profile": "JVM Tuning Profile ({version})", "jvm_profile_auto": "Auto (by memory and Java version)",
+        "jvm_profile_g1_client": "G1 — tuned for play", "jvm_profile_large_heap": "ZGC/Shenandoah — for large heaps",
+        "jvm_profile_low_memory": "Low memory", "jvm_profile_none": "No tuning (-Xmx/-Xms only)",
+        "use_cds": "Speed up game startup with a class-data archive (Java 13+)",
+        "launch_history": "Launch History", "export_json": "Export JSON", "close": "Close", "history_date": "Date", "history_result": "Result",
+        "history_base_install": "Install", "history_loader_install": "Loader", "history_command_build": "Command",
+        "history_spawn": "Spawn", "history_first_output": "First output", "history_ready": "Main menu",
+        "history_regression_hint": "Times more than 25% above the median of earlier launches of the same version are highlighted.",
+        "history_exported": "Exported {count} launches to {path}",
+        "background_prefetch": "Install the selected version in the background",
+        "launcher_log": "Launcher", "stop_instance": "Stop", "instance_starting": "Starting...", "instance_peak_ram": "peak RAM",
+        "instance_success": "Exited", "instance_cancelled": "Stopped", "instance_error": "Crashed",
+        "max_instances_reached": "{count} game instances are already running.",
+        "history_heap": "Heap", "history_peak_ram": "Peak RAM", "history_ram_growth": "RAM growth",
+        "process_priority": "Game Process Priority ({version})", "cpu_affinity_placeholder": "All CPUs (e.g. 0-3,6)", "invalid_affinity_title": "Invalid CPU List",
+        "priority_idle": "Idle", "priority_below_normal": "Below normal", "priority_normal": "Normal", "priority_above_normal": "Above normal", "priority_high": "High",
+        "io_priority_idle": "Disk: idle", "io_priority_low": "Disk: low", "io_priority_normal": "Disk: normal",
         "confirm_multi_delete_text": "Are you sure you want to delete the following {count} versions?\n\n - {versions}"
     },
     "ua": {
@@ -155,7 +197,7 @@ LANGUAGES = {
         "error_occurred": "Сталася помилка: ", "error_dialog_title": "Виявлено Помилку", "fix_button": "Виправити",
         "cancel_button": "Скасувати", "error_file_corruption_title": "Пошкодження Файлів",
         "error_file_corruption_desc": "Схоже, що основні файли версії '{version_id}' пошкоджені або відсутні.",
-        "error_file_corruption_fix": "Рекомендується повністю перевстановити цю версію. Усі ваші світи та налаштування збережуться.",
+        "error_file_corruption_fix": "Лаунчер перевірить файли цієї версії та завантажить заново лише пошкоджені. Усі ваші світи та налаштування збережуться.",
         "error_java_path_title": "Неправильний Шлях Java", "error_java_path_desc": "Лаунчер не зміг знайти Java за вказаним шляхом.",
         "error_java_path_fix": "Пропонується скинути шлях до Java на автоматичне визначення та повторити запуск.",
         "error_jvm_args_title": "Неправильний Аргумент JVM", "error_jvm_args_desc": "Гра не запустилася через невірний аргумент, переданий Java.",
@@ -176,12 +218,33 @@ LANGUAGES = {
         "error_scanning_versions": "Помилка під час сканування версій.", "open_folder": "Папка", "repair": "Полагодити",
         "delete": "Видалити", "version_id_tooltip": "ID Версії", "folder_name_tooltip": "Ім'я папки",
         "confirm_delete_title": "Підтвердіть видалення", "confirm_delete_text": "Ви впевнені, що хочете видалити версію '{version_id}'? Ця дія незворотна.",
-        "confirm_repair_title": "Підтвердіть відновлення", "confirm_repair_text": "Це видалить усі файли версії '{version_id}', і вони будуть завантажені знову при наступному запуску. Продовжити?",
+        "confirm_repair_title": "Підтвердіть відновлення", "confirm_repair_text": "Файли версії '{version_id}' буде перевірено, пошкоджені та відсутні буде завантажено знову. Продовжити?",
         "version_type_label": "Тип: {type}", "tooltip_settings": "Налаштування", "tooltip_console": "Консоль",
         "select_version_dialog_title": "Виберіть версію", "select_version_prompt": "Для версії {base_version} знайдено декілька варіантів. Виберіть, до якого застосувати дію.",
         "action_button_delete": "Видалити обране", "action_button_repair": "Полагодити обране", "action_button_open_folder": "Відкрити папку обраного",
         "delete_selected": "Видалити обране",
         "confirm_multi_delete_title": "Підтвердіть видалення",
+        "console_filter_all": "Усі повідомлення", "console_filter_warnings": "Попередження та помилки", "console_filter_errors": "Лише помилки",
+        "console_mirror_to_log": "Дублювати вивід консолі в лог лаунчера",
+        "repair_complete": "Відновлення {version_id} завершено: замінено файлів: {count}.", "repair_nothing_to_fix": "Усі файли {version_id} в порядку.",
+        "repair_failed_title": "Помилка відновлення", "repair_failed_text": "Не вдалося перевірити версію '{version_id}': {error}\n\nПеревстановити її повністю?",
+        "jvm_profile": "Профіль налаштування JVM ({version})", "jvm_profile_auto": "Авто (за пам'яттю та версією Java)",
+        "jvm_profile_g1_client": "G1 — для гри", "jvm_profile_large_heap": "ZGC/Shenandoah — для великого обсягу пам'яті",
+        "jvm_profile_low_memory": "Економія пам'яті", "jvm_profile_none": "Без налаштування (лише -Xmx/-Xms)",
+        "use_cds": "Прискорювати запуск гри архівом класів (Java 13+)",
+        "launch_history": "Історія запусків", "export_json": "Експорт у JSON", "close": "Закрити", "history_date": "Дата", "history_result": "Результат",
+        "history_base_install": "Встановлення", "history_loader_install": "Завантажувач", "history_command_build": "Команда",
+        "history_spawn": "Старт процесу", "history_first_output": "Перший вивід", "history_ready": "Головне меню",
+        "history_regression_hint": "Час, що перевищує медіану попередніх запусків цієї версії більш ніж на 25%, виділено.",
+        "history_exported": "Експортовано запусків: {count} до {path}",
+        "background_prefetch": "Встановлювати вибрану версію у фоні",
+        "launcher_log": "Лаунчер", "stop_instance": "Зупинити", "instance_starting": "Запуск...", "instance_peak_ram": "пік ОЗП",
+        "instance_success": "Завершено", "instance_cancelled": "Зупинено", "instance_error": "Помилка",
+        "max_instances_reached": "Вже запущено копій гри: {count}.",
+        "history_heap": "Купа", "history_peak_ram": "Пік ОЗП", "history_ram_growth": "Зростання ОЗП",
+        "process_priority": "Пріоритет процесу гри ({version})", "cpu_affinity_placeholder": "Усі ядра (напр. 0-3,6)", "invalid_affinity_title": "Невірний список ядер",
+        "priority_idle": "Низький", "priority_below_normal": "Нижче середнього", "priority_normal": "Звичайний", "priority_above_normal": "Вище середнього", "priority_high": "Високий",
+        "io_priority_idle": "Диск: фоновий", "io_priority_low": "Диск: низький", "io_priority_normal": "Диск: звичайний",
         "confirm_multi_delete_text": "Ви впевнені, що хочете видалити наступні {count} версій?\n\n - {versions}"
     }
 }
\ No newline at end of file
@@ -20,6 +20,16 @@ def load_settings():
         "window_geometry": "",
         "jvm_args": "",
         "java_path": "",
+        "jvm_profiles": {},
+        "process_priority": {},
+        "use_cds": False,
+        "background_prefetch": False,
+        "prefetch_max_kbps": 2048,
+        "max_instances": 4,
+        "resource_sample_interval_ms": 1000,
+        "mod_search_debounce_ms": 300,
+        "console_max_lines": 5000,
+        "console_mirror_to_log": False,
         "clientToken": uuid.uuid4().hex,
     }
     
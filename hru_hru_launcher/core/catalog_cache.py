@@ -0,0 +1,128 @@
+# hru_hru_launcher/core/catalog_cache.py
+import os
+import json
+import time
+import logging
+import threading
+import xml.etree.ElementTree as ET
+
+from hru_hru_launcher.utils.paths import get_launcher_data_dir
+from hru_hru_launcher.utils import helpers
+
+# load_catalog runs while the window is built; the network stack is only needed to refresh.
+requests = helpers.lazy_import("requests")
+downloader = helpers.lazy_import("hru_hru_launcher.core.downloader")
+
+CATALOG_FORMAT_VERSION = 1
+CATALOG_TTL_SECONDS = 6 * 60 * 60
+REQUEST_TIMEOUT = 15
+
+FORGE_METADATA_URL = "https://maven.minecraftforge.net/net/minecraftforge/forge/maven-metadata.xml"
+FABRIC_GAME_VERSIONS_URL = "https://meta.fabricmc.net/v2/versions/game"
+
+_lock = threading.Lock()
+
+
+def _parse_vanilla(response):
+    return [v["id"] for v in response.json().get("versions", []) if v.get("type") == "release"]
+
+
+def _parse_forge(response):
+    root = ET.fromstring(response.content)
+    return helpers.get_latest_versions([node.text for node in root.findall("./versioning/versions/version") if node.text])
+
+
+def _parse_fabric(response):
+    return [v["version"] for v in response.json() if v.get("stable")]
+
+
+# A None URL stands for downloader.VERSION_MANIFEST_URL
+CATALOG_SOURCES = {
+    "vanilla": (None, _parse_vanilla),
+    "forge": (FORGE_METADATA_URL, _parse_forge),
+    "fabric": (FABRIC_GAME_VERSIONS_URL, _parse_fabric),
+}
+
+
+def _catalog_path(version_type):
+    catalogs_dir = os.path.join(get_launcher_data_dir(), "catalogs")
+    os.makedirs(catalogs_dir, exist_ok=True)
+    return os.path.join(catalogs_dir, f"{version_type}.json")
+
+
+def _read_entry(version_type):
+    path = _catalog_path(version_type)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+        if entry.get("format") != CATALOG_FORMAT_VERSION or not isinstance(entry.get("versions"), list):
+            return None
+        return entry
+    except (IOError, json.JSONDecodeError, AttributeError) as e:
+        logging.warning(f"Could not read cached {version_type} catalog: {e}")
+        return None
+
+
+def _write_entry(version_type, entry):
+    path = _catalog_path(version_type)
+    try:
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(dict(entry, format=CATALOG_FORMAT_VERSION), f)
+        os.replace(path + ".tmp", path)
+    except IOError as e:
+        logging.warning(f"Could not save {version_type} catalog: {e}")
+
+
+def load_catalog(version_type: str):
+    """Returns the last good version list for a loader type from disk, or None."""
+    with _lock:
+        entry = _read_entry(version_type)
+    return entry["versions"] if entry else None
+
+
+def refresh_catalog(version_type: str, max_age: int = CATALOG_TTL_SECONDS, session=None):
+    """
+    Brings the cached catalog up to date and returns (versions, changed).
+    Within max_age the cache is used as is; after that it is revalidated with
+    ETag / If-Modified-Since so an unchanged list costs a 304. If the network
+    fails, the last good catalog is returned; without one the error is raised.
+    """
+    url, parse = CATALOG_SOURCES[version_type]
+    url = url or downloader.VERSION_MANIFEST_URL
+    with _lock:
+        entry = _read_entry(version_type)
+    if entry and time.time() - entry.get("checked_at", 0) < max_age:
+        return entry["versions"], False
+
+    headers = {"User-Agent": downloader.USER_AGENT}
+    if entry and entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry and entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+
+    try:
+        response = (session or requests).get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+        if response.status_code == 304 and entry:
+            entry["checked_at"] = time.time()
+            with _lock:
+                _write_entry(version_type, entry)
+            return entry["versions"], False
+        response.raise_for_status()
+        versions = parse(response)
+    except (requests.RequestException, ValueError, ET.ParseError) as e:
+        if entry:
+            logging.warning(f"Could not refresh {version_type} catalog, using the cached one: {e}")
+            return entry["versions"], False
+        raise
+
+    changed = not entry or entry["versions"] != versions
+    with _lock:
+        _write_entry(version_type, {
+            "versions": versions,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "checked_at": time.time(),
+        })
+    return versions, changed
@@ -0,0 +1,174 @@
+# hru_hru_launcher/core/cds_archive.py
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+
+from hru_hru_launcher.utils.paths import get_launcher_data_dir
+from .launch_cache import classpath_from_command
+
+CDS_INDEX_FORMAT_VERSION = 1
+MIN_JAVA_MAJOR = 13
+MAX_DUMP_ATTEMPTS = 2
+MAX_ARCHIVES = 8
+
+_REJECT_MARKERS = ("Unable to use shared archive", "mismatch", "An error has occurred while processing the shared archive file")
+
+_lock = threading.Lock()
+
+
+def get_archives_dir():
+    archives_dir = os.path.join(get_launcher_data_dir(), "cds_archives")
+    os.makedirs(archives_dir, exist_ok=True)
+    return archives_dir
+
+
+def _index_path():
+    return os.path.join(get_archives_dir(), "index.json")
+
+
+def _read_index():
+    path = _index_path()
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("format") != CDS_INDEX_FORMAT_VERSION:
+            return {}
+        return data.get("archives", {})
+    except (IOError, json.JSONDecodeError, AttributeError) as e:
+        logging.warning(f"Could not read CDS archive index: {e}")
+        return {}
+
+
+def _write_index(archives):
+    try:
+        path = _index_path()
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump({"format": CDS_INDEX_FORMAT_VERSION, "archives": archives}, f, indent=2)
+        os.replace(path + ".tmp", path)
+    except IOError as e:
+        logging.warning(f"Could not save CDS archive index: {e}")
+
+
+def _stat_entry(path):
+    try:
+        st = os.stat(path)
+        return [os.path.normcase(path), st.st_size, st.st_mtime_ns]
+    except OSError:
+        return [os.path.normcase(path), -1, -1]
+
+
+def archive_key(command, java_info, minecraft_dir):
+    """
+    Hashes everything a class-data archive depends on: the JVM build, the
+    exact classpath with each entry's size and mtime, and the jars in mods/.
+    Any change to libraries, mods or the JVM produces a new key.
+    """
+    mods_dir = os.path.join(minecraft_dir, "mods")
+    try:
+        mod_jars = sorted(name for name in os.listdir(mods_dir) if name.endswith(".jar"))
+    except OSError:
+        mod_jars = []
+    payload = {
+        "java": [java_info.get("path"), java_info.get("version"), java_info.get("vendor"), java_info.get("arch"),
+                 _stat_entry(java_info["path"])[1:] if java_info.get("path") else None],
+        "classpath": [_stat_entry(p) for p in classpath_from_command(command)],
+        "mods": [_stat_entry(os.path.join(mods_dir, name)) for name in mod_jars],
+    }
+    return hashlib.sha1(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def archive_path(key):
+    return os.path.join(get_archives_dir(), f"{key}.jsa")
+
+
+def is_supported(java_info):
+    return bool(java_info) and java_info.get("major", 0) >= MIN_JAVA_MAJOR
+
+
+def prepare_command(command, key):
+    """
+    Returns (command, mode). mode is "use" when an archive exists and is passed
+    with -XX:SharedArchiveFile, "dump" when this run should create it with
+    -XX:ArchiveClassesAtExit, or None when the archive is skipped.
+    Archives are only dumped after the version has already run successfully once.
+    """
+    path = archive_path(key)
+    with _lock:
+        archives = _read_index()
+        entry = archives.get(key)
+        if entry and os.path.isfile(path):
+            entry["last_used"] = time.time()
+            _write_index(archives)
+    if entry and os.path.isfile(path):
+        return [command[0], f"-XX:SharedArchiveFile={path}"] + list(command[1:]), "use"
+    if entry and entry.get("successful_runs", 0) > 0 and entry.get("dump_attempts", 0) < MAX_DUMP_ATTEMPTS:
+        return [command[0], f"-XX:ArchiveClassesAtExit={path}"] + list(command[1:]), "dump"
+    return list(command), None
+
+
+def record_run(key, version_id, mode, success: bool, startup_ms=None):
+    """
+    Updates the archive index after a run: counts successful runs and dump
+    attempts, and keeps the last startup time with and without the archive so
+    the saving can be reported. Returns the entry.
+    """
+    with _lock:
+        archives = _read_index()
+        entry = archives.get(key) or {"version_id": version_id, "successful_runs": 0, "dump_attempts": 0}
+        if success:
+            entry["successful_runs"] += 1
+        if mode == "dump":
+            entry["dump_attempts"] += 1
+            if os.path.isfile(archive_path(key)):
+                entry["created"] = time.time()
+                entry["size_bytes"] = os.path.getsize(archive_path(key))
+        if success and startup_ms is not None and mode != "dump":
+            entry["archived_ms" if mode == "use" else "baseline_ms"] = round(startup_ms)
+        entry["last_used"] = time.time()
+        archives[key] = entry
+
+        # Archives of stale classpaths are never looked up again; keep the most recently used ones
+        while len(archives) > MAX_ARCHIVES:
+            old_key = min(archives, key=lambda k: archives[k].get("last_used", 0))
+            archives.pop(old_key)
+            try:
+                if os.path.isfile(archive_path(old_key)):
+                    os.remove(archive_path(old_key))
+            except OSError as e:
+                logging.warning(f"Could not remove old CDS archive: {e}")
+        _write_index(archives)
+    return entry
+
+
+def is_archive_rejected(line: str):
+    """True for the JVM warnings printed when an archive cannot be mapped."""
+    return "[cds]" in line.lower() and any(marker in line for marker in _REJECT_MARKERS)
+
+
+def drop_archive(key):
+    """Deletes an archive the JVM refused to map so the next run dumps a fresh one."""
+    with _lock:
+        archives = _read_index()
+        entry = archives.get(key)
+        if entry:
+            entry["dump_attempts"] = 0
+            entry.pop("archived_ms", None)
+            _write_index(archives)
+    try:
+        if os.path.isfile(archive_path(key)):
+            os.remove(archive_path(key))
+    except OSError as e:
+        logging.warning(f"Could not remove CDS archive: {e}")
+
+
+def describe_saving(entry):
+    """Returns a short human-readable summary of the startup time saved, or None."""
+    baseline, archived = entry.get("baseline_ms"), entry.get("archived_ms")
+    if not baseline or not archived:
+        return None
+    return f"startup {archived} ms with class-data archive vs {baseline} ms without ({baseline - archived} ms saved)"
@@ -0,0 +1,262 @@
+# hru_hru_launcher/core/crash_classifier.py
+import os
+import re
+import json
+import logging
+import threading
+from collections import deque
+
+from hru_hru_launcher.utils.paths import get_launcher_data_dir
+
+USER_RULES_PATH = os.path.join(get_launcher_data_dir(), "crash_rules.json")
+
+# Only the start of very long lines (base64 dumps, huge stack frames) is
+# matched; every crash signature sits well within it
+MAX_LINE_LENGTH = 4096
+
+# Each rule maps literal substrings of the game output to an error_details
+# "type" understood by MinecraftLauncher.on_launch_finished. The rule with
+# the highest priority among those that matched wins. "extract" is an
+# optional regex run on the matching line, and on up to "extract_lines"
+# lines after it, to fill extra fields.
+DEFAULT_RULES = [
+    {
+        "id": "missing_minecraft_class",
+        "patterns": ["Could not find net/minecraft/client/Minecraft.class"],
+        "type": "file_corruption",
+        "priority": 100,
+    },
+    {
+        "id": "wrong_java_version",
+        "patterns": [
+            "java.lang.UnsupportedClassVersionError",
+            "has been compiled by a more recent version of the Java Runtime",
+        ],
+        "type": "invalid_java_path",
+        "message": "The selected Java version is too old or too new for this version of Minecraft.",
+        "priority": 90,
+    },
+    {
+        "id": "invalid_jvm_option",
+        "patterns": [
+            "Unrecognized VM option",
+            "Could not create the Java Virtual Machine",
+            "Invalid maximum heap size",
+            "Invalid initial heap size",
+            "Could not reserve enough space for object heap",
+            "Unrecognized option:",
+        ],
+        "type": "invalid_jvm_argument",
+        "priority": 85,
+    },
+    {
+        "id": "fabric_missing_dependency",
+        "patterns": [
+            "Incompatible mods found!",
+            "Incompatible mod set!",
+            "Some of your mods are incompatible with the game or each other!",
+            ", which is missing!",
+        ],
+        "type": "fabric_dependency_error",
+        "extract": r"requires (?:any version|version [^ ]+) of ([\w\-]+), which is missing|^\s*- Install ([\w\-]+), any version\.",
+        "extract_field": "dependency",
+        "extract_lines": 20,
+        "priority": 80,
+    },
+    {
+        "id": "forge_missing_dependency",
+        "patterns": ["Missing or unsupported mandatory dependencies"],
+        "type": "fabric_dependency_error",
+        "extract": r"Mod ID: '([\w\-]+)'",
+        "extract_field": "dependency",
+        "extract_lines": 20,
+        "priority": 79,
+    },
+    {
+        "id": "out_of_memory",
+        "patterns": ["java.lang.OutOfMemoryError", "There is insufficient memory for the Java Runtime Environment"],
+        "type": "out_of_memory",
+        "message": "The game ran out of memory. Allocate more RAM in the settings or remove heavy mods.",
+        "priority": 70,
+    },
+    {
+        "id": "mixin_failure",
+        "patterns": [
+            "MixinApplyError",
+            "MixinTransformerError",
+            "Mixin apply failed",
+            "InvalidMixinException",
+            "Mixin prepare failed",
+        ],
+        "type": "mod_incompatibility",
+        "message": "A mod failed to apply its mixins. One of the mods is incompatible with this version or with another mod.",
+        "priority": 60,
+    },
+    {
+        "id": "incompatible_environment",
+        "patterns": ["IncompatibleEnvironmentException", "InvalidLauncherSetupException"],
+        "type": "mod_incompatibility",
+        "message": "A mod is incompatible with this version of Minecraft or Forge.",
+        "priority": 55,
+    },
+    {
+        "id": "graphics_driver",
+        "patterns": [
+            "GLFW error 65542",
+            "GLFW error 65543",
+            "Pixel format not accelerated",
+            "No OpenGL context",
+            "WGL: The driver does not appear to support OpenGL",
+            "org.lwjgl.LWJGLException",
+        ],
+        "type": "graphics_driver_error",
+        "message": "The graphics driver does not support the required OpenGL version. Update your GPU drivers.",
+        "priority": 50,
+    },
+    {
+        "id": "file_locked",
+        "patterns": ["The process cannot access the file because it is being used by another process"],
+        "type": "file_lock_error",
+        "priority": 40,
+    },
+]
+
+
+class MultiPatternMatcher:
+    """Aho-Corasick automaton: finds every pattern occurring in a line in one pass."""
+
+    def __init__(self, patterns):
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        for pattern_id, pattern in enumerate(patterns):
+            self._add(pattern, pattern_id)
+        self._build()
+
+    def _add(self, pattern, pattern_id):
+        state = 0
+        for ch in pattern:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][ch] = next_state
+            state = next_state
+        self._output[state].append(pattern_id)
+
+    def _build(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(ch, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def search(self, text):
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+        found = set()
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
+
+
+def load_rules(user_rules_path: str = USER_RULES_PATH):
+    """Default rules, overridden or extended by crash_rules.json in the launcher data folder."""
+    rules = {rule["id"]: dict(rule) for rule in DEFAULT_RULES}
+    if user_rules_path and os.path.exists(user_rules_path):
+        try:
+            with open(user_rules_path, "r", encoding="utf-8") as f:
+                for rule in json.load(f):
+                    if rule.get("id") and rule.get("patterns") and rule.get("type"):
+                        rules[rule["id"]] = rule
+        except (IOError, json.JSONDecodeError, TypeError) as e:
+            logging.warning(f"Could not load custom crash rules: {e}")
+    return list(rules.values())
+
+
+class CrashClassifier:
+    """
+    Matches crash signatures as game output streams past, so the session
+    output never has to be kept in memory for classification. Most lines
+    match nothing, so a compiled alternation of all patterns screens each
+    line first and only hits go through the automaton.
+    """
+
+    def __init__(self, rules=None):
+        self.rules = rules if rules is not None else load_rules()
+        patterns = []
+        self._pattern_rule = []
+        for rule_index, rule in enumerate(self.rules):
+            for pattern in rule["patterns"]:
+                patterns.append(pattern)
+                self._pattern_rule.append(rule_index)
+        self._matcher = MultiPatternMatcher(patterns)
+        self._prefilter = re.compile("|".join(re.escape(p) for p in patterns)) if patterns else None
+        self._extractors = {
+            i: re.compile(rule["extract"]) for i, rule in enumerate(self.rules) if rule.get("extract")
+        }
+        self._lock = threading.Lock()
+        self.matches = {}
+        # rule index -> lines after its match still searched by its extractor
+        self._extracting = {}
+
+    def feed(self, line):
+        line = line[:MAX_LINE_LENGTH]
+        if self._extracting:
+            with self._lock:
+                for rule_index, lines_left in list(self._extracting.items()):
+                    if self._extract(rule_index, line) or lines_left <= 1:
+                        del self._extracting[rule_index]
+                    else:
+                        self._extracting[rule_index] = lines_left - 1
+        if self._prefilter is None or not self._prefilter.search(line):
+            return
+        pattern_ids = self._matcher.search(line)
+        with self._lock:
+            for rule_index in {self._pattern_rule[p] for p in pattern_ids}:
+                match = self.matches.get(rule_index)
+                if match is None:
+                    match = {"count": 0, "line": line, "extracted": None}
+                    self.matches[rule_index] = match
+                match["count"] += 1
+                if rule_index in self._extractors and not self._extract(rule_index, line):
+                    lines_left = self.rules[rule_index].get("extract_lines", 0)
+                    if lines_left:
+                        self._extracting[rule_index] = lines_left
+
+    def _extract(self, rule_index, line):
+        """Fills the rule's extracted value from line; True once it has one. Called with the lock held."""
+        match = self.matches[rule_index]
+        if match["extracted"] is None:
+            found = self._extractors[rule_index].search(line)
+            if found:
+                match["extracted"] = next((g for g in found.groups() if g), None)
+        return match["extracted"] is not None
+
+    def result(self):
+        """Returns error_details for the highest-priority matched rule, or None."""
+        with self._lock:
+            if not self.matches:
+                return None
+            rule_index = max(self.matches, key=lambda i: self.rules[i].get("priority", 0))
+            rule = self.rules[rule_index]
+            match = self.matches[rule_index]
+        details = {"type": rule["type"], "rule": rule["id"], "line": match["line"]}
+        if rule.get("message"):
+            details["message"] = rule["message"]
+        if rule.get("extract_field") and match["extracted"]:
+            details[rule["extract_field"]] = match["extracted"]
+        return details
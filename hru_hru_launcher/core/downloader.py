@@ -0,0 +1,556 @@
+# hru_hru_launcher/core/downloader.py
+import os
+import re
+import sys
+import glob
+import json
+import zipfile
+import hashlib
+import logging
+import shutil
+import platform
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .hash_db import get_hash_db
+from .process_priority import enter_background, sync_background_priority
+from hru_hru_launcher.utils import helpers
+
+mll_runtime = helpers.lazy_import("minecraft_launcher_lib.runtime")
+
+VERSION_MANIFEST_URL = "https://piston-meta.mojang.com/mc/game/version_manifest_v2.json"
+ASSETS_BASE_URL = "https://resources.download.minecraft.net"
+USER_AGENT = "HruHruLauncher/1.0 (Downloader)"
+
+MAX_WORKERS = 16
+CHUNK_SIZE = 64 * 1024
+
+
+class DownloadCancelled(Exception):
+    pass
+
+
+class HashMismatchError(Exception):
+    def __init__(self, path, expected, actual):
+        super().__init__(f"SHA1 mismatch for {os.path.basename(path)}: expected {expected}, got {actual}")
+        self.path = path
+        self.expected = expected
+        self.actual = actual
+
+
+class RateLimiter:
+    """
+    Token bucket shared by the threads of a download engine. Caps their
+    combined download rate, and with it the rate they write files; hashing
+    files already on disk is not limited. A rate of None means unlimited.
+    """
+
+    def __init__(self, bytes_per_second=None):
+        self._lock = threading.Lock()
+        self.bytes_per_second = bytes_per_second
+        self._allowance = 0.0
+        self._last = time.monotonic()
+
+    def set_rate(self, bytes_per_second):
+        with self._lock:
+            self.bytes_per_second = bytes_per_second
+            self._allowance = 0.0
+            self._last = time.monotonic()
+
+    def consume(self, amount: int):
+        """Blocks until amount bytes fit in the budget. Lifting the limit wakes waiters early."""
+        with self._lock:
+            rate = self.bytes_per_second
+            if not rate:
+                return
+            now = time.monotonic()
+            self._allowance = min(float(rate), self._allowance + (now - self._last) * rate)
+            self._last = now
+            self._allowance -= amount
+            wait = -self._allowance / rate if self._allowance < 0 else 0
+        deadline = time.monotonic() + wait
+        while wait > 0 and self.bytes_per_second:
+            time.sleep(min(wait, 0.2))
+            wait = deadline - time.monotonic()
+
+
+def create_session(pool_size: int = MAX_WORKERS):
+    """Creates a requests session whose connection pool matches the worker count."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=2)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"User-Agent": USER_AGENT})
+    return session
+
+
+def sha1_of_file(path: str):
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _os_name():
+    if sys.platform == "win32":
+        return "windows"
+    if sys.platform == "darwin":
+        return "osx"
+    return "linux"
+
+
+def _os_version():
+    """What Java reports as os.version, matched by the "version" part of library rules."""
+    if sys.platform == "win32":
+        version = sys.getwindowsversion()
+        return f"{version.major}.{version.minor}"
+    return platform.release()
+
+
+def _rules_allow(rules):
+    """Evaluates the OS part of a Mojang library rule list."""
+    if not rules:
+        return True
+    allowed = False
+    os_name = _os_name()
+    arch = "x86" if platform.architecture()[0] == "32bit" else "x64"
+    for rule in rules:
+        if "features" in rule:
+            continue
+        rule_os = rule.get("os", {})
+        matches = True
+        if "name" in rule_os and rule_os["name"] != os_name:
+            matches = False
+        if "arch" in rule_os and rule_os["arch"] != arch:
+            matches = False
+        if "version" in rule_os and not re.match(rule_os["version"], _os_version()):
+            matches = False
+        if matches:
+            allowed = rule.get("action") == "allow"
+    return allowed
+
+
+def _version_json_path(version_id: str, minecraft_dir: str):
+    return os.path.join(minecraft_dir, "versions", version_id, f"{version_id}.json")
+
+
+def _download_version_json(version_id: str, session):
+    """Returns the raw version JSON listed in the Mojang manifest, checked against the manifest's SHA1."""
+    response = session.get(VERSION_MANIFEST_URL, timeout=15)
+    response.raise_for_status()
+    for entry in response.json().get("versions", []):
+        if entry["id"] == version_id:
+            version_response = session.get(entry["url"], timeout=15)
+            version_response.raise_for_status()
+            content = version_response.content
+            actual = hashlib.sha1(content).hexdigest()
+            if entry.get("sha1") and actual != entry["sha1"]:
+                raise HashMismatchError(_version_json_path(version_id, ""), entry["sha1"], actual)
+            return content
+    raise ValueError(f"Version {version_id} not found in the Mojang manifest.")
+
+
+def load_version_json(version_id: str, minecraft_dir: str, session=None):
+    """Returns the version JSON, reading it from disk or from the Mojang manifest."""
+    local_path = _version_json_path(version_id, minecraft_dir)
+    if os.path.isfile(local_path):
+        with open(local_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return json.loads(_download_version_json(version_id, session or create_session(1)))
+
+
+def _maven_path(coordinate: str):
+    parts = coordinate.split(":")
+    if len(parts) < 3:
+        return None
+    group, artifact, version = parts[0], parts[1], parts[2]
+    classifier = f"-{parts[3]}" if len(parts) > 3 else ""
+    return f"{group.replace('.', '/')}/{artifact}/{version}/{artifact}-{version}{classifier}.jar"
+
+
+def _native_classifier(library: dict):
+    """The classifier of the library's natives jar for this OS, or None."""
+    native_key = library.get("natives", {}).get(_os_name())
+    if not native_key:
+        return None
+    return native_key.replace("${arch}", "32" if platform.architecture()[0] == "32bit" else "64")
+
+
+def _library_tasks(version_data: dict, minecraft_dir: str):
+    tasks = []
+    libraries_dir = os.path.join(minecraft_dir, "libraries")
+
+    for library in version_data.get("libraries", []):
+        if not _rules_allow(library.get("rules")):
+            continue
+        downloads = library.get("downloads", {})
+
+        if not downloads and library.get("name") and library.get("url"):
+            # Maven-style entries (Fabric) only carry a coordinate and a repository URL
+            maven_path = _maven_path(library["name"])
+            if maven_path:
+                tasks.append({
+                    "url": library["url"].rstrip("/") + "/" + maven_path,
+                    "path": os.path.join(libraries_dir, *maven_path.split("/")),
+                    "sha1": library.get("sha1"),
+                    "size": library.get("size", 0),
+                })
+            continue
+
+        artifact = downloads.get("artifact")
+        if artifact and artifact.get("url"):
+            tasks.append({
+                "url": artifact["url"],
+                "path": os.path.join(libraries_dir, artifact["path"]),
+                "sha1": artifact.get("sha1"),
+                "size": artifact.get("size", 0),
+            })
+
+        native_key = _native_classifier(library)
+        if native_key:
+            native = downloads.get("classifiers", {}).get(native_key)
+            if native and native.get("url"):
+                tasks.append({
+                    "url": native["url"],
+                    "path": os.path.join(libraries_dir, native["path"]),
+                    "sha1": native.get("sha1"),
+                    "size": native.get("size", 0),
+                })
+    return tasks
+
+
+def _asset_tasks(version_data: dict, minecraft_dir: str, session):
+    asset_index = version_data.get("assetIndex")
+    if not asset_index:
+        return []
+
+    index_path = os.path.join(minecraft_dir, "assets", "indexes", f"{asset_index['id']}.json")
+    if not os.path.isfile(index_path) or (asset_index.get("sha1") and sha1_of_file(index_path) != asset_index["sha1"]):
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+        response = session.get(asset_index["url"], timeout=15)
+        response.raise_for_status()
+        with open(index_path, "wb") as f:
+            f.write(response.content)
+
+    with open(index_path, "r", encoding="utf-8") as f:
+        index_data = json.load(f)
+
+    objects_dir = os.path.join(minecraft_dir, "assets", "objects")
+    tasks = []
+    seen = set()
+    for obj in index_data.get("objects", {}).values():
+        file_hash = obj["hash"]
+        if file_hash in seen:
+            continue
+        seen.add(file_hash)
+        tasks.append({
+            "url": f"{ASSETS_BASE_URL}/{file_hash[:2]}/{file_hash}",
+            "path": os.path.join(objects_dir, file_hash[:2], file_hash),
+            "sha1": file_hash,
+            "size": obj.get("size", 0),
+        })
+    return tasks
+
+
+def _log_config_task(version_data: dict, minecraft_dir: str):
+    log_file = version_data.get("logging", {}).get("client", {}).get("file")
+    if not log_file or not log_file.get("url"):
+        return []
+    return [{
+        "url": log_file["url"],
+        "path": os.path.join(minecraft_dir, "assets", "log_configs", log_file["id"]),
+        "sha1": log_file.get("sha1"),
+        "size": log_file.get("size", 0),
+    }]
+
+
+def collect_version_downloads(version_id: str, minecraft_dir: str, session=None, version_data=None):
+    """
+    Builds the list of files (client jar, libraries, natives, asset objects,
+    log config) a version needs, following its inheritsFrom chain. version_data
+    is the version's own JSON if the caller already has it.
+    """
+    session = session or create_session(1)
+    tasks = []
+    current_id = version_id
+    while current_id:
+        if version_data is None:
+            version_data = load_version_json(current_id, minecraft_dir, session)
+
+        client = version_data.get("downloads", {}).get("client")
+        if client and client.get("url"):
+            tasks.append({
+                "url": client["url"],
+                "path": os.path.join(minecraft_dir, "versions", current_id, f"{current_id}.jar"),
+                "sha1": client.get("sha1"),
+                "size": client.get("size", 0),
+            })
+        tasks.extend(_library_tasks(version_data, minecraft_dir))
+        tasks.extend(_asset_tasks(version_data, minecraft_dir, session))
+        tasks.extend(_log_config_task(version_data, minecraft_dir))
+        current_id = version_data.get("inheritsFrom")
+        version_data = None
+
+    unique_tasks = {}
+    for task in tasks:
+        unique_tasks.setdefault(os.path.normcase(task["path"]), task)
+    return list(unique_tasks.values())
+
+
+class DownloadEngine:
+    """
+    Downloads a list of files through a bounded thread pool sharing one
+    pooled session. Each file is hashed while it streams and only moved
+    into place once its SHA1 matches. With an InstallJournal, finished files
+    are recorded so a cancelled install can resume later.
+    """
+
+    def __init__(self, callback=None, is_running=None, max_workers: int = MAX_WORKERS, hash_db=None, journal=None, rate_limiter=None, always_background=False):
+        self.callback = callback or {}
+        self.always_background = always_background
+        self.hash_db = hash_db
+        self.journal = journal
+        self.rate_limiter = rate_limiter
+        self.is_running = is_running or (lambda: True)
+        self.max_workers = max_workers
+        self.session = create_session(max_workers)
+        self._lock = threading.Lock()
+        self.downloaded_bytes = 0
+
+    def _set_status(self, text):
+        if "setStatus" in self.callback:
+            self.callback["setStatus"](text)
+
+    def _set_progress(self, value, max_value):
+        if "setProgress" in self.callback:
+            self.callback["setProgress"](value, max_value)
+
+    def _is_up_to_date(self, task):
+        path = task["path"]
+        if not os.path.isfile(path):
+            return False
+        if task.get("size") and os.path.getsize(path) != task["size"]:
+            return False
+        if task.get("sha1"):
+            if self.hash_db is not None:
+                return self.hash_db.get_sha1(path) == task["sha1"]
+            return sha1_of_file(path) == task["sha1"]
+        return True
+
+    def _is_journaled(self, task):
+        if self.journal is None or not self.journal.is_completed(task["path"]):
+            return False
+        if not os.path.isfile(task["path"]):
+            return False
+        return not task.get("size") or os.path.getsize(task["path"]) == task["size"]
+
+    def _fetch(self, task):
+        if not self.is_running():
+            raise DownloadCancelled()
+        sync_background_priority()
+        if self._is_journaled(task) or self._is_up_to_date(task):
+            if self.journal is not None:
+                self.journal.mark_completed(task["path"])
+            return 0
+
+        path = task["path"]
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".part"
+        resuming = os.path.isfile(tmp_path)
+        try:
+            written = self._stream_to_part(task, tmp_path)
+        except HashMismatchError:
+            # A stale .part from an earlier run may not match the file on the
+            # server any more; retry once from scratch before giving up.
+            if not resuming:
+                raise
+            written = self._stream_to_part(task, tmp_path)
+
+        try:
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        if self.hash_db is not None and task.get("sha1"):
+            self.hash_db.record(path, task["sha1"])
+        if self.journal is not None:
+            self.journal.mark_completed(path)
+
+        with self._lock:
+            self.downloaded_bytes += written
+        return written
+
+    def _stream_to_part(self, task, tmp_path):
+        """
+        Streams a task into its .part file, resuming with an HTTP Range request
+        if an earlier run left part of it behind. On cancel or network errors
+        the .part file is kept for the next attempt; a hash mismatch deletes it.
+        """
+        hasher = hashlib.sha1()
+        offset = os.path.getsize(tmp_path) if os.path.isfile(tmp_path) else 0
+        if task.get("size") and offset >= task["size"]:
+            offset = 0
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        written = 0
+        with self.session.get(task["url"], stream=True, timeout=30, headers=headers) as response:
+            response.raise_for_status()
+            if offset and response.status_code == 206:
+                with open(tmp_path, "rb") as f:
+                    for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                        hasher.update(chunk)
+                mode = "ab"
+            else:
+                offset = 0
+                mode = "wb"
+            with open(tmp_path, mode) as f:
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    if not self.is_running():
+                        raise DownloadCancelled()
+                    sync_background_priority()
+                    if self.rate_limiter is not None:
+                        self.rate_limiter.consume(len(chunk))
+                    f.write(chunk)
+                    hasher.update(chunk)
+                    written += len(chunk)
+
+        actual = hasher.hexdigest()
+        if task.get("sha1") and actual != task["sha1"]:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise HashMismatchError(task["path"], task["sha1"], actual)
+        return written
+
+    def download_all(self, tasks, status_text="Downloading files"):
+        """
+        Downloads every task, reporting progress through the callback dict.
+        Returns the number of files that were actually fetched.
+        """
+        total = len(tasks)
+        if total == 0:
+            return 0
+
+        self._set_status(status_text)
+        self._set_progress(0, total)
+        fetched = 0
+        done = 0
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, initializer=enter_background, initargs=(self.always_background,))
+        futures = [executor.submit(self._fetch, task) for task in tasks]
+        try:
+            for future in as_completed(futures):
+                if future.result() > 0:
+                    fetched += 1
+                done += 1
+                self._set_progress(done, total)
+        except BaseException:
+            # Report the failure now instead of after every queued download
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown(wait=True)
+        return fetched
+
+    def close(self):
+        self.session.close()
+
+
+def _extract_natives(version_id: str, version_data: dict, minecraft_dir: str):
+    """Unpacks the natives jars of older versions into versions/<id>/natives, where the launch command looks for them."""
+    natives_dir = os.path.join(minecraft_dir, "versions", version_id, "natives")
+    for library in version_data.get("libraries", []):
+        native_key = _native_classifier(library)
+        if not native_key or not _rules_allow(library.get("rules")):
+            continue
+        native = library.get("downloads", {}).get("classifiers", {}).get(native_key)
+        if not native or not native.get("path"):
+            continue
+        exclude = library.get("extract", {}).get("exclude", [])
+        with zipfile.ZipFile(os.path.join(minecraft_dir, "libraries", native["path"])) as archive:
+            for name in archive.namelist():
+                if not any(name.startswith(prefix) for prefix in exclude):
+                    archive.extract(name, natives_dir)
+
+
+def _copy_legacy_assets(version_data: dict, minecraft_dir: str):
+    """
+    Copies the asset objects of old versions to where they read them by name:
+    assets/virtual/<index> for "virtual" indexes (1.6 to 1.7.2) and the game
+    folder's resources for "map_to_resources" ones (before 1.6).
+    """
+    asset_index = version_data.get("assetIndex")
+    if not asset_index:
+        return
+    with open(os.path.join(minecraft_dir, "assets", "indexes", f"{asset_index['id']}.json"), "r", encoding="utf-8") as f:
+        index_data = json.load(f)
+    targets = []
+    if index_data.get("virtual"):
+        targets.append(os.path.join(minecraft_dir, "assets", "virtual", asset_index["id"]))
+    if index_data.get("map_to_resources"):
+        targets.append(os.path.join(minecraft_dir, "resources"))
+    objects_dir = os.path.join(minecraft_dir, "assets", "objects")
+    for target_dir in targets:
+        for name, obj in index_data.get("objects", {}).items():
+            source = os.path.join(objects_dir, obj["hash"][:2], obj["hash"])
+            target = os.path.join(target_dir, *name.split("/"))
+            if os.path.isfile(target) and os.path.getsize(target) == obj.get("size"):
+                continue
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            shutil.copyfile(source, target)
+
+
+def _install_java_runtime(version_data: dict, minecraft_dir: str, callback):
+    """
+    Installs the Mojang Java runtime the version asks for unless it is already
+    there. minecraft_launcher_lib writes the .version file after the last runtime file.
+    """
+    component = version_data.get("javaVersion", {}).get("component")
+    if not component or glob.glob(os.path.join(minecraft_dir, "runtime", component, "*", ".version")):
+        return
+    if "setStatus" in callback:
+        callback["setStatus"](f"Installing Java runtime {component}")
+    mll_runtime.install_jvm_runtime(component, minecraft_dir, callback=callback)
+
+
+def install_version(version_id: str, minecraft_dir: str, callback=None, is_running=None, max_workers: int = MAX_WORKERS, journal=None, rate_limiter=None, always_background=False):
+    """
+    Installs a vanilla version. Every file is fetched and hash-checked once by
+    the parallel engine, so minecraft_launcher_lib's serial install is not run.
+    The version JSON is written last, after the Java runtime: a version folder
+    with its JSON is a finished install. Returns the number of files that
+    were downloaded.
+    """
+    callback = callback or {}
+    hash_db = get_hash_db()
+    engine = DownloadEngine(callback, is_running, max_workers, hash_db, journal, rate_limiter, always_background)
+    try:
+        engine._set_status(f"Resolving files for {version_id}")
+        json_path = _version_json_path(version_id, minecraft_dir)
+        if os.path.isfile(json_path):
+            with open(json_path, "rb") as f:
+                raw_json = f.read()
+        else:
+            raw_json = _download_version_json(version_id, engine.session)
+        version_data = json.loads(raw_json)
+        tasks = collect_version_downloads(version_id, minecraft_dir, engine.session, version_data)
+        if journal is not None:
+            journal.plan(tasks)
+        fetched = engine.download_all(tasks, f"Downloading files for {version_id}")
+        logging.info(f"Install of {version_id}: {fetched}/{len(tasks)} files downloaded, {engine.downloaded_bytes} bytes.")
+    finally:
+        engine.close()
+        hash_db.save()
+        if journal is not None:
+            journal.save()
+
+    _extract_natives(version_id, version_data, minecraft_dir)
+    _copy_legacy_assets(version_data, minecraft_dir)
+    _install_java_runtime(version_data, minecraft_dir, callback)
+    os.makedirs(os.path.dirname(json_path), exist_ok=True)
+    with open(json_path + ".tmp", "wb") as f:
+        f.write(raw_json)
+    os.replace(json_path + ".tmp", json_path)
+    return fetched
@@ -0,0 +1,133 @@
+# hru_hru_launcher/core/game_output.py
+import os
+import codecs
+import logging
+import threading
+from collections import deque
+from datetime import datetime
+
+from hru_hru_launcher.utils.paths import get_launcher_data_dir
+
+READ_CHUNK_SIZE = 64 * 1024
+RING_BUFFER_LINES = 200
+MAX_PENDING_LINES = 5000
+MAX_LINES_PER_BATCH = 500
+FLUSH_INTERVAL_MS = 100
+KEEP_LOG_FILES = 10
+
+# Lines the client prints once the main menu is about to appear
+READY_MARKERS = ("Sound engine started", "Starting up SoundSystem")
+
+
+def get_game_logs_dir():
+    logs_dir = os.path.join(get_launcher_data_dir(), "game_logs")
+    os.makedirs(logs_dir, exist_ok=True)
+    return logs_dir
+
+
+def new_game_log_path(version_id: str):
+    """Returns a fresh log file path and removes the oldest logs beyond KEEP_LOG_FILES."""
+    logs_dir = get_game_logs_dir()
+    try:
+        existing = sorted(
+            (os.path.join(logs_dir, name) for name in os.listdir(logs_dir) if name.endswith(".log")),
+            key=os.path.getmtime,
+        )
+        for old_path in existing[:max(0, len(existing) - KEEP_LOG_FILES + 1)]:
+            os.remove(old_path)
+    except OSError as e:
+        logging.warning(f"Could not rotate game logs: {e}")
+    safe_id = "".join(c if c.isalnum() or c in ".-_" else "_" for c in version_id) or "game"
+    return os.path.join(logs_dir, f"{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}_{safe_id}.log")
+
+
+class GameOutputReader(threading.Thread):
+    """
+    Drains a game process pipe in large chunks on its own thread so the game
+    never blocks on the launcher. Every line is written to the log file and
+    passed to line_callback; the last RING_BUFFER_LINES are kept for the error
+    report, and lines for the UI wait in a bounded queue that the worker
+    drains in batches.
+    """
+
+    def __init__(self, stream, log_path=None, line_callback=None):
+        super().__init__(daemon=True)
+        self.stream = stream
+        self.log_path = log_path
+        self.line_callback = line_callback
+        self.tail = deque(maxlen=RING_BUFFER_LINES)
+        self.total_lines = 0
+        self.dropped_lines = 0
+        self._pending = deque()
+        self._lock = threading.Lock()
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._partial = ""
+
+    def _read_chunk(self):
+        read1 = getattr(self.stream, "read1", None)
+        if read1:
+            return read1(READ_CHUNK_SIZE)
+        return os.read(self.stream.fileno(), READ_CHUNK_SIZE)
+
+    def _handle_lines(self, lines, log_file):
+        if log_file:
+            log_file.write("\n".join(lines) + "\n")
+        with self._lock:
+            self.tail.extend(lines)
+            self.total_lines += len(lines)
+            self._pending.extend(lines)
+            overflow = len(self._pending) - MAX_PENDING_LINES
+            for _ in range(max(0, overflow)):
+                self._pending.popleft()
+            if overflow > 0:
+                self.dropped_lines += overflow
+        if self.line_callback:
+            try:
+                for line in lines:
+                    self.line_callback(line)
+            except Exception as e:
+                logging.error(f"Game output callback failed, disabling it: {e}")
+                self.line_callback = None
+
+    def run(self):
+        log_file = None
+        try:
+            if self.log_path:
+                log_file = open(self.log_path, "w", encoding="utf-8", errors="replace")
+            while True:
+                chunk = self._read_chunk()
+                if not chunk:
+                    break
+                text = self._partial + self._decoder.decode(chunk)
+                parts = text.split("\n")
+                self._partial = parts.pop()
+                if parts:
+                    self._handle_lines([p.rstrip("\r") for p in parts], log_file)
+            text = self._partial + self._decoder.decode(b"", final=True)
+            if text:
+                self._handle_lines([text.rstrip("\r")], log_file)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Game output reader stopped: {e}")
+        finally:
+            if log_file:
+                log_file.close()
+
+    def drain(self, max_lines: int = MAX_LINES_PER_BATCH):
+        """
+        Returns (lines, skipped): up to max_lines pending lines for the UI and the
+        number of lines dropped since the last call because the UI fell behind.
+        """
+        with self._lock:
+            count = min(max_lines, len(self._pending))
+            lines = [self._pending.popleft() for _ in range(count)]
+            skipped = self.dropped_lines
+            self.dropped_lines = 0
+        return lines, skipped
+
+    def has_pending(self):
+        with self._lock:
+            return bool(self._pending)
+
+    def get_tail_text(self):
+        with self._lock:
+            return "\n".join(self.tail)
@@ -0,0 +1,110 @@
+# hru_hru_launcher/core/hash_db.py
+import os
+import json
+import hashlib
+import logging
+import threading
+
+from hru_hru_launcher.utils.paths import get_launcher_data_dir
+
+HASH_DB_PATH = os.path.join(get_launcher_data_dir(), "verified_hashes.json")
+HASH_DB_FORMAT_VERSION = 1
+CHUNK_SIZE = 1024 * 1024
+
+_shared_db = None
+_shared_lock = threading.Lock()
+
+
+class HashDatabase:
+    """
+    Remembers (path, size, mtime) -> sha1 for files that were already hashed,
+    so re-checking an untouched file costs one stat instead of reading it.
+    """
+
+    def __init__(self, db_path: str = HASH_DB_PATH):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.db_path):
+            return
+        try:
+            with open(self.db_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("format") == HASH_DB_FORMAT_VERSION:
+                self._entries = data.get("entries", {})
+        except (IOError, json.JSONDecodeError, AttributeError) as e:
+            logging.warning(f"Could not read hash database, starting empty: {e}")
+            self._entries = {}
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = dict(self._entries)
+            self._dirty = False
+        try:
+            tmp_path = self.db_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"format": HASH_DB_FORMAT_VERSION, "entries": entries}, f)
+            os.replace(tmp_path, self.db_path)
+        except IOError as e:
+            logging.warning(f"Could not save hash database: {e}")
+
+    @staticmethod
+    def _key(path):
+        return os.path.normcase(os.path.abspath(path))
+
+    def lookup(self, path: str):
+        """Returns the remembered sha1 if the file is unchanged since it was hashed, else None."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        with self._lock:
+            entry = self._entries.get(self._key(path))
+        if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            return entry[2]
+        return None
+
+    def record(self, path: str, sha1: str):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return
+        with self._lock:
+            self._entries[self._key(path)] = [st.st_size, st.st_mtime_ns, sha1]
+            self._dirty = True
+
+    def forget(self, path: str):
+        with self._lock:
+            if self._entries.pop(self._key(path), None) is not None:
+                self._dirty = True
+
+    def get_sha1(self, path: str):
+        """Returns the file's sha1, hashing it only if it changed since the last check."""
+        cached = self.lookup(path)
+        if cached:
+            return cached
+        h = hashlib.sha1()
+        try:
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                    h.update(chunk)
+        except OSError:
+            return None
+        sha1 = h.hexdigest()
+        self.record(path, sha1)
+        return sha1
+
+
+def get_hash_db():
+    """Returns the process-wide hash database."""
+    global _shared_db
+    with _shared_lock:
+        if _shared_db is None:
+            _shared_db = HashDatabase()
+        return _shared_db
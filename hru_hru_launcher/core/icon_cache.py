@@ -0,0 +1,79 @@
+# hru_hru_launcher/core/icon_cache.py
+import os
+import hashlib
+import logging
+import threading
+
+from hru_hru_launcher.utils.paths import get_launcher_data_dir
+from hru_hru_launcher.utils import helpers
+
+ICON_CACHE_MAX_BYTES = 32 * 1024 * 1024
+# Trimming stops at this share of the cap so it does not run on every new icon
+TRIM_TARGET_RATIO = 0.75
+
+
+class IconDiskCache:
+    """
+    Size-capped folder of mod icon thumbnails, one file per URL. Reads touch
+    the file's mtime, so trimming removes the least recently used icons first.
+    """
+
+    def __init__(self, directory=None, max_bytes=ICON_CACHE_MAX_BYTES):
+        self.directory = directory or os.path.join(get_launcher_data_dir(), "icons")
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes = None
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, url):
+        return os.path.join(self.directory, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".png")
+
+    def get(self, url):
+        path = self._path(url)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)
+            return data
+        except OSError:
+            return None
+
+    def put(self, url, data):
+        path = self._path(url)
+        try:
+            with open(path + ".tmp", "wb") as f:
+                f.write(data)
+            os.replace(path + ".tmp", path)
+        except OSError as e:
+            logging.warning(f"Could not cache icon {url}: {e}")
+            return
+        with self._lock:
+            if self._total_bytes is not None:
+                self._total_bytes += len(data)
+            if self._total_bytes is None or self._total_bytes > self.max_bytes:
+                self._trim()
+
+    def _trim(self):
+        entries = []
+        try:
+            for entry in os.scandir(self.directory):
+                if entry.is_file() and entry.name.endswith(".png"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError as e:
+            logging.warning(f"Could not scan icon cache: {e}")
+            return
+        total = sum(size for _, size, _ in entries)
+        if total > self.max_bytes:
+            target = int(self.max_bytes * TRIM_TARGET_RATIO)
+            for _, size, path in sorted(entries):
+                if total <= target:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                except OSError:
+                    pass
+            logging.info(f"Trimmed icon cache to {helpers.format_size(total)}.")
+        self._total_bytes = total
+
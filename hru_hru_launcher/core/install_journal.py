@@ -0,0 +1,140 @@
+# hru_hru_launcher/core/install_journal.py
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+
+from hru_hru_launcher.utils.paths import get_launcher_data_dir
+from hru_hru_launcher.core.version_catalog import base_mc_version
+
+JOURNAL_FORMAT_VERSION = 1
+SAVE_INTERVAL_SECONDS = 2.0
+
+
+def get_journals_dir():
+    journals_dir = os.path.join(get_launcher_data_dir(), "install_journals")
+    os.makedirs(journals_dir, exist_ok=True)
+    return journals_dir
+
+
+def _journal_path(minecraft_dir, mc_version, mod_loader):
+    key = json.dumps([minecraft_dir, mc_version, mod_loader or "vanilla"])
+    return os.path.join(get_journals_dir(), hashlib.sha1(key.encode("utf-8")).hexdigest() + ".json")
+
+
+class InstallJournal:
+    """
+    On-disk record of an install in progress: the files it planned and the
+    ones already completed. Partial downloads resume from their .part files.
+    As long as a journal exists the install is unfinished and the next launch
+    resumes it.
+    """
+
+    def __init__(self, minecraft_dir: str, mc_version: str, mod_loader=None):
+        self.minecraft_dir = minecraft_dir
+        self.mc_version = mc_version
+        self.mod_loader = mod_loader
+        self.path = _journal_path(minecraft_dir, mc_version, mod_loader)
+        self._lock = threading.Lock()
+        self._last_save = 0.0
+        self.steps = []
+        self.planned = {}
+        self.completed = set()
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("format") != JOURNAL_FORMAT_VERSION:
+                return
+            self.steps = data.get("steps", [])
+            self.planned = data.get("planned", {})
+            self.completed = set(data.get("completed", []))
+        except (IOError, json.JSONDecodeError, AttributeError) as e:
+            logging.warning(f"Could not read install journal {self.path}: {e}")
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def save(self, force: bool = True):
+        with self._lock:
+            now = time.monotonic()
+            if not force and now - self._last_save < SAVE_INTERVAL_SECONDS:
+                return
+            self._last_save = now
+            data = {
+                "format": JOURNAL_FORMAT_VERSION,
+                "minecraft_dir": self.minecraft_dir,
+                "mc_version": self.mc_version,
+                "mod_loader": self.mod_loader,
+                "steps": list(self.steps),
+                "planned": dict(self.planned),
+                "completed": sorted(self.completed),
+            }
+            # Written under the lock: download threads share the .tmp path
+            try:
+                tmp_path = self.path + ".tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self.path)
+            except IOError as e:
+                logging.warning(f"Could not save install journal: {e}")
+
+    def begin_step(self, step: str):
+        """Records that an install step (base version, loader) has started."""
+        with self._lock:
+            if step not in self.steps:
+                self.steps.append(step)
+        self.save()
+
+    def plan(self, tasks):
+        with self._lock:
+            for task in tasks:
+                self.planned[task["path"]] = task.get("sha1")
+        self.save()
+
+    def is_completed(self, path: str):
+        with self._lock:
+            return path in self.completed
+
+    def mark_completed(self, path: str):
+        with self._lock:
+            self.completed.add(path)
+        self.save(force=False)
+
+    def progress_text(self):
+        with self._lock:
+            return f"{len(self.completed)}/{len(self.planned)} files"
+
+    def finish(self):
+        """Deletes the journal once every step of the install has succeeded."""
+        with self._lock:
+            try:
+                if os.path.exists(self.path):
+                    os.remove(self.path)
+            except OSError as e:
+                logging.warning(f"Could not remove install journal: {e}")
+
+
+def base_journal(minecraft_dir: str, mc_version: str, mod_loader=None):
+    """
+    Journal of the base version's files. It is keyed on the base version only,
+    so an unfinished base install is seen by vanilla and every loader built on it.
+    """
+    return InstallJournal(minecraft_dir, base_mc_version(mc_version, mod_loader))
+
+
+def loader_journal(minecraft_dir: str, mc_version: str, mod_loader=None):
+    """Journal of the mod loader step, or None for vanilla."""
+    return InstallJournal(minecraft_dir, mc_version, mod_loader) if mod_loader else None
+
+
+def has_pending_install(minecraft_dir: str, mc_version: str, mod_loader=None):
+    """True while the base version or the loader of this launch has an unfinished install."""
+    loader = loader_journal(minecraft_dir, mc_version, mod_loader)
+    return base_journal(minecraft_dir, mc_version, mod_loader).exists() or (loader is not None and loader.exists())
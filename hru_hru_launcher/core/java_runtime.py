@@ -0,0 +1,241 @@
+# hru_hru_launcher/core/java_runtime.py
+import os
+import re
+import sys
+import glob
+import json
+import shutil
+import logging
+import threading
+import subprocess
+
+from hru_hru_launcher.utils.paths import get_launcher_data_dir
+
+RUNTIME_CACHE_PATH = os.path.join(get_launcher_data_dir(), "java_runtimes.json")
+RUNTIME_CACHE_FORMAT_VERSION = 1
+PROBE_TIMEOUT_SECONDS = 10
+DEFAULT_JAVA_MAJOR = 8
+
+JAVA_EXECUTABLE = "javaw.exe" if sys.platform == "win32" else "java"
+
+_PROPERTY_RE = re.compile(r"^\s*(java\.version|java\.vendor|os\.arch|java\.home)\s*=\s*(.*?)\s*$", re.MULTILINE)
+_VERSION_LINE_RE = re.compile(r'version "([^"]+)"')
+
+_lock = threading.Lock()
+
+
+def _system_java_homes():
+    """Yields the usual places JVMs are installed on this platform."""
+    patterns = []
+    if sys.platform == "win32":
+        for root in (os.environ.get("ProgramFiles"), os.environ.get("ProgramFiles(x86)")):
+            if root:
+                for vendor in ("Java", "Eclipse Adoptium", "Eclipse Foundation", "Zulu", "Microsoft", "Amazon Corretto", "BellSoft"):
+                    patterns.append(os.path.join(root, vendor, "*"))
+    elif sys.platform == "darwin":
+        patterns += ["/Library/Java/JavaVirtualMachines/*/Contents/Home", os.path.expanduser("~/Library/Java/JavaVirtualMachines/*/Contents/Home")]
+    else:
+        patterns += ["/usr/lib/jvm/*", "/usr/lib64/jvm/*", "/usr/java/*", "/opt/java/*", "/opt/jdk*", "/opt/*jdk*", "/opt/*jre*"]
+    patterns += [os.path.expanduser("~/.sdkman/candidates/java/*"), os.path.expanduser("~/.jdks/*")]
+
+    java_home = os.environ.get("JAVA_HOME")
+    if java_home:
+        yield java_home
+    for pattern in patterns:
+        yield from glob.glob(pattern)
+
+
+def _mojang_runtime_homes(minecraft_dir):
+    """Runtimes minecraft_launcher_lib installs under <minecraft_dir>/runtime/<component>/<platform>/<component>."""
+    if not minecraft_dir:
+        return []
+    return glob.glob(os.path.join(minecraft_dir, "runtime", "*", "*", "*"))
+
+
+def _candidate_executables(minecraft_dir=None):
+    seen = set()
+    candidates = []
+
+    def add(path, source):
+        if not path or not os.path.isfile(path):
+            return
+        real = os.path.normcase(os.path.realpath(path))
+        if real not in seen:
+            seen.add(real)
+            candidates.append((path, source))
+
+    for home in _mojang_runtime_homes(minecraft_dir):
+        add(os.path.join(home, "bin", JAVA_EXECUTABLE), "mojang")
+    for home in _system_java_homes():
+        add(os.path.join(home, "bin", JAVA_EXECUTABLE), "system")
+    add(shutil.which("java"), "path")
+    return candidates
+
+
+def parse_major_version(version: str):
+    """'1.8.0_392' -> 8, '17.0.9' -> 17, '21' -> 21. Returns None if unparsable."""
+    match = re.match(r"(\d+)(?:\.(\d+))?", version or "")
+    if not match:
+        return None
+    major = int(match.group(1))
+    if major == 1 and match.group(2):
+        major = int(match.group(2))
+    return major
+
+
+def probe_java(executable: str):
+    """Runs the JVM once and returns {version, major, vendor, arch}, or None if it does not start."""
+    java_cmd = executable
+    if sys.platform == "win32" and os.path.basename(executable).lower() == "javaw.exe":
+        console_java = os.path.join(os.path.dirname(executable), "java.exe")
+        if os.path.isfile(console_java):
+            java_cmd = console_java
+    try:
+        result = subprocess.run(
+            [java_cmd, "-XshowSettings:properties", "-version"],
+            capture_output=True, text=True, errors="replace", timeout=PROBE_TIMEOUT_SECONDS,
+            creationflags=(subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0),
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        logging.warning(f"Could not probe Java at {executable}: {e}")
+        return None
+
+    output = result.stderr + result.stdout
+    props = dict(_PROPERTY_RE.findall(output))
+    version = props.get("java.version")
+    if not version:
+        match = _VERSION_LINE_RE.search(output)
+        version = match.group(1) if match else None
+    major = parse_major_version(version)
+    if major is None:
+        return None
+    return {
+        "version": version,
+        "major": major,
+        "vendor": props.get("java.vendor", "unknown"),
+        "arch": props.get("os.arch", "unknown"),
+    }
+
+
+def _read_cache():
+    if not os.path.exists(RUNTIME_CACHE_PATH):
+        return {}
+    try:
+        with open(RUNTIME_CACHE_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("format") != RUNTIME_CACHE_FORMAT_VERSION:
+            return {}
+        return data.get("runtimes", {})
+    except (IOError, json.JSONDecodeError, AttributeError) as e:
+        logging.warning(f"Could not read Java runtime cache: {e}")
+        return {}
+
+
+def _write_cache(runtimes):
+    try:
+        tmp_path = RUNTIME_CACHE_PATH + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"format": RUNTIME_CACHE_FORMAT_VERSION, "runtimes": runtimes}, f, indent=2)
+        os.replace(tmp_path, RUNTIME_CACHE_PATH)
+    except IOError as e:
+        logging.warning(f"Could not save Java runtime cache: {e}")
+
+
+def find_runtimes(minecraft_dir=None, force: bool = False):
+    """
+    Returns every Java runtime found on this machine as a list of dicts with
+    path, source, version, major, vendor and arch. Probe results are cached
+    by the binary's (mtime, size), so a JVM is only run again after it changes.
+    """
+    with _lock:
+        cache = {} if force else _read_cache()
+        runtimes = []
+        fresh_cache = {}
+        for path, source in _candidate_executables(minecraft_dir):
+            try:
+                st = os.stat(os.path.realpath(path))
+            except OSError:
+                continue
+            key = [st.st_mtime_ns, st.st_size]
+            entry = cache.get(path)
+            if entry and entry.get("key") == key:
+                info = entry.get("info")
+            else:
+                info = probe_java(path)
+            fresh_cache[path] = {"key": key, "info": info}
+            if info:
+                runtimes.append(dict(info, path=path, source=source))
+        if fresh_cache != cache:
+            _write_cache(fresh_cache)
+    return runtimes
+
+
+def get_runtime_info(executable: str):
+    """
+    Returns {version, major, vendor, arch, path} for one Java executable, using
+    the probe cache, or None if it cannot be run. Bare names are looked up on PATH.
+    """
+    path = executable if os.path.isabs(executable) else shutil.which(executable)
+    if not path or not os.path.isfile(path):
+        return None
+    try:
+        st = os.stat(os.path.realpath(path))
+    except OSError:
+        return None
+    key = [st.st_mtime_ns, st.st_size]
+    with _lock:
+        cache = _read_cache()
+        entry = cache.get(path)
+        if entry and entry.get("key") == key:
+            info = entry.get("info")
+        else:
+            info = probe_java(path)
+            cache[path] = {"key": key, "info": info}
+            _write_cache(cache)
+    return dict(info, path=path) if info else None
+
+
+def get_required_major(version_id: str, minecraft_dir: str):
+    """Reads javaVersion.majorVersion from the version JSON, following inheritsFrom."""
+    current_id = version_id
+    seen = set()
+    while current_id and current_id not in seen:
+        seen.add(current_id)
+        path = os.path.join(minecraft_dir, "versions", current_id, f"{current_id}.json")
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (IOError, json.JSONDecodeError):
+            break
+        major = data.get("javaVersion", {}).get("majorVersion")
+        if major:
+            return int(major)
+        current_id = data.get("inheritsFrom")
+    return DEFAULT_JAVA_MAJOR
+
+
+def _is_64bit(arch: str):
+    return arch in ("amd64", "x86_64", "aarch64", "arm64") or arch.endswith("64")
+
+
+def select_runtime(required_major: int, runtimes):
+    """
+    Picks the best runtime for a Minecraft version: the exact major version if
+    available, otherwise the closest newer one. 64-bit and Mojang-provided
+    runtimes win ties. Returns None if nothing is new enough.
+    """
+    suitable = [r for r in runtimes if r["major"] >= required_major]
+    if not suitable:
+        return None
+    source_rank = {"mojang": 0, "system": 1, "path": 2}
+    return min(suitable, key=lambda r: (
+        r["major"] - required_major,
+        not _is_64bit(r["arch"]),
+        source_rank.get(r["source"], 3),
+    ))
+
+
+def resolve_java_for_version(version_id: str, minecraft_dir: str):
+    """Returns (runtime or None, required major) for the given installed version."""
+    required_major = get_required_major(version_id, minecraft_dir)
+    return select_runtime(required_major, find_runtimes(minecraft_dir)), required_major
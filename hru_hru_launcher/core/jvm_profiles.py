@@ -0,0 +1,167 @@
+# hru_hru_launcher/core/jvm_profiles.py
+import os
+import re
+
+import psutil
+
+PROFILES_VERSION = 2
+
+PROFILE_AUTO = "auto"
+PROFILE_G1_CLIENT = "g1_client"
+PROFILE_LARGE_HEAP = "large_heap"
+PROFILE_LOW_MEMORY = "low_memory"
+PROFILE_NONE = "none"
+
+PROFILE_IDS = [PROFILE_AUTO, PROFILE_G1_CLIENT, PROFILE_LARGE_HEAP, PROFILE_LOW_MEMORY, PROFILE_NONE]
+
+LARGE_HEAP_THRESHOLD_GB = 12
+LOW_MEMORY_THRESHOLD_GB = 2
+OS_RESERVE_GB = 1
+
+_GC_SELECTORS = ("UseG1GC", "UseZGC", "UseShenandoahGC", "UseParallelGC", "UseSerialGC", "UseConcMarkSweepGC", "UseEpsilonGC")
+_XX_FLAG_RE = re.compile(r"^-XX:[+-]?([A-Za-z0-9_]+)")
+
+
+def get_hardware():
+    """Returns (logical cpu count, total RAM in GB)."""
+    cpu_count = psutil.cpu_count(logical=True) or os.cpu_count() or 2
+    total_ram_gb = psutil.virtual_memory().total / (1024 ** 3)
+    return cpu_count, total_ram_gb
+
+
+def max_heap_gb(total_ram_gb: float):
+    """Largest heap given to the game: physical RAM minus what the OS keeps, at least 1 GB."""
+    return max(1, int(total_ram_gb - OS_RESERVE_GB))
+
+
+def effective_max_heap(args):
+    """The -Xmx flag the JVM will use from args (the last one wins), or None if there is none."""
+    return next((arg for arg in reversed(args) if arg.startswith("-Xmx")), None)
+
+
+def config_key(version_type: str, version_id: str):
+    """Key under which a launch configuration's profile is stored in settings["jvm_profiles"]."""
+    return f"{version_type or 'vanilla'}:{version_id}"
+
+
+def resolve_profile(profile_id: str, heap_gb: int, java_major: int):
+    """Turns 'auto' into a concrete profile for the given heap and Java version."""
+    if profile_id not in PROFILE_IDS:
+        profile_id = PROFILE_AUTO
+    if profile_id != PROFILE_AUTO:
+        return profile_id
+    if heap_gb <= LOW_MEMORY_THRESHOLD_GB:
+        return PROFILE_LOW_MEMORY
+    if heap_gb >= LARGE_HEAP_THRESHOLD_GB and java_major >= 15:
+        return PROFILE_LARGE_HEAP
+    return PROFILE_G1_CLIENT
+
+
+def _g1_client_flags(heap_gb, cpu_count):
+    region_size = "16M" if heap_gb >= LARGE_HEAP_THRESHOLD_GB else "8M"
+    return [
+        "-XX:+UseG1GC",
+        "-XX:+ParallelRefProcEnabled",
+        "-XX:MaxGCPauseMillis=50",
+        "-XX:+UnlockExperimentalVMOptions",
+        "-XX:+DisableExplicitGC",
+        "-XX:G1NewSizePercent=30",
+        "-XX:G1MaxNewSizePercent=40",
+        f"-XX:G1HeapRegionSize={region_size}",
+        "-XX:G1ReservePercent=20",
+        "-XX:G1HeapWastePercent=5",
+        "-XX:G1MixedGCCountTarget=4",
+        "-XX:InitiatingHeapOccupancyPercent=15",
+        "-XX:G1MixedGCLiveThresholdPercent=90",
+        "-XX:SurvivorRatio=32",
+        "-XX:MaxTenuringThreshold=1",
+        "-XX:+PerfDisableSharedMem",
+        f"-XX:ParallelGCThreads={max(2, cpu_count)}",
+        f"-XX:ConcGCThreads={max(1, cpu_count // 4)}",
+    ]
+
+
+def _large_heap_flags(heap_gb, cpu_count, java_major, java_vendor):
+    if java_major >= 15:
+        flags = ["-XX:+UseZGC"]
+        if java_major in (21, 22):
+            flags.append("-XX:+ZGenerational")
+        return flags + [f"-XX:ConcGCThreads={max(1, cpu_count // 4)}", "-XX:+DisableExplicitGC", "-XX:+PerfDisableSharedMem"]
+    if java_major >= 12 and "oracle" not in (java_vendor or "").lower():
+        # Shenandoah ships in OpenJDK builds from 12 on, but not in Oracle's JDK, and is experimental before 15
+        return ["-XX:+UnlockExperimentalVMOptions", "-XX:+UseShenandoahGC", f"-XX:ConcGCThreads={max(1, cpu_count // 4)}", "-XX:+DisableExplicitGC", "-XX:+PerfDisableSharedMem"]
+    return _g1_client_flags(heap_gb, cpu_count)
+
+
+def _low_memory_flags(cpu_count):
+    if cpu_count <= 2:
+        return ["-XX:+UseSerialGC", "-XX:+DisableExplicitGC"]
+    return [
+        "-XX:+UseG1GC",
+        "-XX:MaxGCPauseMillis=100",
+        "-XX:+UseStringDeduplication",
+        "-XX:+DisableExplicitGC",
+        f"-XX:ParallelGCThreads={max(2, cpu_count // 2)}",
+        "-XX:ConcGCThreads=1",
+    ]
+
+
+def _heap_flags(profile_id, heap_gb):
+    if profile_id == PROFILE_LOW_MEMORY:
+        # Let the heap grow on demand instead of committing it all at start
+        return [f"-Xmx{heap_gb}G", "-Xms512M"]
+    return [f"-Xmx{heap_gb}G", f"-Xms{heap_gb}G"]
+
+
+def _flag_key(arg: str):
+    """Identity of a JVM flag for merging: later flags with the same key replace earlier ones."""
+    match = _XX_FLAG_RE.match(arg)
+    if match:
+        return "XX:" + match.group(1)
+    for prefix in ("-Xmx", "-Xms", "-Xss", "-Xmn"):
+        if arg.startswith(prefix):
+            return prefix
+    if arg.startswith("-D"):
+        return arg.split("=", 1)[0]
+    return arg
+
+
+def merge_args(profile_args, custom_args):
+    """
+    Merges the user's custom arguments over a profile. A custom flag replaces
+    the profile's flag with the same name, and choosing a garbage collector
+    drops every -XX flag of the profile so GC-specific tuning cannot conflict.
+    """
+    custom_keys = {_flag_key(arg) for arg in custom_args}
+    custom_picks_gc = any(arg.startswith("-XX:+") and _flag_key(arg)[3:] in _GC_SELECTORS for arg in custom_args)
+    merged = []
+    for arg in profile_args:
+        key = _flag_key(arg)
+        if key in custom_keys:
+            continue
+        if custom_picks_gc and key.startswith("XX:"):
+            continue
+        merged.append(arg)
+    return merged + list(custom_args)
+
+
+def build_jvm_args(profile_id: str, heap_gb: int, java_major: int, custom_args=None, java_vendor: str = "", hardware=None):
+    """
+    Computes the JVM arguments for a launch: heap flags and GC tuning from the
+    profile, sized from the CPU count, RAM, Java version and heap, with the
+    user's custom arguments merged on top. Returns (resolved profile id, args).
+    """
+    cpu_count, total_ram_gb = hardware or get_hardware()
+    heap_gb = max(1, min(int(heap_gb), max_heap_gb(total_ram_gb)))
+    profile_id = resolve_profile(profile_id, heap_gb, java_major)
+
+    if profile_id == PROFILE_G1_CLIENT:
+        gc_flags = _g1_client_flags(heap_gb, cpu_count)
+    elif profile_id == PROFILE_LARGE_HEAP:
+        gc_flags = _large_heap_flags(heap_gb, cpu_count, java_major, java_vendor)
+    elif profile_id == PROFILE_LOW_MEMORY:
+        gc_flags = _low_memory_flags(cpu_count)
+    else:
+        gc_flags = []
+
+    return profile_id, merge_args(_heap_flags(profile_id, heap_gb) + gc_flags, custom_args or [])
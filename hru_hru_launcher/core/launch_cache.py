@@ -0,0 +1,134 @@
+# hru_hru_launcher/core/launch_cache.py
+import os
+import json
+import hashlib
+import logging
+import threading
+
+from hru_hru_launcher.utils.paths import get_launcher_data_dir
+
+CACHE_FILE_PATH = os.path.join(get_launcher_data_dir(), "launch_cache.json")
+CACHE_FORMAT_VERSION = 1
+MAX_PLANS = 32
+
+_lock = threading.Lock()
+
+
+def make_key(minecraft_dir: str, mc_version: str, mod_loader, launch_options: dict):
+    """Hashes everything the user picked for this launch into one cache key."""
+    payload = json.dumps({
+        "minecraft_dir": minecraft_dir,
+        "mc_version": mc_version,
+        "mod_loader": mod_loader,
+        "options": launch_options,
+    }, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _version_json_path(minecraft_dir, version_id):
+    return os.path.join(minecraft_dir, "versions", version_id, f"{version_id}.json")
+
+
+def fingerprint_version_chain(minecraft_dir: str, version_id: str):
+    """
+    Returns {version_id: sha1 of its JSON} for the version and its whole
+    inheritsFrom chain, or None if any JSON is missing or unreadable.
+    """
+    chain = {}
+    current_id = version_id
+    while current_id and current_id not in chain:
+        try:
+            with open(_version_json_path(minecraft_dir, current_id), "rb") as f:
+                raw = f.read()
+            chain[current_id] = hashlib.sha1(raw).hexdigest()
+            current_id = json.loads(raw).get("inheritsFrom")
+        except (IOError, ValueError):
+            return None
+    return chain
+
+
+def classpath_from_command(command):
+    for i, arg in enumerate(command[:-1]):
+        if arg in ("-cp", "-classpath"):
+            return [p for p in command[i + 1].split(os.pathsep) if p]
+    return []
+
+
+def _read_cache():
+    if not os.path.exists(CACHE_FILE_PATH):
+        return {}
+    try:
+        with open(CACHE_FILE_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("format") != CACHE_FORMAT_VERSION:
+            return {}
+        return data.get("plans", {})
+    except (IOError, json.JSONDecodeError, AttributeError) as e:
+        logging.warning(f"Could not read launch cache: {e}")
+        return {}
+
+
+def _write_cache(plans):
+    try:
+        tmp_path = CACHE_FILE_PATH + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"format": CACHE_FORMAT_VERSION, "plans": plans}, f)
+        os.replace(tmp_path, CACHE_FILE_PATH)
+    except IOError as e:
+        logging.warning(f"Could not save launch cache: {e}")
+
+
+def load_plan(minecraft_dir: str, key: str):
+    """
+    Returns the cached plan for key if it is still valid: every version JSON
+    in the chain hashes the same, and the Java binary and every classpath
+    entry still exist.
+    """
+    with _lock:
+        plan = _read_cache().get(key)
+    if not plan:
+        return None
+
+    if fingerprint_version_chain(minecraft_dir, plan["version_id"]) != plan.get("chain"):
+        logging.info(f"Launch plan for {plan['version_id']} is stale: version JSON changed.")
+        invalidate(key)
+        return None
+
+    java_path = plan["command"][0] if plan["command"] else ""
+    if os.path.isabs(java_path) and not os.path.isfile(java_path):
+        logging.info(f"Launch plan for {plan['version_id']} is stale: missing Java at {java_path}.")
+        invalidate(key)
+        return None
+
+    for path in classpath_from_command(plan["command"]):
+        if not os.path.isfile(path):
+            logging.info(f"Launch plan for {plan['version_id']} is stale: missing {path}.")
+            invalidate(key)
+            return None
+    return plan
+
+
+def save_plan(minecraft_dir: str, key: str, version_id: str, command: list):
+    chain = fingerprint_version_chain(minecraft_dir, version_id)
+    if chain is None:
+        return
+    with _lock:
+        plans = _read_cache()
+        plans.pop(key, None)
+        plans[key] = {"version_id": version_id, "command": list(command), "chain": chain}
+        while len(plans) > MAX_PLANS:
+            plans.pop(next(iter(plans)))
+        _write_cache(plans)
+
+
+def invalidate(key: str = None):
+    """Drops one plan, or every plan when key is None."""
+    with _lock:
+        plans = _read_cache()
+        if key is None:
+            plans = {}
+        elif key in plans:
+            del plans[key]
+        else:
+            return
+        _write_cache(plans)
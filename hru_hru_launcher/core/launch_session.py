@@ -0,0 +1,509 @@
+# hru_hru_launcher/core/launch_session.py
+import os
+import sys
+import uuid
+import subprocess
+import traceback
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+import minecraft_launcher_lib
+from requests.exceptions import RequestException
+
+from .profile_manager import create_launcher_profiles_if_needed, add_profile
+from . import downloader
+from .version_index import get_version_index
+from . import launch_cache
+from . import game_output
+from .crash_classifier import CrashClassifier
+from . import install_journal
+from .version_catalog import base_mc_version as get_base_mc_version
+from . import java_runtime
+from . import jvm_profiles
+from . import cds_archive
+from .launch_timing import LaunchTimer, save_launch
+from .prefetch import get_prefetch_manager
+from .launch_supervisor import install_lock
+from .resource_monitor import ResourceSampler, DEFAULT_INTERVAL_MS
+from . import process_priority
+from ..config import resources
+
+# Seconds a stopped game gets to exit before it is killed, and its output reader to drain
+TERMINATE_TIMEOUT_S = 5
+READER_JOIN_TIMEOUT_S = 5
+
+
+class GameProcessError(Exception):
+    def __init__(self, message, exit_code, output=""):
+        super().__init__(message)
+        self.exit_code = exit_code
+        self.output = output
+
+class InterruptedError(Exception):
+    pass
+
+
+def _ignore(*args):
+    pass
+
+
+class LaunchSession:
+    """
+    Installs and launches one game version without any UI toolkit. Progress,
+    log lines, game output and the spawned process id are reported through
+    plain callbacks; MinecraftWorker wraps it in a QThread for the window and
+    the command-line interface drives it directly.
+    """
+
+    def __init__(
+        self,
+        mc_version,
+        username,
+        minecraft_dir,
+        client_token,
+        memory_gb=2,
+        fullscreen=False,
+        options=None,
+        lang="ru",
+        mod_loader=None,
+        on_progress=None,
+        on_log=None,
+        on_output=None,
+        on_process_started=None,
+    ):
+        self.on_progress = on_progress or _ignore
+        self.on_log = on_log or _ignore
+        self.on_output = on_output or _ignore
+        self.on_process_started = on_process_started or _ignore
+        self.mc_version = mc_version
+        self.username = username
+        self.minecraft_dir = minecraft_dir
+        self.client_token = client_token
+        self.memory_gb = memory_gb
+        self.fullscreen = fullscreen
+        self.options = options if options else {}
+        self.lang = lang
+        self.mod_loader = mod_loader
+        self._is_running = True
+        self._is_installing = False
+        self._current_version_id = ""
+        self._ready_time = None
+        self._cds_rejected = False
+        self.resource_sampler = None
+        self._game_counted = False
+        self.timer = LaunchTimer()
+        self.version_index = get_version_index(minecraft_dir)
+
+    def stop(self):
+        self.on_log("Cancellation requested...")
+        self._is_running = False
+
+    def is_running(self):
+        return self._is_running
+        
+    def _get_stoppable_callback(self):
+        lang_dict = resources.LANGUAGES[self.lang]
+        
+        def set_status(text):
+            if not self._is_running: raise InterruptedError()
+            self.log_and_update_status(text)
+            
+        def set_progress(value, max_value=0):
+            if not self._is_running: raise InterruptedError()
+            if max_value > 0:
+                status_text = lang_dict.get('downloading_files', 'Downloading files')
+                self.on_progress(value, max_value, status_text)
+        
+        return { "setStatus": set_status, "setProgress": set_progress }
+
+    def _detect_forge_id(self, versions, base_mc_version):
+        build = self.mc_version.split("-")[-1]
+        for v in versions:
+            vid = v["id"] if isinstance(v, dict) else v
+            if "forge" in vid and base_mc_version in vid and build in vid:
+                return vid
+        return None
+        
+    def _build_launch_options(self):
+        custom_jvm_args = self.options.get("jvmArguments", [])
+        all_jvm_args = [f"-Xmx{self.memory_gb}G", f"-Xms{self.memory_gb}G"] + custom_jvm_args
+        
+        launch_options = {
+            "username": self.username, "uuid": str(uuid.uuid3(uuid.NAMESPACE_DNS, self.username)), "token": "0",
+            "jvmArguments": all_jvm_args, "fullscreen": self.fullscreen, "gameDirectory": self.minecraft_dir,
+            "executablePath": self.options.get("executablePath"),
+            "resolutionWidth": self.options.get("resolutionWidth"), "resolutionHeight": self.options.get("resolutionHeight"),
+            "launchTarget": "minecraft"
+        }
+        return {k: v for k, v in launch_options.items() if v}
+
+    def _select_java(self, version_id, launch_options):
+        """
+        Picks a Java runtime matching the version's javaVersion unless the user set one.
+        Returns the runtime info dict, or None if the Java in use could not be probed.
+        """
+        user_path = launch_options.get("executablePath")
+        if user_path:
+            required_major = java_runtime.get_required_major(version_id, self.minecraft_dir)
+            info = java_runtime.get_runtime_info(user_path)
+            if info and info["major"] < required_major:
+                self.on_log(f"WARNING: {version_id} needs Java {required_major}, but the selected Java is {info['version']}.")
+            return info
+
+        runtime, required_major = java_runtime.resolve_java_for_version(version_id, self.minecraft_dir)
+        if runtime:
+            launch_options["executablePath"] = runtime["path"]
+            self.on_log(f"Using Java {runtime['version']} ({runtime['vendor']}, {runtime['arch']}) from {runtime['path']}")
+        else:
+            self.on_log(f"No installed Java {required_major}+ found, using the default runtime.")
+        return runtime
+
+    def _apply_jvm_profile(self, version_id, launch_options, java_info):
+        """Replaces the plain heap flags with the selected tuning profile merged with the custom arguments."""
+        java_major = java_info["major"] if java_info else java_runtime.get_required_major(version_id, self.minecraft_dir)
+        java_vendor = java_info["vendor"] if java_info else ""
+        custom_args = self.options.get("jvmArguments", [])
+        hardware = jvm_profiles.get_hardware()
+        profile_id, jvm_args = jvm_profiles.build_jvm_args(
+            self.options.get("jvmProfile", jvm_profiles.PROFILE_AUTO), self.memory_gb, java_major,
+            custom_args, java_vendor, hardware,
+        )
+        launch_options["jvmArguments"] = jvm_args
+        max_heap = jvm_profiles.effective_max_heap(jvm_args)
+        self.on_log(f"JVM profile: {profile_id} (Java {java_major}, {max_heap or 'default heap'})")
+        heap_limit = jvm_profiles.max_heap_gb(hardware[1])
+        if self.memory_gb > heap_limit and not jvm_profiles.effective_max_heap(custom_args):
+            self.on_log(f"WARNING: {self.memory_gb} GB of RAM was allocated, but this computer has "
+                        f"{hardware[1]:.1f} GB; the heap was limited to {heap_limit} GB.")
+
+    def _attach_to_prefetch(self):
+        """Waits for a background install of this version instead of starting a second one."""
+        job = get_prefetch_manager().find(self.minecraft_dir, self.mc_version, self.mod_loader)
+        if not job:
+            return
+        self.log_and_update_status(f"Continuing the background install of {self.mc_version} at full speed...")
+        job.set_foreground()
+        with self.timer.phase("prefetch_wait"):
+            while job.is_alive():
+                if not self._is_running:
+                    job.cancel()
+                    raise InterruptedError()
+                value, max_value, text = job.progress
+                if max_value > 0:
+                    self.on_progress(value, max_value, text or resources.LANGUAGES[self.lang].get("downloading_files", "Downloading files"))
+                time.sleep(0.1)
+        if job.state == "failed":
+            self.on_log(f"Background install failed ({job.error}), installing normally.")
+        self.version_index.invalidate()
+
+    @contextmanager
+    def _install_guard(self):
+        """Holds the install lock of the base version so concurrent launches never install it twice."""
+        base_mc_version = get_base_mc_version(self.mc_version, self.mod_loader)
+        lock = install_lock(self.minecraft_dir, base_mc_version)
+        if not lock.acquire(blocking=False):
+            self.log_and_update_status(f"Waiting for another launch to finish installing {base_mc_version}...")
+            with self.timer.phase("install_wait"):
+                while not lock.acquire(timeout=0.2):
+                    if not self._is_running: raise InterruptedError()
+            self.version_index.invalidate()
+        try:
+            yield
+        finally:
+            lock.release()
+
+    def install(self, callback=None):
+        """Installs the version and its mod loader, waiting for other installs of it. Returns the version id to launch."""
+        # A background install holds the install lock until it ends, so join it at full speed first
+        self._attach_to_prefetch()
+        with self._install_guard():
+            return self._install_version(callback or self._get_stoppable_callback())
+
+    def _install_version(self, callback):
+        """Installs the base version and mod loader if needed. Returns the version id to launch."""
+        with self.timer.phase("profiles"):
+            create_launcher_profiles_if_needed(self.minecraft_dir, self.client_token)
+        
+        base_mc_version = get_base_mc_version(self.mc_version, self.mod_loader)
+
+        if not self._is_running: raise InterruptedError()
+
+        with self.timer.phase("version_scan"):
+            installed_version_ids = self.version_index.get_installed_ids()
+        
+        # While the base journal exists the base install is re-run, whichever
+        # loader started it; finished files are skipped and partial downloads
+        # resumed. The loader installers keep no record of their files and run
+        # again from the start.
+        base_journal = install_journal.base_journal(self.minecraft_dir, self.mc_version, self.mod_loader)
+        loader_journal = install_journal.loader_journal(self.minecraft_dir, self.mc_version, self.mod_loader)
+        resuming_base = base_journal.exists()
+        resuming_loader = loader_journal is not None and loader_journal.exists()
+        self._is_installing = True
+        if resuming_base:
+            self.log_and_update_status(f"Resuming interrupted install of {base_mc_version} ({base_journal.progress_text()} done).")
+        
+        if resuming_base or base_mc_version not in installed_version_ids:
+            if not resuming_base:
+                self.log_and_update_status(f"Base version {base_mc_version} not found. Installing...")
+            base_journal.begin_step("base")
+            with self.timer.phase("base_install"):
+                downloader.install_version(base_mc_version, self.minecraft_dir, callback=callback, is_running=lambda: self._is_running, journal=base_journal)
+            self.version_index.invalidate()
+            base_journal.finish()
+        else:
+            self.log_and_update_status(f"Base version {base_mc_version} already installed.")
+
+        version_id_to_launch = base_mc_version
+        self._current_version_id = version_id_to_launch
+        profile_name = base_mc_version
+
+        if self.mod_loader in ["fabric", "forge"]:
+            mods_path = os.path.join(self.minecraft_dir, "mods")
+            os.makedirs(mods_path, exist_ok=True)
+            
+            if not self._is_running: raise InterruptedError()
+
+            if resuming_loader:
+                self.log_and_update_status(f"Repeating the interrupted {self.mod_loader} install of {self.mc_version}.")
+            loader_journal.begin_step(self.mod_loader)
+            with self.timer.phase("loader_install"):
+                if self.mod_loader == "fabric":
+                    version_id_to_launch = minecraft_launcher_lib.fabric.install_fabric(base_mc_version, self.minecraft_dir, callback=callback)
+                    profile_name = f"{base_mc_version} Fabric"
+            
+                elif self.mod_loader == "forge":
+                    version_id_to_launch = None if resuming_loader else self._detect_forge_id(self.version_index.get_installed_ids(), base_mc_version)
+                    if not version_id_to_launch:
+                        self.log_and_update_status(f"Installing Forge {self.mc_version}")
+                        minecraft_launcher_lib.forge.install_forge_version(self.mc_version, self.minecraft_dir, callback=callback)
+                        self.version_index.invalidate()
+                        version_id_to_launch = self._detect_forge_id(self.version_index.get_installed_ids(), base_mc_version)
+                        if not version_id_to_launch:
+                            raise Exception(f"Could not find Forge version for {self.mc_version} after installation.")
+                        self.log_and_update_status(f"New Forge version installed: {version_id_to_launch}")
+                    else:
+                        self.log_and_update_status(f"Found existing Forge version: {version_id_to_launch}")
+                    profile_name = f"{base_mc_version} Forge"
+        
+            loader_journal.finish()
+        self._is_installing = False
+        with self.timer.phase("add_profile"):
+            add_profile(self.minecraft_dir, version_id_to_launch, profile_name)
+        return version_id_to_launch
+
+    def _prepare_cds(self, command):
+        """Adds the class-data archive flags to the command. Returns (command, key, mode)."""
+        java_info = java_runtime.get_runtime_info(command[0])
+        if not cds_archive.is_supported(java_info):
+            self.on_log(f"Class-data archive needs Java {cds_archive.MIN_JAVA_MAJOR}+, skipping it for this launch.")
+            return command, None, None
+        key = cds_archive.archive_key(command, java_info, self.minecraft_dir)
+        command, mode = cds_archive.prepare_command(command, key)
+        if mode == "use":
+            self.on_log(f"Using class-data archive {cds_archive.archive_path(key)}")
+        elif mode == "dump":
+            self.on_log("A class-data archive will be created when the game exits.")
+        return command, key, mode
+
+    def _on_game_line(self, line):
+        self.crash_classifier.feed(line)
+        self.timer.mark("first_output")
+        if self._ready_time is None and any(marker in line for marker in game_output.READY_MARKERS):
+            self._ready_time = time.monotonic()
+            self.timer.mark("ready", self._ready_time)
+        if not self._cds_rejected and cds_archive.is_archive_rejected(line):
+            self._cds_rejected = True
+
+    def _record_cds_run(self, key, version_id, mode, success, spawn_time):
+        startup_ms = (self._ready_time - spawn_time) * 1000 if self._ready_time else None
+        if mode == "use" and self._cds_rejected:
+            self.on_log("The JVM could not use the class-data archive; it will be recreated.")
+            cds_archive.drop_archive(key)
+            return
+        entry = cds_archive.record_run(key, version_id, mode, success, startup_ms)
+        if mode == "dump":
+            if entry.get("size_bytes"):
+                self.on_log(f"Class-data archive created ({entry['size_bytes'] // (1024 * 1024)} MB).")
+            else:
+                self.on_log("The JVM did not create a class-data archive.")
+        saving = cds_archive.describe_saving(entry)
+        if saving and mode == "use":
+            self.on_log(f"Class-data archive: {saving}")
+
+    def run(self):
+        """Installs if needed, launches the game and waits for it to exit. Returns (result, details)."""
+        version_id_to_launch = ""
+        game_output_text = ""
+        plan_key = None
+        cds_key = cds_mode = None
+        spawn_time = None
+        self.crash_classifier = CrashClassifier()
+        self.timer = LaunchTimer()
+        self.timer.info.update(mc_version=self.mc_version, mod_loader=self.mod_loader or "vanilla",
+                               jvm_profile=self.options.get("jvmProfile", jvm_profiles.PROFILE_AUTO), memory_gb=self.memory_gb)
+        try:
+            callback = self._get_stoppable_callback()
+            launch_options = self._build_launch_options()
+
+            # launch_options carries the JVM arguments (heap flags and custom ones); the profile
+            # flags are only resolved once a Java runtime is picked, so their inputs are keyed instead
+            plan_key = launch_cache.make_key(self.minecraft_dir, self.mc_version, self.mod_loader, dict(
+                launch_options,
+                jvmProfile=self.options.get("jvmProfile", jvm_profiles.PROFILE_AUTO),
+                jvmProfilesVersion=jvm_profiles.PROFILES_VERSION,
+                hardware=jvm_profiles.get_hardware(),
+            ))
+            plan = None
+            with self.timer.phase("plan_lookup"):
+                if not install_journal.has_pending_install(self.minecraft_dir, self.mc_version, self.mod_loader):
+                    plan = launch_cache.load_plan(self.minecraft_dir, plan_key)
+            self.timer.info["cached_plan"] = bool(plan)
+
+            if plan:
+                version_id_to_launch = plan["version_id"]
+                command = plan["command"]
+                self.log_and_update_status(f"Using cached launch plan for {version_id_to_launch}.")
+            else:
+                version_id_to_launch = self.install(callback)
+
+                if not self._is_running: raise InterruptedError()
+                
+                self.log_and_update_status(resources.LANGUAGES[self.lang]["starting"])
+                with self.timer.phase("command_build"):
+                    java_info = self._select_java(version_id_to_launch, launch_options)
+                    self._apply_jvm_profile(version_id_to_launch, launch_options, java_info)
+                    command = minecraft_launcher_lib.command.get_minecraft_command(version_id_to_launch, self.minecraft_dir, launch_options)
+                    launch_cache.save_plan(self.minecraft_dir, plan_key, version_id_to_launch, command)
+
+            if not self._is_running: raise InterruptedError()
+
+            self.timer.info["version_id"] = version_id_to_launch
+            if self.options.get("useCds"):
+                command, cds_key, cds_mode = self._prepare_cds(command)
+                self.timer.info["cds"] = cds_mode
+
+            spawn_time = time.monotonic()
+            with self.timer.phase("spawn"):
+                process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=0, creationflags=(subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0), cwd=self.minecraft_dir)
+            process_priority.game_started()
+            self._game_counted = True
+            for message in process_priority.apply_to_process(process.pid, self.options.get("processPriority")):
+                self.on_log(message)
+            self._start_resource_sampler(process.pid)
+            self.on_process_started(process.pid)
+
+            log_path = game_output.new_game_log_path(version_id_to_launch)
+            self.on_log(f"Game output is saved to {log_path}")
+            reader = game_output.GameOutputReader(process.stdout, log_path, line_callback=self._on_game_line)
+            reader.start()
+
+            while self._is_running:
+                self._flush_game_output(reader)
+                if process.poll() is not None and not reader.is_alive():
+                    break
+                time.sleep(game_output.FLUSH_INTERVAL_MS / 1000)
+
+            if not self._is_running:
+                self.on_log("Terminating game process...")
+                process.terminate()
+                try:
+                    process.wait(timeout=TERMINATE_TIMEOUT_S)
+                except subprocess.TimeoutExpired:
+                    self.on_log("Game did not exit, killing it...")
+                    process.kill()
+                    process.wait()
+
+            self.timer.mark("exit")
+            reader.join(timeout=READER_JOIN_TIMEOUT_S)
+            while reader.has_pending():
+                self._flush_game_output(reader)
+            game_output_text = reader.get_tail_text()
+
+            if not self._is_running:
+                raise InterruptedError()
+
+            exit_code = process.returncode
+            if exit_code != 0:
+                raise GameProcessError(f"Game process exited with code {exit_code}", exit_code, game_output_text)
+
+            if cds_key:
+                self._record_cds_run(cds_key, version_id_to_launch, cds_mode, True, spawn_time)
+            return self._finish("success", None)
+
+        except (InterruptedError, downloader.DownloadCancelled):
+            self.on_log("Launch was successfully cancelled.")
+            if self._is_installing:
+                self.on_log("Install progress was saved and will resume on the next launch.")
+            return self._finish("cancelled", None)
+        except RequestException as e:
+            error_msg = resources.LANGUAGES[self.lang].get("error_network_desc", "Could not connect to Mojang servers.")
+            self.on_log(f"ERROR: {error_msg} Details: {e}")
+            return self._finish("error", {"type": "network_error", "message": error_msg})
+        except Exception as e:
+            if plan_key and not isinstance(e, GameProcessError):
+                # The game exiting with an error says nothing about the plan; a failure to prepare or spawn it does
+                launch_cache.invalidate(plan_key)
+            if cds_key and isinstance(e, GameProcessError):
+                self._record_cds_run(cds_key, version_id_to_launch, cds_mode, False, spawn_time)
+            error_details = {"message": str(e), "version_id": version_id_to_launch or self._current_version_id}
+            
+            crash_details = self.crash_classifier.result() if isinstance(e, GameProcessError) else None
+            if crash_details:
+                self.on_log(f"Crash signature '{crash_details['rule']}' matched: {crash_details['line']}")
+                error_details.update(crash_details)
+            elif isinstance(e, GameProcessError):
+                if e.exit_code == 1:
+                    error_details["type"] = "invalid_jvm_argument"
+                else:
+                    error_details["type"] = "file_corruption"
+            elif isinstance(e, FileNotFoundError):
+                error_details["type"] = "invalid_java_path"
+            else:
+                error_details["type"] = "generic"
+
+            self.on_log(f"ERROR: An error occurred: {e}")
+            self.on_log(traceback.format_exc())
+            return self._finish("error", error_details)
+
+    def _start_resource_sampler(self, pid):
+        interval_ms = self.options.get("resourceSampleInterval", DEFAULT_INTERVAL_MS)
+        if interval_ms:
+            self.resource_sampler = ResourceSampler(pid, interval_ms)
+            self.resource_sampler.start()
+
+    def _finish(self, result, details):
+        """Saves this launch's phase timings and resource summary to the history. Returns (result, details)."""
+        if "version_id" not in self.timer.info:
+            self.timer.info["version_id"] = self._current_version_id or self.mc_version
+        if self._game_counted:
+            process_priority.game_stopped()
+            self._game_counted = False
+        if self.resource_sampler:
+            self.resource_sampler.stop()
+            self.resource_sampler.join(timeout=2)
+            resources_summary = self.resource_sampler.summary()
+            if resources_summary:
+                self.timer.info["resources"] = resources_summary
+                self.on_log(
+                    f"Resource usage: CPU avg {resources_summary['cpu_avg']}% (max {resources_summary['cpu_max']}%), "
+                    f"RAM peak {resources_summary['rss_peak_mb']} MB, {resources_summary['threads_peak']} threads peak, "
+                    f"RAM growth {resources_summary['rss_growth_mb_per_min']} MB/min"
+                )
+        summary = self.timer.summary()
+        if summary:
+            self.on_log(f"Launch timing: {summary}")
+        save_launch(self.timer.to_record(result))
+        return result, details
+
+    def _flush_game_output(self, reader):
+        lines, skipped = reader.drain()
+        if skipped:
+            self.on_log(f"[{skipped} lines of game output skipped in the console, see the log file]")
+        if lines:
+            self.on_output(lines)
+
+    def log_and_update_status(self, text):
+        self.on_progress(0, 0, text) 
+        self.on_log(f"[{datetime.now().strftime('%H:%M:%S')}] {text}")
\ No newline at end of file
@@ -0,0 +1,121 @@
+# hru_hru_launcher/core/launch_supervisor.py
+import time
+import threading
+from itertools import count
+
+# How long stopping a launch can take: LaunchSession gives the game
+# TERMINATE_TIMEOUT_S to exit, then READER_JOIN_TIMEOUT_S for its output
+# reader, and the resource sampler 2 s to finish
+STOP_WAIT_MS = 12000
+
+_install_locks = {}
+_install_locks_guard = threading.Lock()
+
+
+def install_lock(minecraft_dir: str, base_mc_version: str):
+    """
+    Returns the lock guarding installs of one base version in one game folder.
+    Vanilla, Forge and Fabric builds of a base version share its jar, libraries
+    and assets, so launches of any of them install one after another.
+    """
+    key = (minecraft_dir, base_mc_version)
+    with _install_locks_guard:
+        lock = _install_locks.get(key)
+        if lock is None:
+            lock = _install_locks[key] = threading.Lock()
+        return lock
+
+
+class GameInstance:
+    """One launch managed by the supervisor: its worker, game process and resource usage."""
+
+    def __init__(self, instance_id, worker, mc_version, username):
+        self.id = instance_id
+        self.worker = worker
+        self.mc_version = mc_version
+        self.username = username
+        self.state = "starting"
+        self.result = None
+        self.started_at = time.monotonic()
+        self.pid = None
+        self.peak_rss = 0
+
+    def attach_process(self, pid: int):
+        self.pid = pid
+        self.state = "running"
+
+    def is_active(self):
+        return self.state in ("starting", "running")
+
+    @property
+    def sampler(self):
+        return getattr(self.worker, "resource_sampler", None)
+
+    def usage(self):
+        """Returns the latest {"cpu_percent", "rss", "peak_rss", "threads", "uptime"} from the worker's sampler, or None."""
+        sampler = self.sampler
+        latest = sampler.latest() if sampler else None
+        if not latest:
+            return None
+        self.peak_rss = sampler.peak_rss
+        return {
+            "cpu_percent": latest["cpu_percent"],
+            "rss": latest["rss"],
+            "peak_rss": sampler.peak_rss,
+            "threads": int(latest["threads"]),
+            "uptime": time.monotonic() - self.started_at,
+        }
+
+
+class LaunchSupervisor:
+    """
+    Keeps track of the game instances started by the launcher. Each instance
+    has its own worker thread; the supervisor hands out ids, enforces the
+    instance limit and stops them together when the launcher closes.
+    """
+
+    def __init__(self, max_instances: int = 4):
+        self.max_instances = max_instances
+        self.instances = {}
+        self._ids = count(1)
+
+    def can_launch(self):
+        return len(self.active()) < self.max_instances
+
+    def add(self, worker, mc_version, username):
+        instance = GameInstance(next(self._ids), worker, mc_version, username)
+        self.instances[instance.id] = instance
+        return instance
+
+    def get(self, instance_id):
+        return self.instances.get(instance_id)
+
+    def active(self):
+        return [instance for instance in self.instances.values() if instance.is_active()]
+
+    def has_active(self):
+        return any(instance.is_active() for instance in self.instances.values())
+
+    def finish(self, instance_id, result):
+        instance = self.instances.get(instance_id)
+        if instance:
+            instance.state = "finished"
+            instance.result = result
+        return instance
+
+    def remove(self, instance_id):
+        return self.instances.pop(instance_id, None)
+
+    def stop(self, instance_id):
+        instance = self.instances.get(instance_id)
+        if instance and instance.is_active() and instance.worker.isRunning():
+            instance.worker.stop()
+
+    def stop_all(self, wait_ms: int = 0):
+        active = self.active()
+        for instance in active:
+            if instance.worker.isRunning():
+                instance.worker.stop()
+        if wait_ms:
+            for instance in active:
+                instance.worker.wait(wait_ms)
@@ -0,0 +1,99 @@
+# hru_hru_launcher/core/launch_timing.py
+import os
+import json
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+from hru_hru_launcher.utils.paths import get_launcher_data_dir
+
+HISTORY_FILE_PATH = os.path.join(get_launcher_data_dir(), "launch_history.json")
+HISTORY_FORMAT_VERSION = 1
+MAX_HISTORY_ENTRIES = 200
+
+_lock = threading.Lock()
+
+
+class LaunchTimer:
+    """
+    Times the phases of one launch with a monotonic clock. Phases are measured
+    durations; events (first output line, main menu ready) are offsets from
+    the start of the launch.
+    """
+
+    def __init__(self):
+        self.started_at = datetime.now()
+        self._start = time.monotonic()
+        self.phases = []
+        self.events = {}
+        self.info = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.phases.append({"name": name, "ms": round((time.monotonic() - start) * 1000, 1)})
+
+    def mark(self, name: str, at=None):
+        """Records an event once, at the given monotonic time or now."""
+        if name not in self.events:
+            self.events[name] = round(((at or time.monotonic()) - self._start) * 1000, 1)
+
+    def elapsed_ms(self):
+        return round((time.monotonic() - self._start) * 1000, 1)
+
+    def summary(self):
+        parts = [f"{p['name']} {p['ms']:.0f} ms" for p in self.phases]
+        parts += [f"{name} at {ms:.0f} ms" for name, ms in self.events.items()]
+        return ", ".join(parts)
+
+    def to_record(self, result: str):
+        return dict(
+            self.info,
+            timestamp=self.started_at.isoformat(timespec="seconds"),
+            result=result,
+            total_ms=self.elapsed_ms(),
+            phases=list(self.phases),
+            events=dict(self.events),
+        )
+
+
+def load_history():
+    """Returns the saved launch records, oldest first."""
+    if not os.path.exists(HISTORY_FILE_PATH):
+        return []
+    try:
+        with open(HISTORY_FILE_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("format") != HISTORY_FORMAT_VERSION:
+            return []
+        return data.get("launches", [])
+    except (IOError, json.JSONDecodeError, AttributeError) as e:
+        logging.warning(f"Could not read launch history: {e}")
+        return []
+
+
+def save_launch(record: dict):
+    with _lock:
+        launches = load_history()
+        launches.append(record)
+        launches = launches[-MAX_HISTORY_ENTRIES:]
+        try:
+            tmp_path = HISTORY_FILE_PATH + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"format": HISTORY_FORMAT_VERSION, "launches": launches}, f, ensure_ascii=False)
+            os.replace(tmp_path, HISTORY_FILE_PATH)
+        except IOError as e:
+            logging.warning(f"Could not save launch history: {e}")
+
+
+def export_history(path: str):
+    """Writes the whole launch history as pretty-printed JSON. Returns the number of launches."""
+    launches = load_history()
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"format": HISTORY_FORMAT_VERSION, "launches": launches}, f, ensure_ascii=False, indent=2)
+    return len(launches)
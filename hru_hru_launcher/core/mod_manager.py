@@ -9,9 +9,10 @@ try:
 except ImportError:
     import tomli
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+from .modrinth_client import get_client, log_stats
+from .process_priority import sync_background_priority
 
-MODRINTH_API_URL = "https://api.modrinth.com/v2"
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 def search_mods(query: str, game_version: str, loader: str, lang_dict: dict, sort_option: str = "relevance", offset: int = 0):
     facets = [
@@ -27,9 +28,7 @@ def search_mods(query: str, game_version: str, loader: str, lang_dict: dict, sor
         "offset": offset
     }
     try:
-        response = requests.get(f"{MODRINTH_API_URL}/search", params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        data = get_client().get("search", "/search", params=params)
         return data.get("hits", []), data.get("total_hits", 0)
     except requests.RequestException as e:
         error_message = lang_dict.get("error_searching_mods", "Error searching for mods ('{query}'): {e}")
@@ -39,9 +38,7 @@ def search_mods(query: str, game_version: str, loader: str, lang_dict: dict, sor
 def get_project_details(project_id: str, lang_dict: dict):
     if not project_id: return None
     try:
-        response = requests.get(f"{MODRINTH_API_URL}/project/{project_id}", timeout=10)
-        response.raise_for_status()
-        return response.json()
+        return get_client().get("project", f"/project/{project_id}")
     except requests.RequestException as e:
         error_message = lang_dict.get("error_getting_project_details", "Failed to get project details for {project_id}: {e}")
         logging.error(error_message.format(project_id=project_id, e=e))
@@ -72,9 +69,7 @@ def get_latest_mod_version(project_id: str, game_version: str, loader: str, lang
         "loaders": json.dumps([loader.lower()])
     }
     try:
-        response = requests.get(f"{MODRINTH_API_URL}/project/{project_id}/version", params=params, timeout=10)
-        response.raise_for_status()
-        versions = response.json()
+        versions = get_client().get("project_versions", f"/project/{project_id}/version", params=params)
         if versions and versions[0].get("files"):
             return versions[0]
     except requests.RequestException as e:
@@ -87,8 +82,7 @@ def download_file(url: str, destination_folder: str, file_name: str, progress_ca
     os.makedirs(destination_folder, exist_ok=True)
     file_path = os.path.join(destination_folder, file_name)
     try:
-        with requests.get(url, stream=True, timeout=30) as r:
-            r.raise_for_status()
+        with get_client().request("download", url, stream=True, timeout=30) as r:
             total_size = int(r.headers.get('content-length', 0))
             bytes_downloaded = 0
             with open(file_path, 'wb') as f:
@@ -186,6 +180,7 @@ def scan_local_mods(mods_folder: str, lang_dict: dict, installed_mods_data: dict
     for filename in os.listdir(mods_folder):
         file_path = os.path.join(mods_folder, filename)
         if filename.endswith((".jar", ".jar.disabled")):
+            sync_background_priority()
             mod_info = get_mod_metadata_from_jar(file_path, lang_dict)
             mod_info["filepath"] = file_path
             mod_info["enabled"] = not filename.endswith(".jar.disabled")
@@ -206,9 +201,7 @@ def scan_local_mods(mods_folder: str, lang_dict: dict, installed_mods_data: dict
             # Remove duplicates
             unique_project_ids = list(set(project_ids_to_fetch))
             params = {"ids": json.dumps(unique_project_ids)}
-            response = requests.get(f"{MODRINTH_API_URL}/projects", params=params, timeout=15)
-            response.raise_for_status()
-            projects_data = response.json()
+            projects_data = get_client().get("projects", "/projects", params=params, timeout=15)
             project_details_map = {project['id']: project for project in projects_data}
         except requests.RequestException as e:
             logging.error(f"Failed to fetch bulk project details: {e}")
@@ -225,4 +218,93 @@ def scan_local_mods(mods_folder: str, lang_dict: dict, installed_mods_data: dict
         
         installed_mods.append(mod_info)
 
-    return installed_mods
\ No newline at end of file
+    return installed_mods
+
+def api_stats():
+    """Request counters of the shared Modrinth client, per endpoint."""
+    return get_client().stats()
+
+def log_api_stats():
+    log_stats()
+
+def get_installed_mods_path(minecraft_dir: str):
+    return os.path.join(minecraft_dir, "installed_mods.json")
+
+def load_installed_mods(minecraft_dir: str):
+    """Returns the Modrinth mods installed through the launcher: {project_id: file info}."""
+    path = get_installed_mods_path(minecraft_dir)
+    try:
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+    except (IOError, json.JSONDecodeError) as e:
+        logging.error(f"Error reading installed_mods.json: {e}")
+    return {}
+
+def save_installed_mods(minecraft_dir: str, installed: dict):
+    with open(get_installed_mods_path(minecraft_dir), 'w', encoding='utf-8') as f:
+        json.dump(installed, f, indent=4)
+
+def sync_mods(minecraft_dir: str, game_version: str, loader: str, lang_dict: dict, project_ids=None, prune: bool = False, log=None):
+    """
+    Brings the mods tracked in installed_mods.json to the latest files for the
+    given game version and loader. Projects in project_ids that are not
+    installed yet are added; with prune, tracked mods not in project_ids are
+    removed. Disabled mods stay disabled. Returns one result dict per project.
+    """
+    log = log or logging.info
+    mods_folder = os.path.join(minecraft_dir, "mods")
+    installed = load_installed_mods(minecraft_dir)
+    wanted = list(dict.fromkeys(list(installed) + list(project_ids or [])))
+    results = []
+
+    def old_file_path(info):
+        path = os.path.join(mods_folder, info.get("filename", ""))
+        if info.get("filename") and os.path.exists(path + ".disabled"):
+            return path + ".disabled"
+        return path if info.get("filename") and os.path.exists(path) else None
+
+    for project_id in wanted:
+        info = installed.get(project_id)
+        if prune and project_ids is not None and project_id not in project_ids:
+            path = old_file_path(info)
+            if path:
+                os.remove(path)
+            del installed[project_id]
+            results.append({"project_id": project_id, "action": "removed", "filename": info.get("filename")})
+            log(f"Removed {info.get('filename')}")
+            continue
+
+        version_info = get_latest_mod_version(project_id, game_version, loader, lang_dict)
+        files = version_info.get("files", []) if version_info else []
+        primary_file = next((f for f in files if f.get("primary")), files[0] if files else None)
+        if not primary_file:
+            results.append({"project_id": project_id, "action": "failed", "message": f"No compatible file for {game_version} ({loader})."})
+            continue
+
+        old_path = old_file_path(info) if info else None
+        if old_path and info.get("filename") == primary_file["filename"]:
+            results.append({"project_id": project_id, "action": "unchanged", "filename": primary_file["filename"]})
+            continue
+
+        if not download_file(primary_file["url"], mods_folder, primary_file["filename"], lambda p: None, lang_dict):
+            results.append({"project_id": project_id, "action": "failed", "message": f"Failed to download {primary_file['filename']}."})
+            continue
+        new_path = os.path.join(mods_folder, primary_file["filename"])
+        if old_path and old_path.endswith(".disabled"):
+            os.replace(new_path, new_path + ".disabled")
+        if old_path and os.path.normcase(old_path) != os.path.normcase(new_path) and os.path.exists(old_path):
+            os.remove(old_path)
+
+        installed[project_id] = {
+            "filename": primary_file["filename"],
+            "url": primary_file["url"],
+            "project_id": project_id,
+            "game_version": game_version
+        }
+        action = "updated" if info else "installed"
+        results.append({"project_id": project_id, "action": action, "filename": primary_file["filename"]})
+        log(f"{action.capitalize()} {primary_file['filename']}")
+
+    save_installed_mods(minecraft_dir, installed)
+    return results
@@ -0,0 +1,164 @@
+# hru_hru_launcher/core/modrinth_client.py
+import time
+import random
+import logging
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+MODRINTH_API_URL = "https://api.modrinth.com/v2"
+# Modrinth asks for a User-Agent that identifies the project and a contact
+USER_AGENT = "krutoychel24/hru-hru-launcher (https://github.com/krutoychel24/hru-hru-launcher)"
+
+POOL_SIZE = 8
+DEFAULT_TIMEOUT = 10
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 8.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Requests kept in hand when X-Ratelimit-Remaining runs low, for calls already in flight on other threads
+RATE_LIMIT_RESERVE = 2
+MAX_RATE_LIMIT_WAIT = 60.0
+
+
+class ModrinthClient:
+    """
+    Shared client for the Modrinth API and CDN. One pooled keep-alive session
+    with an identifying User-Agent. Before each request it waits while
+    the X-Ratelimit-* headers say the budget is used up. GETs are idempotent,
+    so connection errors, timeouts, 429 and 5xx are retried with exponential
+    backoff and full jitter. Latency, errors and retries are counted per
+    endpoint.
+    """
+
+    def __init__(self, base_url=MODRINTH_API_URL, max_retries=MAX_RETRIES, pool_size=POOL_SIZE):
+        self.base_url = base_url
+        self.max_retries = max_retries
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"User-Agent": USER_AGENT})
+        self._lock = threading.Lock()
+        self._blocked_until = 0.0
+        self._stats = {}
+        self.rate_limit = {}
+
+    def get(self, endpoint, path, params=None, timeout=DEFAULT_TIMEOUT):
+        """GET base_url + path and return the decoded JSON. endpoint names the call in stats()."""
+        return self.request(endpoint, self.base_url + path, params=params, timeout=timeout).json()
+
+    def request(self, endpoint, url, params=None, timeout=DEFAULT_TIMEOUT, stream=False):
+        """
+        GET with rate limiting and retries. Returns the response; HTTP errors
+        left after the retries are raised as requests.HTTPError. With stream
+        the body is not read, so only failures before it starts are retried.
+        """
+        for attempt in range(self.max_retries + 1):
+            self._wait_for_rate_limit()
+            started = time.monotonic()
+            try:
+                response = self.session.get(url, params=params, timeout=timeout, stream=stream)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self._record(endpoint, started, error=True)
+                if attempt == self.max_retries:
+                    raise
+                self._retry_later(endpoint, attempt, e)
+                continue
+
+            self._note_rate_limit(response)
+            if response.status_code in RETRY_STATUSES and attempt < self.max_retries:
+                self._record(endpoint, started, error=True)
+                response.close()
+                # For 429 the wait comes from the rate-limit headers on the next attempt
+                self._retry_later(endpoint, attempt, f"HTTP {response.status_code}", sleep=response.status_code != 429)
+                continue
+
+            self._record(endpoint, started, error=not response.ok)
+            if not response.ok:
+                response.close()
+            response.raise_for_status()
+            return response
+
+    def _retry_later(self, endpoint, attempt, reason, sleep=True):
+        with self._lock:
+            self._stats[endpoint]["retries"] += 1
+        if not sleep:
+            logging.warning(f"Modrinth {endpoint} request was rate limited, retrying after the limit resets.")
+            return
+        delay = random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt))
+        logging.warning(f"Modrinth {endpoint} request failed ({reason}), retrying in {delay:.1f}s (attempt {attempt + 2} of {self.max_retries + 1}).")
+        time.sleep(delay)
+
+    def _wait_for_rate_limit(self):
+        with self._lock:
+            wait = self._blocked_until - time.monotonic()
+        if wait > 0:
+            logging.info(f"Modrinth rate limit reached, waiting {wait:.1f}s.")
+            time.sleep(wait)
+
+    def _note_rate_limit(self, response):
+        headers = response.headers
+        try:
+            limit = int(headers["X-Ratelimit-Limit"]) if "X-Ratelimit-Limit" in headers else None
+            remaining = int(headers["X-Ratelimit-Remaining"]) if "X-Ratelimit-Remaining" in headers else None
+            reset = float(headers["X-Ratelimit-Reset"]) if "X-Ratelimit-Reset" in headers else None
+            retry_after = float(headers["Retry-After"]) if "Retry-After" in headers else None
+        except ValueError:
+            return
+        wait = None
+        if response.status_code == 429:
+            wait = retry_after or reset or 1.0
+        elif remaining is not None and remaining <= RATE_LIMIT_RESERVE and reset:
+            wait = reset
+        with self._lock:
+            if remaining is not None:
+                self.rate_limit = {"limit": limit, "remaining": remaining, "reset": reset}
+            if wait:
+                self._blocked_until = max(self._blocked_until, time.monotonic() + min(wait, MAX_RATE_LIMIT_WAIT))
+
+    def _record(self, endpoint, started, error):
+        elapsed_ms = (time.monotonic() - started) * 1000
+        with self._lock:
+            stat = self._stats.setdefault(endpoint, {"requests": 0, "errors": 0, "retries": 0, "total_ms": 0.0, "max_ms": 0.0})
+            stat["requests"] += 1
+            stat["errors"] += int(error)
+            stat["total_ms"] += elapsed_ms
+            stat["max_ms"] = max(stat["max_ms"], elapsed_ms)
+
+    def stats(self):
+        """Per-endpoint counters: requests, errors, retries, avg_ms and max_ms (time to response headers)."""
+        with self._lock:
+            return {
+                endpoint: {
+                    "requests": stat["requests"],
+                    "errors": stat["errors"],
+                    "retries": stat["retries"],
+                    "avg_ms": round(stat["total_ms"] / stat["requests"], 1) if stat["requests"] else 0.0,
+                    "max_ms": round(stat["max_ms"], 1),
+                }
+                for endpoint, stat in self._stats.items()
+            }
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = ModrinthClient()
+        return _client
+
+
+def log_stats():
+    """Logs the per-endpoint counters if the client was used in this session."""
+    if _client is None:
+        return
+    for endpoint, stat in sorted(_client.stats().items()):
+        logging.info(
+            f"Modrinth {endpoint}: {stat['requests']} requests, {stat['errors']} errors, {stat['retries']} retries, "
+            f"avg {stat['avg_ms']:.0f} ms, max {stat['max_ms']:.0f} ms."
+        )
@@ -0,0 +1,156 @@
+# hru_hru_launcher/core/prefetch.py
+import logging
+import threading
+
+import minecraft_launcher_lib
+
+from . import downloader
+from . import install_journal
+from .version_catalog import base_mc_version as get_base_mc_version
+from .profile_manager import create_launcher_profiles_if_needed
+from .launch_supervisor import install_lock
+from .process_priority import lower_current_thread
+
+BACKGROUND_WORKERS = 2
+DEFAULT_RATE_KBPS = 2048
+
+_manager = None
+_manager_lock = threading.Lock()
+
+
+class PrefetchCancelled(Exception):
+    pass
+
+
+class PrefetchJob(threading.Thread):
+    """
+    Installs a version and its mod loader in the background with few download
+    threads, recording progress in the install journal. The bandwidth cap
+    covers the base version's files fetched by the download engine; the
+    version and asset index JSONs, the Java runtime and the Fabric/Forge
+    installers are not throttled. A launch for the same version attaches to
+    the job and lifts the cap. The job holds the base version's install lock,
+    so it never installs alongside a launch.
+    """
+
+    def __init__(self, minecraft_dir, mc_version, mod_loader, client_token, rate_kbps=DEFAULT_RATE_KBPS):
+        super().__init__(daemon=True)
+        self.minecraft_dir = minecraft_dir
+        self.mc_version = mc_version
+        self.mod_loader = mod_loader
+        self.client_token = client_token
+        self.rate_limiter = downloader.RateLimiter(rate_kbps * 1024 if rate_kbps else None)
+        self.state = "pending"
+        self.error = None
+        self.progress = (0, 0, "")
+        self._cancelled = threading.Event()
+
+    def matches(self, minecraft_dir, mc_version, mod_loader):
+        return (self.minecraft_dir, self.mc_version, self.mod_loader) == (minecraft_dir, mc_version, mod_loader)
+
+    def cancel(self):
+        self._cancelled.set()
+        self.rate_limiter.set_rate(None)
+
+    def is_cancelled(self):
+        return self._cancelled.is_set()
+
+    def set_foreground(self):
+        """Called when a launch attaches: the job continues at full speed."""
+        self.rate_limiter.set_rate(None)
+
+    def _callback(self):
+        def set_status(text):
+            if self.is_cancelled():
+                raise PrefetchCancelled()
+            self.progress = (self.progress[0], self.progress[1], text)
+
+        def set_progress(value, max_value=0):
+            if self.is_cancelled():
+                raise PrefetchCancelled()
+            if max_value > 0:
+                self.progress = (value, max_value, self.progress[2])
+
+        return {"setStatus": set_status, "setProgress": set_progress}
+
+    def run(self):
+        lower_current_thread()
+        self.state = "running"
+        callback = self._callback()
+        base_journal = install_journal.base_journal(self.minecraft_dir, self.mc_version, self.mod_loader)
+        loader_journal = install_journal.loader_journal(self.minecraft_dir, self.mc_version, self.mod_loader)
+        base_mc_version = get_base_mc_version(self.mc_version, self.mod_loader)
+        lock = install_lock(self.minecraft_dir, base_mc_version)
+        if not lock.acquire(blocking=False):
+            self.state = "skipped"
+            logging.info(f"Background install of {self.mc_version} skipped: {base_mc_version} is being installed by a launch.")
+            return
+        try:
+            create_launcher_profiles_if_needed(self.minecraft_dir, self.client_token)
+            base_journal.begin_step("base")
+            downloader.install_version(
+                base_mc_version, self.minecraft_dir, callback=callback, is_running=lambda: not self.is_cancelled(),
+                max_workers=BACKGROUND_WORKERS, journal=base_journal, rate_limiter=self.rate_limiter,
+                always_background=True,
+            )
+            base_journal.finish()
+            if loader_journal is not None:
+                loader_journal.begin_step(self.mod_loader)
+                if self.mod_loader == "fabric":
+                    minecraft_launcher_lib.fabric.install_fabric(base_mc_version, self.minecraft_dir, callback=callback)
+                elif self.mod_loader == "forge":
+                    minecraft_launcher_lib.forge.install_forge_version(self.mc_version, self.minecraft_dir, callback=callback)
+                loader_journal.finish()
+            self.state = "done"
+            logging.info(f"Background install of {self.mc_version} ({self.mod_loader or 'vanilla'}) finished.")
+        except (PrefetchCancelled, downloader.DownloadCancelled):
+            self.state = "cancelled"
+            logging.info(f"Background install of {self.mc_version} cancelled; progress is kept in the install journal.")
+        except Exception as e:
+            self.state = "failed"
+            self.error = e
+            logging.warning(f"Background install of {self.mc_version} failed: {e}")
+        finally:
+            lock.release()
+
+
+class PrefetchManager:
+    """Runs at most one speculative background install at a time."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.job = None
+
+    def start(self, minecraft_dir, mc_version, mod_loader, client_token, rate_kbps=DEFAULT_RATE_KBPS):
+        with self._lock:
+            if self.job and self.job.is_alive():
+                if self.job.matches(minecraft_dir, mc_version, mod_loader):
+                    return self.job
+                self.job.cancel()
+            self.job = PrefetchJob(minecraft_dir, mc_version, mod_loader, client_token, rate_kbps)
+            self.job.start()
+            logging.info(f"Started background install of {mc_version} ({mod_loader or 'vanilla'}).")
+            return self.job
+
+    def find(self, minecraft_dir, mc_version, mod_loader):
+        """Returns the running job for this version, if any."""
+        with self._lock:
+            if self.job and self.job.is_alive() and self.job.matches(minecraft_dir, mc_version, mod_loader):
+                return self.job
+        return None
+
+    def cancel(self, wait: bool = False):
+        with self._lock:
+            job = self.job
+        if job and job.is_alive():
+            job.cancel()
+            if wait:
+                job.join(timeout=10)
+
+
+def get_prefetch_manager():
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = PrefetchManager()
+        return _manager
@@ -0,0 +1,224 @@
+# hru_hru_launcher/core/process_priority.py
+import os
+import sys
+import logging
+import threading
+
+import psutil
+
+PRIORITY_IDLE = "idle"
+PRIORITY_BELOW_NORMAL = "below_normal"
+PRIORITY_NORMAL = "normal"
+PRIORITY_ABOVE_NORMAL = "above_normal"
+PRIORITY_HIGH = "high"
+PRIORITY_LEVELS = (PRIORITY_IDLE, PRIORITY_BELOW_NORMAL, PRIORITY_NORMAL, PRIORITY_ABOVE_NORMAL, PRIORITY_HIGH)
+
+IO_PRIORITY_IDLE = "idle"
+IO_PRIORITY_LOW = "low"
+IO_PRIORITY_NORMAL = "normal"
+IO_PRIORITY_LEVELS = (IO_PRIORITY_IDLE, IO_PRIORITY_LOW, IO_PRIORITY_NORMAL)
+
+DEFAULT_CONFIG = {"priority": PRIORITY_NORMAL, "io_priority": IO_PRIORITY_NORMAL, "affinity": ""}
+
+_NICE_VALUES = {
+    PRIORITY_IDLE: 19,
+    PRIORITY_BELOW_NORMAL: 10,
+    PRIORITY_NORMAL: 0,
+    PRIORITY_ABOVE_NORMAL: -5,
+    PRIORITY_HIGH: -10,
+}
+_WINDOWS_PRIORITY_CLASSES = {
+    PRIORITY_IDLE: "IDLE_PRIORITY_CLASS",
+    PRIORITY_BELOW_NORMAL: "BELOW_NORMAL_PRIORITY_CLASS",
+    PRIORITY_NORMAL: "NORMAL_PRIORITY_CLASS",
+    PRIORITY_ABOVE_NORMAL: "ABOVE_NORMAL_PRIORITY_CLASS",
+    PRIORITY_HIGH: "HIGH_PRIORITY_CLASS",
+}
+# Linux: (class, value); best-effort values run 0 (highest) to 7 (lowest)
+_LINUX_IO_PRIORITIES = {
+    IO_PRIORITY_IDLE: ("IOPRIO_CLASS_IDLE", None),
+    IO_PRIORITY_LOW: ("IOPRIO_CLASS_BE", 7),
+    IO_PRIORITY_NORMAL: ("IOPRIO_CLASS_BE", 4),
+}
+_WINDOWS_IO_PRIORITIES = {
+    IO_PRIORITY_IDLE: "IOPRIO_VERYLOW",
+    IO_PRIORITY_LOW: "IOPRIO_LOW",
+    IO_PRIORITY_NORMAL: "IOPRIO_NORMAL",
+}
+
+# SetThreadPriority modes that lower both the CPU and the I/O priority of the calling thread
+_WINDOWS_THREAD_MODE_BACKGROUND_BEGIN = 0x00010000
+_WINDOWS_THREAD_MODE_BACKGROUND_END = 0x00020000
+
+_games_running = 0
+_games_lock = threading.Lock()
+_thread_state = threading.local()
+
+
+def parse_affinity(text: str, cpu_count=None):
+    """
+    Parses a CPU list such as "0-3,6" into sorted CPU indexes. Returns None for
+    an empty string (all CPUs). Raises ValueError for malformed or out-of-range entries.
+    """
+    text = (text or "").strip()
+    if not text:
+        return None
+    cpu_count = cpu_count or psutil.cpu_count(logical=True) or 1
+    cpus = set()
+    for part in text.replace(" ", "").split(","):
+        if "-" in part:
+            start, end = (int(value) for value in part.split("-", 1))
+            if start > end:
+                raise ValueError(f"Invalid CPU range '{part}'")
+            cpus.update(range(start, end + 1))
+        elif part:
+            cpus.add(int(part))
+    if not cpus or max(cpus) >= cpu_count or min(cpus) < 0:
+        raise ValueError(f"CPU list '{text}' does not fit the {cpu_count} CPUs of this machine")
+    return sorted(cpus)
+
+
+def _set_priority(process, level):
+    if sys.platform == "win32":
+        process.nice(getattr(psutil, _WINDOWS_PRIORITY_CLASSES[level]))
+    else:
+        process.nice(_NICE_VALUES[level])
+
+
+def _set_io_priority(process, level):
+    if sys.platform == "win32":
+        process.ionice(getattr(psutil, _WINDOWS_IO_PRIORITIES[level]))
+    elif sys.platform.startswith("linux"):
+        io_class, value = _LINUX_IO_PRIORITIES[level]
+        process.ionice(getattr(psutil, io_class), value)
+    else:
+        raise NotImplementedError("I/O priority is not supported on this system")
+
+
+def _targets(process):
+    """
+    On Linux affinity, nice and ionice are per thread and the JVM starts its
+    threads right away, so every existing thread is adjusted; threads created
+    later inherit the settings. Elsewhere the settings are process-wide.
+    """
+    if not sys.platform.startswith("linux"):
+        return [process]
+    targets = [process]
+    for thread in process.threads():
+        if thread.id != process.pid:
+            try:
+                targets.append(psutil.Process(thread.id))
+            except psutil.Error:
+                pass
+    return targets
+
+
+def apply_to_process(pid: int, config: dict):
+    """
+    Applies a launch configuration's CPU affinity, priority and I/O priority to
+    a running process. Each setting is applied on its own; returns a list of
+    log messages, one per setting that differs from the default.
+    """
+    config = dict(DEFAULT_CONFIG, **(config or {}))
+    messages = []
+    try:
+        process = psutil.Process(pid)
+        targets = _targets(process)
+    except psutil.Error as e:
+        return [f"Could not adjust game process priority: {e}"]
+
+    try:
+        cpus = parse_affinity(config["affinity"])
+        if cpus is not None:
+            for target in targets:
+                target.cpu_affinity(cpus)
+            messages.append(f"CPU affinity set to {config['affinity']}.")
+    except (ValueError, AttributeError, psutil.Error) as e:
+        messages.append(f"Could not set CPU affinity: {e}")
+
+    level = config["priority"]
+    if level in PRIORITY_LEVELS and level != PRIORITY_NORMAL:
+        try:
+            for target in targets:
+                _set_priority(target, level)
+            messages.append(f"Process priority set to {level}.")
+        except psutil.AccessDenied:
+            messages.append(f"Not allowed to raise the game priority to {level}; run the launcher with more privileges or pick a lower level.")
+        except psutil.Error as e:
+            messages.append(f"Could not set process priority: {e}")
+
+    io_level = config["io_priority"]
+    if io_level in IO_PRIORITY_LEVELS and io_level != IO_PRIORITY_NORMAL:
+        try:
+            for target in targets:
+                _set_io_priority(target, io_level)
+            messages.append(f"I/O priority set to {io_level}.")
+        except (NotImplementedError, AttributeError, psutil.Error) as e:
+            messages.append(f"Could not set I/O priority: {e}")
+    return messages
+
+
+def game_started():
+    global _games_running
+    with _games_lock:
+        _games_running += 1
+
+
+def game_stopped():
+    global _games_running
+    with _games_lock:
+        _games_running = max(0, _games_running - 1)
+
+
+def games_running():
+    with _games_lock:
+        return _games_running
+
+
+def _set_thread_background(background: bool):
+    """
+    Moves the calling thread's CPU and I/O scheduling to idle, or back to
+    normal. Linux uses SCHED_IDLE rather than a nice value because an
+    unprivileged thread may switch back to SCHED_OTHER but not lower its nice.
+    """
+    try:
+        if sys.platform.startswith("linux"):
+            os.sched_setscheduler(0, os.SCHED_IDLE if background else os.SCHED_OTHER, os.sched_param(0))
+            _set_io_priority(psutil.Process(threading.get_native_id()), IO_PRIORITY_IDLE if background else IO_PRIORITY_NORMAL)
+        elif sys.platform == "win32":
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            mode = _WINDOWS_THREAD_MODE_BACKGROUND_BEGIN if background else _WINDOWS_THREAD_MODE_BACKGROUND_END
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), mode)
+    except (OSError, AttributeError, psutil.Error) as e:
+        logging.debug(f"Could not change background thread priority: {e}")
+
+
+def enter_background(always: bool = False):
+    """
+    Called at the start of launcher background work (scans, verification,
+    download threads). While a game is running the thread runs at idle CPU and
+    I/O priority; otherwise it keeps the launcher's normal priority. With
+    always it stays idle either way. Long-running work calls
+    sync_background_priority between tasks to follow games starting and stopping.
+    """
+    _thread_state.always = always
+    _thread_state.lowered = False
+    if always or games_running():
+        _set_thread_background(True)
+        _thread_state.lowered = True
+
+
+def sync_background_priority():
+    """Lowers or restores a thread set up by enter_background to match whether a game is running now."""
+    if getattr(_thread_state, "always", True):
+        return
+    wanted = _games_running > 0
+    if wanted != _thread_state.lowered:
+        _set_thread_background(wanted)
+        _thread_state.lowered = wanted
+
+
+def lower_current_thread():
+    """Drops the calling thread to idle CPU and I/O priority for as long as it runs."""
+    enter_background(always=True)
@@ -2,11 +2,17 @@
 import os
 import json
 import uuid
+import threading
 from datetime import datetime, timezone
 
+# Several game instances can write launcher_profiles.json at the same time
+_profiles_lock = threading.Lock()
+
 def create_launcher_profiles_if_needed(minecraft_dir: str, client_token: str):
     profiles_path = os.path.join(minecraft_dir, "launcher_profiles.json")
-    if not os.path.exists(profiles_path):
+    with _profiles_lock:
+        if os.path.exists(profiles_path):
+            return
         base_structure = {
             "profiles": {},
             "settings": {
@@ -27,7 +33,7 @@ def add_profile(minecraft_dir: str, version_id: str, profile_name: str, icon: st
         print("Warning: launcher_profiles.json not found. Cannot add profile.")
         return
 
-    with open(profiles_path, "r+", encoding="utf-8") as f:
+    with _profiles_lock, open(profiles_path, "r+", encoding="utf-8") as f:
         data = json.load(f)
         profile_id = uuid.uuid4().hex
         now_iso = datetime.now(timezone.utc).isoformat()
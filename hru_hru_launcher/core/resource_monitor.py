@@ -0,0 +1,167 @@
+# hru_hru_launcher/core/resource_monitor.py
+import sys
+import time
+import logging
+import threading
+from array import array
+
+import psutil
+
+DEFAULT_INTERVAL_MS = 1000
+DEFAULT_CAPACITY = 600
+MIN_INTERVAL_MS = 100
+
+SAMPLE_FIELDS = ("time", "cpu_percent", "rss", "threads", "read_bytes", "write_bytes", "open_files")
+
+
+class RingBuffer:
+    """
+    Fixed-size sample store backed by one preallocated array('d') per field.
+    Appending never allocates; once full, the oldest sample is overwritten.
+    """
+
+    def __init__(self, capacity: int, fields=SAMPLE_FIELDS):
+        self.capacity = max(1, capacity)
+        self.fields = tuple(fields)
+        self._columns = {name: array("d", [0.0]) * self.capacity for name in self.fields}
+        self._next = 0
+        self.count = 0
+
+    def append(self, sample: dict):
+        for name, column in self._columns.items():
+            column[self._next] = sample.get(name, 0.0)
+        self._next = (self._next + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def values(self, name: str):
+        """Returns the stored values of one field, oldest first."""
+        column = self._columns[name]
+        if self.count < self.capacity:
+            return column[:self.count].tolist()
+        return column[self._next:].tolist() + column[:self._next].tolist()
+
+    def last(self):
+        if not self.count:
+            return None
+        index = (self._next - 1) % self.capacity
+        return {name: column[index] for name, column in self._columns.items()}
+
+
+def _slope_per_minute(times, values):
+    """Least-squares slope of values over times (seconds), scaled to one minute."""
+    n = len(times)
+    if n < 2:
+        return 0.0
+    mean_t = sum(times) / n
+    mean_v = sum(values) / n
+    var_t = sum((t - mean_t) ** 2 for t in times)
+    if not var_t:
+        return 0.0
+    cov = sum((t - mean_t) * (v - mean_v) for t, v in zip(times, values))
+    return cov / var_t * 60
+
+
+class ResourceSampler(threading.Thread):
+    """
+    Samples a process with psutil at a fixed interval: CPU% (per core, as in
+    top), resident memory, thread count, cumulative I/O bytes and the number
+    of open file descriptors (handles on Windows). Each sample is one
+    oneshot() call, so the cost per tick is a few system calls.
+    """
+
+    def __init__(self, pid: int, interval_ms: int = DEFAULT_INTERVAL_MS, capacity: int = DEFAULT_CAPACITY):
+        super().__init__(daemon=True)
+        self.pid = pid
+        self.interval = max(MIN_INTERVAL_MS, interval_ms) / 1000
+        self.buffer = RingBuffer(capacity)
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._started_at = time.monotonic()
+        self.total_samples = 0
+        self.peak_rss = 0
+        self.peak_threads = 0
+        self.peak_open_files = 0
+        self.max_cpu_percent = 0.0
+        self._cpu_sum = 0.0
+        try:
+            self._process = psutil.Process(pid)
+            self._process.cpu_percent(None)
+        except psutil.Error as e:
+            logging.warning(f"Could not monitor game process {pid}: {e}")
+            self._process = None
+
+    def stop(self):
+        self._stop_event.set()
+
+    def _sample(self):
+        process = self._process
+        with process.oneshot():
+            sample = {
+                "time": time.monotonic() - self._started_at,
+                "cpu_percent": process.cpu_percent(None),
+                "rss": process.memory_info().rss,
+                "threads": process.num_threads(),
+            }
+            try:
+                io = process.io_counters()
+                sample["read_bytes"], sample["write_bytes"] = io.read_bytes, io.write_bytes
+            except (AttributeError, psutil.AccessDenied):
+                pass
+            try:
+                sample["open_files"] = process.num_handles() if sys.platform == "win32" else process.num_fds()
+            except (AttributeError, psutil.AccessDenied):
+                pass
+        return sample
+
+    def run(self):
+        while self._process and not self._stop_event.wait(self.interval):
+            try:
+                sample = self._sample()
+            except psutil.Error:
+                break
+            with self._lock:
+                self.buffer.append(sample)
+                self.total_samples += 1
+                self._cpu_sum += sample["cpu_percent"]
+                self.max_cpu_percent = max(self.max_cpu_percent, sample["cpu_percent"])
+                self.peak_rss = max(self.peak_rss, sample["rss"])
+                self.peak_threads = max(self.peak_threads, sample["threads"])
+                self.peak_open_files = max(self.peak_open_files, sample.get("open_files", 0))
+
+    def latest(self):
+        with self._lock:
+            return self.buffer.last()
+
+    def snapshot(self, fields=SAMPLE_FIELDS):
+        """Returns {field: [values oldest first]} for drawing; I/O bytes are turned into per-second rates."""
+        with self._lock:
+            data = {name: self.buffer.values(name) for name in set(fields) | {"time", "read_bytes", "write_bytes"}}
+        times = data["time"]
+        io_total = [r + w for r, w in zip(data.pop("read_bytes"), data.pop("write_bytes"))]
+        data["io_rate"] = [
+            max(0.0, (io_total[i] - io_total[i - 1]) / max(times[i] - times[i - 1], 1e-3)) for i in range(1, len(io_total))
+        ]
+        return data
+
+    def summary(self):
+        """Aggregates for the launch record: averages and peaks over the whole run, totals and RSS growth."""
+        with self._lock:
+            if not self.total_samples:
+                return None
+            times = self.buffer.values("time")
+            rss = self.buffer.values("rss")
+            last = self.buffer.last()
+            return {
+                "samples": self.total_samples,
+                "interval_ms": round(self.interval * 1000),
+                "cpu_avg": round(self._cpu_sum / self.total_samples, 1),
+                "cpu_max": round(self.max_cpu_percent, 1),
+                "rss_peak_mb": round(self.peak_rss / (1024 * 1024), 1),
+                "rss_last_mb": round(last["rss"] / (1024 * 1024), 1),
+                # Over the buffered window; a steady positive value points at memory creep
+                "rss_growth_mb_per_min": round(_slope_per_minute(times, rss) / (1024 * 1024), 2),
+                "threads_peak": self.peak_threads,
+                "open_files_peak": self.peak_open_files,
+                "read_mb": round(last["read_bytes"] / (1024 * 1024), 1),
+                "write_mb": round(last["write_bytes"] / (1024 * 1024), 1),
+            }
@@ -0,0 +1,68 @@
+# hru_hru_launcher/core/search_cache.py
+import time
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+
+SEARCH_FRESH_SECONDS = 5 * 60
+SEARCH_MAX_AGE_SECONDS = 30 * 60
+SEARCH_CACHE_SIZE = 200
+
+
+class CachedPage(NamedTuple):
+    hits: list
+    total_hits: int
+    fresh: bool
+
+
+class SearchCache:
+    """
+    In-memory cache of Modrinth search pages keyed by (query, game_version,
+    loader, sort_option, offset). Pages younger than fresh_seconds are used as
+    is; older ones are still returned, marked stale, until max_age_seconds so
+    the list can show them at once and refresh them in the background.
+    """
+
+    def __init__(self, fresh_seconds=SEARCH_FRESH_SECONDS, max_age_seconds=SEARCH_MAX_AGE_SECONDS, max_entries=SEARCH_CACHE_SIZE):
+        self.fresh_seconds = fresh_seconds
+        self.max_age_seconds = max_age_seconds
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, hits, total_hits = entry
+            age = time.monotonic() - stored_at
+            if age > self.max_age_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return CachedPage(hits, total_hits, age <= self.fresh_seconds)
+
+    def put(self, key, hits, total_hits):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), hits, total_hits)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_search_cache():
+    """The cache shared by every search list in the launcher."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = SearchCache()
+        return _cache
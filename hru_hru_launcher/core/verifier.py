@@ -0,0 +1,89 @@
+# hru_hru_launcher/core/verifier.py
+import os
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from . import downloader
+from .hash_db import get_hash_db
+from .process_priority import enter_background, sync_background_priority
+
+HASH_WORKERS = 8
+
+
+def _check_task(task, hash_db):
+    """Returns a reason string if the file is broken, else None."""
+    sync_background_priority()
+    path = task["path"]
+    if not os.path.isfile(path):
+        return "missing"
+    if task.get("size") and os.path.getsize(path) != task["size"]:
+        return "size mismatch"
+    if task.get("sha1") and hash_db.get_sha1(path) != task["sha1"]:
+        return "hash mismatch"
+    return None
+
+
+def verify_version(version_id: str, minecraft_dir: str, callback=None, is_running=None, max_workers: int = HASH_WORKERS):
+    """
+    Checks the client jar, libraries and asset objects of a version against its
+    version JSON and asset index. Returns a list of (task, reason) for broken files.
+    """
+    callback = callback or {}
+    is_running = is_running or (lambda: True)
+    hash_db = get_hash_db()
+
+    if "setStatus" in callback:
+        callback["setStatus"](f"Verifying files of {version_id}")
+    tasks = downloader.collect_version_downloads(version_id, minecraft_dir)
+    total = len(tasks)
+    broken = []
+    done = 0
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, initializer=enter_background)
+    futures = {executor.submit(_check_task, task, hash_db): task for task in tasks}
+    try:
+        for future in as_completed(futures):
+            if not is_running():
+                raise downloader.DownloadCancelled()
+            reason = future.result()
+            if reason:
+                broken.append((futures[future], reason))
+            done += 1
+            if "setProgress" in callback:
+                callback["setProgress"](done, total)
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        raise
+    finally:
+        executor.shutdown(wait=True)
+        hash_db.save()
+
+    logging.info(f"Verified {total} files of {version_id}: {len(broken)} broken.")
+    return broken
+
+
+def repair_version(version_id: str, minecraft_dir: str, callback=None, is_running=None, log=None):
+    """
+    Verifies a version and re-downloads only the broken files.
+    Returns the number of files that were repaired.
+    """
+    log = log or logging.info
+    broken = verify_version(version_id, minecraft_dir, callback, is_running)
+    for task, reason in broken:
+        log(f"{reason}: {os.path.relpath(task['path'], minecraft_dir)}")
+    if not broken:
+        return 0
+
+    hash_db = get_hash_db()
+    engine = downloader.DownloadEngine(callback, is_running, hash_db=hash_db)
+    try:
+        for task, _ in broken:
+            if os.path.isfile(task["path"]):
+                os.remove(task["path"])
+                hash_db.forget(task["path"])
+        engine.download_all([task for task, _ in broken], f"Repairing {len(broken)} files of {version_id}")
+    finally:
+        engine.close()
+        hash_db.save()
+    return len(broken)
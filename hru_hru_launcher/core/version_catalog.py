@@ -0,0 +1,84 @@
+# hru_hru_launcher/core/version_catalog.py
+import re
+from typing import NamedTuple, Optional, Tuple
+
+from hru_hru_launcher.utils import helpers
+
+LOADER_VANILLA = "vanilla"
+LOADER_FORGE = "forge"
+LOADER_FABRIC = "fabric"
+
+_FABRIC_ID_RE = re.compile(r"^fabric-loader-(?P<build>[^-]+)-(?P<mc>.+)$")
+_FORGE_CATALOG_ID_RE = re.compile(r"^(?P<mc>[^-]+)-(?P<build>.+)$")
+
+
+class VersionRecord(NamedTuple):
+    id: str
+    mc_version: str
+    loader: str
+    build: Optional[str]
+    sort_key: Tuple[int, ...]
+
+
+def base_mc_version(mc_version: str, loader=None):
+    """The vanilla version a launch builds on; Forge versions are given as '1.20.1-47.2.0'."""
+    return mc_version.split("-")[0] if loader == LOADER_FORGE else mc_version
+
+
+def parse_installed_id(version_id: str):
+    """Parses the id of an installed version folder (vanilla, Forge or Fabric)."""
+    lowered = version_id.lower()
+    if "fabric" in lowered:
+        match = _FABRIC_ID_RE.match(version_id)
+        if match:
+            mc_version, build = match.group("mc"), match.group("build")
+        else:
+            mc_version, build = helpers.get_base_version(version_id), None
+        loader = LOADER_FABRIC
+    elif "forge" in lowered:
+        mc_version, build, loader = helpers.get_base_version(version_id), None, LOADER_FORGE
+    else:
+        mc_version, build, loader = version_id, None, LOADER_VANILLA
+    return VersionRecord(version_id, mc_version, loader, build, helpers.version_key(mc_version))
+
+
+def parse_catalog_id(version_id: str, loader: str):
+    """Parses an entry of a remote catalog; Forge entries look like '1.20.1-47.2.0'."""
+    if loader == LOADER_FORGE:
+        match = _FORGE_CATALOG_ID_RE.match(version_id)
+        if match:
+            mc_version = match.group("mc")
+            return VersionRecord(version_id, mc_version, loader, match.group("build"), helpers.version_key(mc_version))
+    return VersionRecord(version_id, version_id, loader, None, helpers.version_key(version_id))
+
+
+class InstalledCatalog:
+    """
+    Parsed records of the installed versions with prebuilt indexes, so the
+    installed state of every catalog entry is one dictionary lookup.
+    """
+
+    def __init__(self, installed_ids):
+        self.records = [parse_installed_id(version_id) for version_id in installed_ids]
+        self._ids = set()
+        self._by_key = {}
+        self._by_base = {}
+        for record in self.records:
+            self._ids.add(record.id)
+            self._by_key.setdefault((record.mc_version, record.loader), []).append(record.id)
+            self._by_base.setdefault(helpers.get_base_version(record.id), []).append(record.id)
+
+    def installed_ids_for(self, mc_version: str, loader: str):
+        return self._by_key.get((mc_version, loader), [])
+
+    def is_installed(self, entry: VersionRecord):
+        if entry.loader == LOADER_VANILLA:
+            return entry.id in self._ids
+        candidates = self._by_key.get((entry.mc_version, entry.loader), ())
+        if entry.loader == LOADER_FORGE:
+            return any(installed_id.endswith(entry.build) for installed_id in candidates) if entry.build else bool(candidates)
+        return bool(candidates)
+
+    def grouped_by_base(self):
+        """Returns [(base mc version, [installed ids])] sorted newest first."""
+        return sorted(self._by_base.items(), key=lambda item: helpers.version_key(item[0]), reverse=True)
@@ -0,0 +1,207 @@
+# hru_hru_launcher/core/version_index.py
+import os
+import json
+import logging
+import threading
+
+from hru_hru_launcher.utils.paths import get_launcher_data_dir
+from .version_catalog import InstalledCatalog
+
+INDEX_FILE_NAME = "versions_index.json"
+INDEX_FORMAT_VERSION = 1
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def _stat_key(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+class VersionIndex:
+    """
+    Persistent index of the versions/ folder of a .minecraft directory.
+
+    Every entry remembers the mtime/size of its version JSON, so a refresh only
+    re-parses JSONs that actually changed. As long as the mtime of versions/
+    itself is unchanged (no folder added or removed) a lookup is a dictionary
+    access instead of a filesystem walk.
+    """
+
+    def __init__(self, minecraft_dir: str, index_path: str = None):
+        self.minecraft_dir = minecraft_dir
+        self.versions_dir = os.path.join(minecraft_dir, "versions")
+        self.index_path = index_path or os.path.join(get_launcher_data_dir(), INDEX_FILE_NAME)
+        self._lock = threading.RLock()
+        self._entries = {}
+        self._pending = set()
+        self._dir_key = None
+        self._validated = False
+        self._generation = 0
+        self._catalog = None
+        self._catalog_generation = -1
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.index_path):
+            return
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("format") != INDEX_FORMAT_VERSION:
+                return
+            stored = data.get("directories", {}).get(self.minecraft_dir, {})
+            self._entries = stored.get("entries", {})
+            self._pending = set(stored.get("pending", []))
+            self._dir_key = stored.get("dir_key")
+        except (IOError, json.JSONDecodeError, AttributeError) as e:
+            logging.warning(f"Could not read versions index, rebuilding: {e}")
+            self._entries = {}
+            self._pending = set()
+            self._dir_key = None
+
+    def _save(self):
+        try:
+            data = {"format": INDEX_FORMAT_VERSION, "directories": {}}
+            if os.path.exists(self.index_path):
+                try:
+                    with open(self.index_path, "r", encoding="utf-8") as f:
+                        existing = json.load(f)
+                    if existing.get("format") == INDEX_FORMAT_VERSION:
+                        data["directories"] = existing.get("directories", {})
+                except (IOError, json.JSONDecodeError):
+                    pass
+            data["directories"][self.minecraft_dir] = {
+                "dir_key": self._dir_key,
+                "entries": self._entries,
+                "pending": sorted(self._pending),
+            }
+            tmp_path = self.index_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.index_path)
+        except IOError as e:
+            logging.warning(f"Could not save versions index: {e}")
+
+    @staticmethod
+    def _parse_version_json(json_path):
+        with open(json_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return {
+            "id": data["id"],
+            "type": data.get("type", "release"),
+            "releaseTime": data.get("releaseTime", ""),
+            "complianceLevel": data.get("complianceLevel", 0),
+            "inheritsFrom": data.get("inheritsFrom"),
+        }
+
+    def _update_entry(self, folder_name):
+        """Re-stats one version folder and re-parses its JSON only if it changed."""
+        json_path = os.path.join(self.versions_dir, folder_name, f"{folder_name}.json")
+        key = _stat_key(json_path)
+        if key is None:
+            self._entries.pop(folder_name, None)
+            if os.path.isdir(os.path.join(self.versions_dir, folder_name)):
+                self._pending.add(folder_name)
+            else:
+                self._pending.discard(folder_name)
+            return False
+
+        self._pending.discard(folder_name)
+        entry = self._entries.get(folder_name)
+        if entry and entry.get("key") == key:
+            return False
+        try:
+            info = self._parse_version_json(json_path)
+        except (IOError, json.JSONDecodeError, KeyError) as e:
+            logging.warning(f"Skipping unreadable version JSON {json_path}: {e}")
+            self._entries.pop(folder_name, None)
+            self._pending.add(folder_name)
+            return True
+        self._entries[folder_name] = {"key": key, "info": info}
+        return True
+
+    def refresh(self, force: bool = False):
+        """
+        Brings the index up to date. Without force the per-folder pass is
+        skipped when versions/ itself has not changed since the last refresh;
+        folders that had no readable JSON yet are always re-checked.
+        """
+        with self._lock:
+            dir_key = _stat_key(self.versions_dir)
+            changed = False
+
+            if dir_key is None:
+                changed = bool(self._entries or self._pending)
+                self._entries.clear()
+                self._pending.clear()
+            elif force or not self._validated or dir_key != self._dir_key:
+                folders = set()
+                with os.scandir(self.versions_dir) as it:
+                    for entry in it:
+                        if entry.is_dir():
+                            folders.add(entry.name)
+                for removed in (set(self._entries) | self._pending) - folders:
+                    self._entries.pop(removed, None)
+                    self._pending.discard(removed)
+                    changed = True
+                for folder_name in folders:
+                    changed = self._update_entry(folder_name) or changed
+            else:
+                for folder_name in list(self._pending):
+                    changed = self._update_entry(folder_name) or changed
+
+            if dir_key != self._dir_key:
+                changed = True
+            self._dir_key = dir_key
+            self._validated = True
+            if changed:
+                self._generation += 1
+                self._save()
+
+    def invalidate(self):
+        """Forces the next lookup to re-stat every version folder."""
+        with self._lock:
+            self._validated = False
+
+    def get_installed_versions(self):
+        """Same shape as minecraft_launcher_lib.utils.get_installed_versions (releaseTime stays a string)."""
+        with self._lock:
+            self.refresh()
+            return [dict(entry["info"]) for entry in self._entries.values()]
+
+    def get_installed_ids(self):
+        with self._lock:
+            self.refresh()
+            return {entry["info"]["id"] for entry in self._entries.values()}
+
+    def get_catalog(self):
+        """Returns the parsed InstalledCatalog, rebuilt only after the index changed."""
+        with self._lock:
+            self.refresh()
+            if self._catalog is None or self._catalog_generation != self._generation:
+                self._catalog = InstalledCatalog(entry["info"]["id"] for entry in self._entries.values())
+                self._catalog_generation = self._generation
+            return self._catalog
+
+    def get_version_info(self, version_id: str):
+        with self._lock:
+            self.refresh()
+            for entry in self._entries.values():
+                if entry["info"]["id"] == version_id:
+                    return dict(entry["info"])
+        return None
+
+
+def get_version_index(minecraft_dir: str):
+    """Returns the shared index for a .minecraft directory (one per process)."""
+    with _indexes_lock:
+        index = _indexes.get(minecraft_dir)
+        if index is None:
+            index = VersionIndex(minecraft_dir)
+            _indexes[minecraft_dir] = index
+        return index
@@ -1,4 +1,9 @@
 import sys
+import time
+
+# Taken before the Qt and launcher imports so time to interactive includes them
+STARTED_AT = time.monotonic()
+
 import traceback
 import logging
 from PySide6.QtWidgets import QApplication
@@ -25,7 +30,7 @@ def main():
     app = QApplication(sys.argv)
     
     try:
-        launcher = MinecraftLauncher()
+        launcher = MinecraftLauncher(started_at=STARTED_AT)
         launcher.show()
         sys.exit(app.exec())
     except Exception as e:
@@ -1,11 +1,18 @@
 from PySide6.QtCore import Qt, Signal, QPropertyAnimation, QEasingCurve, QSize
-from PySide6.QtGui import QPixmap
+from PySide6.QtGui import QPixmap, QColor
 from PySide6.QtWidgets import (QDialog, QFrame, QVBoxLayout, QHBoxLayout, QLabel, 
-                             QPushButton, QLineEdit, QFileDialog)
+                             QPushButton, QLineEdit, QFileDialog, QCheckBox, QComboBox,
+                             QTableWidget, QTableWidgetItem, QHeaderView, QMessageBox)
 
 from hru_hru_launcher.config import resources 
+from hru_hru_launcher.core import launch_timing
+from hru_hru_launcher.utils import helpers
 from .widgets import AnimatedButton
 
+# Only needed once a dialog is opened; both import psutil.
+jvm_profiles = helpers.lazy_import("hru_hru_launcher.core.jvm_profiles")
+process_priority = helpers.lazy_import("hru_hru_launcher.core.process_priority")
+
 class FixErrorDialog(QDialog):
     def __init__(self, error_title, error_desc, fix_suggestion, lang_dict, parent=None, icon_svg=None):
         super().__init__(parent)
@@ -240,6 +247,38 @@ class AdvancedSettingsDialog(QDialog):
         java_path_from_settings = self.parent_window.settings.get("java_path", "")
         self.java_path_input = QLineEdit(java_path_from_settings)
         self.java_path_input.setPlaceholderText("Auto (Recommended)")
+
+        selected_version = self.parent_window.version_combo.currentData(Qt.UserRole) or ""
+        self.profile_key = jvm_profiles.config_key(self.parent_window.current_version_type, selected_version)
+        current_profile = self.parent_window.settings.get("jvm_profiles", {}).get(self.profile_key, jvm_profiles.PROFILE_AUTO)
+        self.jvm_profile_combo = QComboBox()
+        for profile_id in jvm_profiles.PROFILE_IDS:
+            self.jvm_profile_combo.addItem(self.lang_dict.get(f"jvm_profile_{profile_id}", profile_id), profile_id)
+        self.jvm_profile_combo.setCurrentIndex(max(0, self.jvm_profile_combo.findData(current_profile)))
+        self.jvm_profile_combo.setEnabled(bool(selected_version))
+
+        priority_config = dict(process_priority.DEFAULT_CONFIG, **self.parent_window.settings.get("process_priority", {}).get(self.profile_key, {}))
+        self.priority_combo = QComboBox()
+        for level in process_priority.PRIORITY_LEVELS:
+            self.priority_combo.addItem(self.lang_dict.get(f"priority_{level}", level), level)
+        self.priority_combo.setCurrentIndex(max(0, self.priority_combo.findData(priority_config["priority"])))
+        self.io_priority_combo = QComboBox()
+        for level in process_priority.IO_PRIORITY_LEVELS:
+            self.io_priority_combo.addItem(self.lang_dict.get(f"io_priority_{level}", level), level)
+        self.io_priority_combo.setCurrentIndex(max(0, self.io_priority_combo.findData(priority_config["io_priority"])))
+        self.affinity_input = QLineEdit(priority_config["affinity"])
+        self.affinity_input.setPlaceholderText(self.lang_dict.get("cpu_affinity_placeholder", "All CPUs (e.g. 0-3,6)"))
+        for widget in (self.priority_combo, self.io_priority_combo, self.affinity_input):
+            widget.setEnabled(bool(selected_version))
+
+        self.use_cds_checkbox = QCheckBox(self.lang_dict.get("use_cds", "Speed up game startup with a class-data archive (Java 13+)"))
+        self.use_cds_checkbox.setChecked(self.parent_window.settings.get("use_cds", False))
+
+        self.background_prefetch_checkbox = QCheckBox(self.lang_dict.get("background_prefetch", "Install the selected version in the background"))
+        self.background_prefetch_checkbox.setChecked(self.parent_window.settings.get("background_prefetch", False))
+
+        self.mirror_console_checkbox = QCheckBox(self.lang_dict.get("console_mirror_to_log", "Mirror console output to the launcher log"))
+        self.mirror_console_checkbox.setChecked(self.parent_window.settings.get("console_mirror_to_log", False))
         
         self.init_ui()
         self.apply_styles()
@@ -265,11 +304,31 @@ class AdvancedSettingsDialog(QDialog):
         java_path_layout.addWidget(self.java_path_input)
         java_path_layout.addWidget(java_path_button)
 
+        jvm_profile_label = QLabel(self.lang_dict.get("jvm_profile", "JVM Tuning Profile ({version})").format(version=self.profile_key))
+        jvm_profile_label.setFont(self.parent_window.subtitle_font)
+
+        layout.addWidget(jvm_profile_label)
+        layout.addWidget(self.jvm_profile_combo)
+        layout.addSpacing(10)
+
+        priority_label = QLabel(self.lang_dict.get("process_priority", "Game Process Priority ({version})").format(version=self.profile_key))
+        priority_label.setFont(self.parent_window.subtitle_font)
+        priority_layout = QHBoxLayout()
+        priority_layout.addWidget(self.priority_combo)
+        priority_layout.addWidget(self.io_priority_combo)
+        priority_layout.addWidget(self.affinity_input)
+        layout.addWidget(priority_label)
+        layout.addLayout(priority_layout)
+        layout.addSpacing(10)
         layout.addWidget(jvm_args_label)
         layout.addWidget(self.jvm_args_input)
         layout.addSpacing(10)
         layout.addWidget(java_path_label)
         layout.addLayout(java_path_layout)
+        layout.addSpacing(10)
+        layout.addWidget(self.use_cds_checkbox)
+        layout.addWidget(self.background_prefetch_checkbox)
+        layout.addWidget(self.mirror_console_checkbox)
         layout.addStretch()
 
         close_button = AnimatedButton(self.lang_dict.get("save_and_close", "Save & Close"))
@@ -283,9 +342,35 @@ class AdvancedSettingsDialog(QDialog):
         layout.addLayout(button_layout)
 
     def accept(self):
+        try:
+            process_priority.parse_affinity(self.affinity_input.text())
+        except ValueError as e:
+            QMessageBox.warning(self, self.lang_dict.get("invalid_affinity_title", "Invalid CPU List"), str(e))
+            return
         # --- ИСПРАВЛЕНО: Сохраняем значения напрямую в словарь настроек ---
         self.parent_window.settings['jvm_args'] = self.jvm_args_input.text()
         self.parent_window.settings['java_path'] = self.java_path_input.text()
+        self.parent_window.settings['console_mirror_to_log'] = self.mirror_console_checkbox.isChecked()
+        self.parent_window.settings['use_cds'] = self.use_cds_checkbox.isChecked()
+        self.parent_window.settings['background_prefetch'] = self.background_prefetch_checkbox.isChecked()
+        if self.jvm_profile_combo.isEnabled():
+            profiles = self.parent_window.settings.setdefault('jvm_profiles', {})
+            profile_id = self.jvm_profile_combo.currentData()
+            if profile_id == jvm_profiles.PROFILE_AUTO:
+                profiles.pop(self.profile_key, None)
+            else:
+                profiles[self.profile_key] = profile_id
+
+            priority_configs = self.parent_window.settings.setdefault('process_priority', {})
+            priority_config = {
+                "priority": self.priority_combo.currentData(),
+                "io_priority": self.io_priority_combo.currentData(),
+                "affinity": self.affinity_input.text().strip(),
+            }
+            if priority_config == process_priority.DEFAULT_CONFIG:
+                priority_configs.pop(self.profile_key, None)
+            else:
+                priority_configs[self.profile_key] = priority_config
         
         self.parent_window.save_settings() 
         
@@ -300,8 +385,8 @@ class AdvancedSettingsDialog(QDialog):
         accent = self.parent_window.current_accent_color
         self.setStyleSheet(f"""
             QDialog {{ background-color: #282a36; border: 1px solid #44475a; }}
-            QLabel {{ color: #f8f8f2; }}
-            QLineEdit {{
+            QLabel, QCheckBox {{ color: #f8f8f2; }}
+            QLineEdit, QComboBox {{
                 background-color: #44475a;
                 color: #f8f8f2;
                 border: 1px solid #6272a4;
@@ -321,4 +406,150 @@ class AdvancedSettingsDialog(QDialog):
                 background-color: {accent}; 
                 font-weight: bold;
             }}
-        """)
\ No newline at end of file
+        """)
+
+
+class LaunchHistoryDialog(QDialog):
+    PHASE_COLUMNS = ["base_install", "loader_install", "command_build", "spawn"]
+    EVENT_COLUMNS = ["first_output", "ready"]
+    REGRESSION_FACTOR = 1.25
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.parent_window = parent
+        self.lang_dict = resources.LANGUAGES[self.parent_window.current_language]
+        self.setWindowTitle(self.lang_dict.get("launch_history", "Launch History"))
+        self.setMinimumSize(900, 450)
+        self.init_ui()
+        self.apply_styles()
+        self.populate()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setSpacing(15)
+
+        headers = [
+            self.lang_dict.get("history_date", "Date"), self.lang_dict.get("version", "Version"),
+            self.lang_dict.get("history_result", "Result"),
+        ] + [self.lang_dict.get(f"history_{name}", name) for name in self.PHASE_COLUMNS + self.EVENT_COLUMNS] + [
+            self.lang_dict.get("history_heap", "Heap"), self.lang_dict.get("history_peak_ram", "Peak RAM"),
+            self.lang_dict.get("history_ram_growth", "RAM growth"),
+        ]
+        self.table = QTableWidget(0, len(headers))
+        self.table.setHorizontalHeaderLabels(headers)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        layout.addWidget(self.table)
+
+        self.hint_label = QLabel(self.lang_dict.get("history_regression_hint", "Times more than 25% above the median of earlier launches of the same version are highlighted."))
+        self.hint_label.setWordWrap(True)
+        layout.addWidget(self.hint_label)
+
+        export_button = AnimatedButton(self.lang_dict.get("export_json", "Export JSON"))
+        export_button.setFont(self.parent_window.minecraft_font)
+        export_button.clicked.connect(self.export_json)
+        close_button = AnimatedButton(self.lang_dict.get("close", "Close"))
+        close_button.setObjectName("closeButton")
+        close_button.setFont(self.parent_window.minecraft_font)
+        close_button.clicked.connect(self.accept)
+
+        button_layout = QHBoxLayout()
+        button_layout.addWidget(export_button)
+        button_layout.addStretch()
+        button_layout.addWidget(close_button)
+        layout.addLayout(button_layout)
+
+    @staticmethod
+    def _median(values):
+        values = sorted(values)
+        if not values:
+            return None
+        mid = len(values) // 2
+        return values[mid] if len(values) % 2 else (values[mid - 1] + values[mid]) / 2
+
+    def populate(self):
+        launches = launch_timing.load_history()
+        earlier = {}
+        rows = []
+        for record in launches:
+            phases = {}
+            for phase in record.get("phases", []):
+                phases[phase["name"]] = phases.get(phase["name"], 0) + phase["ms"]
+            values = dict(phases, **record.get("events", {}))
+            version_key = (record.get("version_id"), record.get("mod_loader"))
+            previous = earlier.setdefault(version_key, {})
+            regressions = set()
+            for name in self.PHASE_COLUMNS + self.EVENT_COLUMNS:
+                median = self._median(previous.get(name, []))
+                if name in values and median and values[name] > median * self.REGRESSION_FACTOR:
+                    regressions.add(name)
+            if record.get("result") == "success":
+                for name, value in values.items():
+                    previous.setdefault(name, []).append(value)
+            rows.append((record, values, regressions))
+
+        self.table.setRowCount(len(rows))
+        for row, (record, values, regressions) in enumerate(reversed(rows)):
+            cells = [record.get("timestamp", "").replace("T", " "), record.get("version_id", ""), record.get("result", "")]
+            for column, text in enumerate(cells):
+                self.table.setItem(row, column, QTableWidgetItem(text))
+            for offset, name in enumerate(self.PHASE_COLUMNS + self.EVENT_COLUMNS):
+                item = QTableWidgetItem(f"{values[name] / 1000:.2f} s" if name in values else "—")
+                item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                if name in regressions:
+                    item.setForeground(QColor("#ff5555"))
+                self.table.setItem(row, len(cells) + offset, item)
+
+            usage = record.get("resources") or {}
+            resource_cells = [
+                f"{record['memory_gb']} GB" if record.get("memory_gb") else "—",
+                f"{usage['rss_peak_mb']:.0f} MB" if "rss_peak_mb" in usage else "—",
+                f"{usage['rss_growth_mb_per_min']:+.1f} MB/min" if "rss_growth_mb_per_min" in usage else "—",
+            ]
+            first_column = len(cells) + len(self.PHASE_COLUMNS + self.EVENT_COLUMNS)
+            for offset, text in enumerate(resource_cells):
+                item = QTableWidgetItem(text)
+                item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.table.setItem(row, first_column + offset, item)
+
+    def export_json(self):
+        file_path, _ = QFileDialog.getSaveFileName(self, self.lang_dict.get("export_json", "Export JSON"), "launch_history.json", "JSON (*.json)")
+        if not file_path:
+            return
+        try:
+            count = launch_timing.export_history(file_path)
+            self.hint_label.setText(self.lang_dict.get("history_exported", "Exported {count} launches to {path}").format(count=count, path=file_path))
+        except IOError as e:
+            self.hint_label.setText(str(e))
+
+    def apply_styles(self):
+        accent = self.parent_window.current_accent_color
+        self.setStyleSheet(f"""
+            QDialog {{ background-color: #282a36; border: 1px solid #44475a; }}
+            QLabel {{ color: #f8f8f2; }}
+            QTableWidget {{
+                background-color: #44475a;
+                color: #f8f8f2;
+                gridline-color: #6272a4;
+                border: 1px solid #6272a4;
+                border-radius: 5px;
+            }}
+            QHeaderView::section {{ background-color: #282a36; color: #f8f8f2; border: none; padding: 4px; }}
+            QPushButton {{
+                background-color: #44475a;
+                color: #f8f8f2;
+                border: 1px solid #6272a4;
+                border-radius: 5px;
+                padding: 8px 16px;
+            }}
+            #closeButton {{ 
+                color: #282a36; 
+                padding: 8px 16px; 
+                border-radius: 5px; 
+                background-color: {accent}; 
+                font-weight: bold;
+            }}
+        """)
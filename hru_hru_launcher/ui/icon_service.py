@@ -0,0 +1,143 @@
+# hru_hru_launcher/ui/icon_service.py
+import time
+import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from PySide6.QtCore import Qt, QObject, Signal, QBuffer, QByteArray, QIODevice
+from PySide6.QtGui import QImage, QImageReader, QPixmap
+
+from hru_hru_launcher.core.icon_cache import IconDiskCache
+from hru_hru_launcher.utils import helpers
+
+requests = helpers.lazy_import("requests")
+adapters = helpers.lazy_import("requests.adapters")
+
+ICON_SIZE = 64
+MAX_WORKERS = 4
+MEMORY_CACHE_SIZE = 256
+REQUEST_TIMEOUT = 10
+FAILED_RETRY_SECONDS = 60
+USER_AGENT = "HruHruLauncher/1.0 (ImageLoader)"
+
+
+def decode_icon(data, size=ICON_SIZE):
+    """
+    Decodes image bytes directly at thumbnail size (aspect ratio kept), so a
+    large icon is never held at full resolution and cards need no rescaling.
+    Returns a null QImage if the data is not an image.
+    """
+    buffer = QBuffer()
+    buffer.setData(QByteArray(data))
+    buffer.open(QIODevice.ReadOnly)
+    reader = QImageReader(buffer)
+    original = reader.size()
+    if original.isValid():
+        reader.setScaledSize(original.scaled(size, size, Qt.KeepAspectRatio))
+    return reader.read()
+
+
+def _encode_png(image):
+    buffer = QBuffer()
+    buffer.open(QIODevice.WriteOnly)
+    image.save(buffer, "PNG")
+    return bytes(buffer.data())
+
+
+class IconService(QObject):
+    """
+    Loads mod icons for all lists. A small thread pool does the downloads and
+    each URL is downloaded once even when several cards ask for it. Decoded
+    thumbnails are kept in an LRU in memory, and the scaled PNGs are kept on
+    disk between runs.
+    """
+    icon_ready = Signal(str, QPixmap)
+    _image_decoded = Signal(str, QImage)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._memory = OrderedDict()
+        self._in_flight = set()
+        self._failed = {}
+        self._executor = None
+        self._session = None
+        self._disk = None
+        self._image_decoded.connect(self._on_image_decoded, Qt.QueuedConnection)
+
+    def request(self, url):
+        """
+        Returns the thumbnail at once if it is in memory (a null pixmap if the
+        URL failed recently). Otherwise starts loading it and returns None;
+        icon_ready is emitted for the URL when it is done.
+        """
+        if not url:
+            return None
+        pixmap = self._memory.get(url)
+        if pixmap is not None:
+            self._memory.move_to_end(url)
+            return pixmap
+        if time.monotonic() - self._failed.get(url, float("-inf")) < FAILED_RETRY_SECONDS:
+            return QPixmap()
+        if url not in self._in_flight:
+            self._in_flight.add(url)
+            self._ensure_pool()
+            self._executor.submit(self._load, url)
+        return None
+
+    def _ensure_pool(self):
+        if self._executor is not None:
+            return
+        self._disk = IconDiskCache()
+        self._session = requests.Session()
+        self._session.headers["User-Agent"] = USER_AGENT
+        self._session.mount("https://", adapters.HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS))
+        self._executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="icon")
+
+    def _load(self, url):
+        image = QImage()
+        try:
+            data = self._disk.get(url)
+            if data is not None:
+                image = decode_icon(data)
+            if image.isNull():
+                response = self._session.get(url, timeout=REQUEST_TIMEOUT)
+                response.raise_for_status()
+                image = decode_icon(response.content)
+                if not image.isNull():
+                    self._disk.put(url, _encode_png(image))
+        except Exception as e:
+            logging.debug(f"Could not load icon {url}: {e}")
+        self._image_decoded.emit(url, image)
+
+    def _on_image_decoded(self, url, image):
+        self._in_flight.discard(url)
+        if image.isNull():
+            self._failed[url] = time.monotonic()
+            pixmap = QPixmap()
+        else:
+            self._failed.pop(url, None)
+            pixmap = QPixmap.fromImage(image)
+            self._memory[url] = pixmap
+            while len(self._memory) > MEMORY_CACHE_SIZE:
+                self._memory.popitem(last=False)
+        self.icon_ready.emit(url, pixmap)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+_service = None
+
+
+def get_icon_service():
+    global _service
+    if _service is None:
+        _service = IconService()
+    return _service
+
+
+def shutdown():
+    if _service is not None:
+        _service.shutdown()
@@ -3,37 +3,51 @@
 import sys
 import os
 import json
+import time
 import subprocess
 import traceback
 import logging
 import shutil
 from pathlib import Path
-import psutil
 from functools import partial
 
-import requests
-from PySide6.QtCore import (Qt, QThread, Signal, QPropertyAnimation, QEasingCurve, QSize, QPoint, QUrl, QByteArray)
+from PySide6.QtCore import (Qt, QThread, Signal, QPropertyAnimation, QEasingCurve, QSize, QPoint, QUrl, QByteArray, QTimer)
 from PySide6.QtGui import (QFont, QFontDatabase, QIcon, QPixmap, QColor, QStandardItemModel, QStandardItem, QDesktopServices)
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QLineEdit, QPushButton,
-                               QProgressBar, QFrame, QCheckBox, QSlider, QTabWidget, QTextEdit,
+                               QProgressBar, QFrame, QCheckBox, QSlider, QTabWidget,
                                QButtonGroup, QRadioButton, QGraphicsDropShadowEffect, QColorDialog, QListWidget, QListWidgetItem, QMessageBox,
-                               QSizeGrip, QFileDialog, QDialog, QStackedWidget)
-
-import minecraft_launcher_lib
+                               QSizeGrip, QFileDialog, QDialog, QStackedWidget, QTabBar)
 
 from .widgets import AnimatedButton
-from .widgets.mod_list_item import ModListItemWidget
-from .widgets.installed_mod_list_item import InstalledModListItemWidget
+from .widgets.mod_list_view import ModListModel, ModCardListView, ModSearchCardDelegate, InstalledModCardDelegate
 from .widgets.version_selection_dialog import VersionSelectionDialog
 from .widgets.version_list_item import VersionListItemWidget
+from .widgets.console_view import ConsoleView, LEVEL_INFO, LEVEL_WARN, LEVEL_ERROR
+from .widgets.instance_console import InstanceConsole
 from . import themes
-from hru_hru_launcher.core.mc_worker import MinecraftWorker
-from hru_hru_launcher.core import mod_manager
-from hru_hru_launcher.utils.paths import get_assets_dir
+from . import icon_service
+from hru_hru_launcher.core.version_index import get_version_index
+from hru_hru_launcher.core import catalog_cache
+from hru_hru_launcher.core import search_cache
+from hru_hru_launcher.core import version_catalog
+from hru_hru_launcher.core.launch_supervisor import LaunchSupervisor, STOP_WAIT_MS
+from hru_hru_launcher.utils.paths import get_assets_dir, get_minecraft_directory
 from hru_hru_launcher.config import settings
 from hru_hru_launcher.config import resources
 from hru_hru_launcher.utils import helpers
-from .dialogs import FixErrorDialog, UpdateDialog, AdvancedSettingsDialog
+from .dialogs import FixErrorDialog, UpdateDialog, AdvancedSettingsDialog, LaunchHistoryDialog
+
+# Imported on first use so the window shows before the network stack,
+# psutil and minecraft_launcher_lib are loaded.
+requests = helpers.lazy_import("requests")
+psutil = helpers.lazy_import("psutil")
+mc_worker = helpers.lazy_import("hru_hru_launcher.core.mc_worker")
+mod_manager = helpers.lazy_import("hru_hru_launcher.core.mod_manager")
+verifier = helpers.lazy_import("hru_hru_launcher.core.verifier")
+jvm_profiles = helpers.lazy_import("hru_hru_launcher.core.jvm_profiles")
+prefetch = helpers.lazy_import("hru_hru_launcher.core.prefetch")
+process_priority = helpers.lazy_import("hru_hru_launcher.core.process_priority")
+downloader = helpers.lazy_import("hru_hru_launcher.core.downloader")
 
 
 # --- SETTINGS ---
@@ -41,6 +55,7 @@ APP_VERSION = "v1.2.2-beta"
 API_URL = "https://api.github.com/repos/krutoychel24/hru-hru-launcher/releases/latest"
 DOWNLOAD_URL_TEMPLATE = "https://github.com/krutoychel24/hru-hru-launcher/releases/download/{tag}/{filename}"
 MODS_PER_PAGE = 20
+PREFETCH_DELAY_MS = 1500
 # --- SETTINGS ---
 
 class UpdateCheckWorker(QThread):
@@ -65,9 +80,9 @@ class UpdateCheckWorker(QThread):
             self.error_occurred.emit(f"An error occurred while checking for updates: {e}")
 
 class ModSearchWorker(QThread):
-    finished = Signal(list, int)
+    results_ready = Signal(list, int)
 
-    def __init__(self, query, game_version, loader, sort_option, lang_dict, offset, parent=None):
+    def __init__(self, query, game_version, loader, sort_option, lang_dict, offset, generation=0, parent=None):
         super().__init__(parent)
         self.query = query
         self.game_version = game_version
@@ -75,14 +90,26 @@ class ModSearchWorker(QThread):
         self.sort_option = sort_option
         self.lang_dict = lang_dict
         self.offset = offset
+        self.generation = generation
+
+    @property
+    def cache_key(self):
+        return (self.query, self.game_version, self.loader, self.sort_option, self.offset)
 
     def run(self):
+        if self.isInterruptionRequested():
+            # Superseded by a newer query before it reached the network
+            self.results_ready.emit([], 0)
+            return
         logging.info(f"Starting mod search: query='{self.query}', offset='{self.offset}'")
         hits, total_hits = mod_manager.search_mods(
             self.query, self.game_version, self.loader, self.lang_dict, self.sort_option, self.offset
         )
         logging.info(f"Mod search finished, found {len(hits)} results out of {total_hits}.")
-        self.finished.emit(hits, total_hits)
+        # search_mods reports errors as an empty page, so empty pages are not cached
+        if hits or total_hits:
+            search_cache.get_search_cache().put(self.cache_key, hits, total_hits)
+        self.results_ready.emit(hits, total_hits)
 
 
 class ModDownloadWorker(QThread):
@@ -156,6 +183,7 @@ class LocalModsScannerWorker(QThread):
         self.installed_mods_data = installed_mods_data
 
     def run(self):
+        process_priority.enter_background()
         mods = mod_manager.scan_local_mods(self.mods_folder, self.lang_dict, self.installed_mods_data)
         self.finished.emit(mods)
 
@@ -181,11 +209,13 @@ class VersionSizeScannerWorker(QThread):
         return total
 
     def run(self):
+        process_priority.enter_background()
         sizes = {}
         total_size = 0
         for version_id in self.version_ids:
             if self.isInterruptionRequested():
                 return
+            process_priority.sync_background_priority()
             version_path = os.path.join(self.versions_path, version_id)
             if os.path.isdir(version_path):
                 size = self.get_dir_size(version_path)
@@ -196,18 +226,59 @@ class VersionSizeScannerWorker(QThread):
             self.finished.emit(sizes, total_size)
 
 
+class VersionRepairWorker(QThread):
+    progress_update = Signal(int, int, str)
+    log_message = Signal(str)
+    finished = Signal(str, object)
+
+    def __init__(self, version_id, minecraft_dir, lang_dict, parent=None):
+        super().__init__(parent)
+        self.version_id = version_id
+        self.minecraft_dir = minecraft_dir
+        self.lang_dict = lang_dict
+        self._is_running = True
+
+    def stop(self):
+        self._is_running = False
+
+    def run(self):
+        status_text = self.lang_dict.get("repair", "Repair")
+        callback = {
+            "setStatus": lambda text: self.progress_update.emit(0, 0, text),
+            "setProgress": lambda value, max_value: self.progress_update.emit(value, max_value, status_text),
+        }
+        try:
+            repaired = verifier.repair_version(
+                self.version_id, self.minecraft_dir, callback, lambda: self._is_running, log=self.log_message.emit
+            )
+            self.finished.emit("success", repaired)
+        except downloader.DownloadCancelled:
+            self.finished.emit("cancelled", None)
+        except Exception as e:
+            logging.error(f"Repair of {self.version_id} failed: {traceback.format_exc()}")
+            self.finished.emit("error", str(e))
+
+
 class MinecraftLauncher(QWidget):
-    def __init__(self):
+    def __init__(self, started_at=None):
         super().__init__()
+        build_started = time.monotonic()
+        self.started_at = started_at or build_started
         self.total_system_memory = 16
-        self.worker = None
+        self.foreground_instance_id = None
+        self.instance_consoles = {}
+        self.repair_worker = None
         self.version_loader = None
-        self.mod_search_worker = None
+        self.mod_page_fetches = {}
+        self.mod_search_key = None
+        self.mod_search_generation = 0
+        self.mod_search_typed_at = None
+        self.mod_search_started_at = None
+        self.mod_results_shown = (None, None)
         self.update_check_worker = None
         self.local_mods_scanner = None
         self.version_size_scanner = None
         self.mod_download_workers = {}
-        self.mod_list_item_map = {}
         self.version_widget_map = {}
         self.mod_current_page = 1
         self.mod_total_hits = 0
@@ -219,25 +290,26 @@ class MinecraftLauncher(QWidget):
         self.update_status_info = {"text": "Click to check for updates", "is_update_available": False}
 
         self.settings = settings.load_settings()
+        self.launch_supervisor = LaunchSupervisor(self.settings.get("max_instances", 4))
 
         self.current_language = self.settings.get("language", "en")
         self.lang_dict = resources.LANGUAGES[self.current_language]
         self.current_accent_color = self.settings.get("accent_color", "#1DB954")
         self.current_version_type = self.settings.get("version_type", "vanilla")
 
-        self.minecraft_directory = minecraft_launcher_lib.utils.get_minecraft_directory()
+        self.minecraft_directory = get_minecraft_directory()
         if self.minecraft_directory:
             os.makedirs(self.minecraft_directory, exist_ok=True)
             self.installed_mods_path = os.path.join(self.minecraft_directory, "installed_mods.json")
         else:
             self.installed_mods_path = ""
+        self.version_index = get_version_index(self.minecraft_directory)
         
         self.init_fonts()
         self.init_icons()
         self.init_ui()
 
         self.tab_widget.currentChanged.connect(self.on_tab_changed)
-        self.prepare_updater()
         self.update_version_display()
 
         self.old_pos = None
@@ -247,11 +319,7 @@ class MinecraftLauncher(QWidget):
         self.fade_in_animation.setStartValue(0)
         self.fade_in_animation.setEndValue(1)
         self.fade_in_animation.setEasingCurve(QEasingCurve.OutCubic)
-        
-        self.update_pagination_controls()
-        
-        self.update_mod_list()
-        self.refresh_installed_mods()
+        self.build_time = time.monotonic() - build_started
 
     def init_fonts(self):
         assets_dir = get_assets_dir()
@@ -347,7 +415,9 @@ class MinecraftLauncher(QWidget):
         self.tab_widget.setCurrentIndex(self.settings.get("last_tab", 0))
         
     def start_minecraft(self):
-        if self.worker and self.worker.isRunning():
+        if self.foreground_instance_id is not None:
+            return
+        if self.repair_worker and self.repair_worker.isRunning():
             return
         
         username = self.user_input.text()
@@ -355,45 +425,65 @@ class MinecraftLauncher(QWidget):
             self.error_label.setText(self.lang_dict["enter_username_error"])
             self.error_label.setVisible(True)
             return
+        if not self.launch_supervisor.can_launch():
+            self.error_label.setText(self.lang_dict.get("max_instances_reached", "{count} game instances are already running.").format(count=self.launch_supervisor.max_instances))
+            self.error_label.setVisible(True)
+            return
 
         self.launch_control_stack.setCurrentIndex(1)
         self.error_label.setVisible(False)
         self.progress_bar.setValue(0)
         
-        console_widget = self.console_output.parentWidget()
-        console_index = self.tab_widget.indexOf(console_widget)
+        console_index = self.tab_widget.indexOf(self.console_tab_widget)
         if console_index != -1:
             self.tab_widget.setCurrentIndex(console_index)
         
         jvm_args_list = self.settings.get("jvm_args", "").split()
         java_path = self.settings.get("java_path", None)
+        selected_version = self.version_combo.currentData(Qt.UserRole)
+        if not selected_version:
+            self.on_launch_finished("error", {"type": "generic", "message": "Game version not selected."})
+            return
+        profile_key = jvm_profiles.config_key(self.current_version_type, selected_version)
         options = {
             "executablePath": java_path,
             "jvmArguments": jvm_args_list,
+            "jvmProfile": self.settings.get("jvm_profiles", {}).get(profile_key, jvm_profiles.PROFILE_AUTO),
+            "useCds": self.settings.get("use_cds", False),
+            "resourceSampleInterval": self.settings.get("resource_sample_interval_ms", 1000),
+            "processPriority": self.settings.get("process_priority", {}).get(profile_key),
             "resolutionWidth": self.resolution_width_input.text(),
             "resolutionHeight": self.resolution_height_input.text(),
         }
-        selected_version = self.version_combo.currentData(Qt.UserRole)
-        if not selected_version:
-            self.on_launch_finished("error", {"type": "generic", "message": "Game version not selected."})
-            return
 
         mod_loader = self.current_version_type if self.current_version_type != "vanilla" else None
+        if not prefetch.get_prefetch_manager().find(self.minecraft_directory, selected_version, mod_loader):
+            prefetch.get_prefetch_manager().cancel()
         
-        self.worker = MinecraftWorker(
+        worker = mc_worker.MinecraftWorker(
             mc_version=selected_version, username=username, minecraft_dir=self.minecraft_directory,
             client_token=self.settings.get("clientToken"), memory_gb=self.memory_slider.value(),
             fullscreen=self.fullscreen_checkbox.isChecked(), options=options,
             lang=self.current_language, mod_loader=mod_loader,
         )
-        self.worker.progress_update.connect(self.update_progress)
-        self.worker.log_message.connect(self.log_to_console)
-        self.worker.finished.connect(self.on_launch_finished)
-        self.worker.start()
+        instance = self.launch_supervisor.add(worker, selected_version, username)
+        self.foreground_instance_id = instance.id
+        self.add_instance_console(instance)
+        worker.progress_update.connect(partial(self.on_instance_progress, instance.id))
+        worker.log_message.connect(partial(self.log_to_instance, instance.id))
+        worker.output_batch.connect(partial(self.log_lines_to_instance, instance.id))
+        worker.process_started.connect(partial(self.on_instance_process_started, instance.id))
+        worker.finished.connect(partial(self.on_instance_finished, instance.id))
+        worker.start()
         
     def cancel_launch(self):
-        if self.worker and self.worker.isRunning():
-            self.worker.stop()
+        running = [w for w in (self.repair_worker,) if w and w.isRunning()]
+        foreground = self.launch_supervisor.get(self.foreground_instance_id)
+        if foreground and foreground.is_active():
+            running.append(foreground.worker)
+        for worker in running:
+            worker.stop()
+        if running:
             self.cancel_button.setEnabled(False)
             self.cancel_button.setText(self.lang_dict.get("cancelling", "Cancelling..."))
 
@@ -463,6 +553,12 @@ class MinecraftLauncher(QWidget):
         self.version_combo.setFont(self.minecraft_font)
         self.version_combo.setFixedHeight(40)
         self.version_combo.setIconSize(QSize(16, 16))
+        # Only versions the user picks are prefetched, not the selection churn while the list loads
+        self.version_combo.activated.connect(self.on_version_activated)
+        self.prefetch_debounce = QTimer(self)
+        self.prefetch_debounce.setSingleShot(True)
+        self.prefetch_debounce.setInterval(PREFETCH_DELAY_MS)
+        self.prefetch_debounce.timeout.connect(self.on_version_selected)
         self.username_label = QLabel()
         self.username_label.setFont(self.subtitle_font)
         self.username_label.setObjectName("sectionLabel")
@@ -543,17 +639,51 @@ class MinecraftLauncher(QWidget):
         self.progress_bar.setMaximum(max_val)
         self.progress_bar.setValue(current)
 
+    def on_instance_progress(self, instance_id, current, max_val, status):
+        if instance_id == self.foreground_instance_id:
+            self.update_progress(current, max_val, status)
+
+    def on_instance_process_started(self, instance_id, pid):
+        """The game process is up: its console keeps running and the launch panel is free for another launch."""
+        instance = self.launch_supervisor.get(instance_id)
+        if instance:
+            instance.attach_process(pid)
+        if instance_id == self.foreground_instance_id:
+            self.foreground_instance_id = None
+            self.reset_launch_controls()
+        self.refresh_instance_status()
+        if not self.instance_monitor_timer.isActive():
+            self.instance_monitor_timer.start()
+
+    def on_instance_finished(self, instance_id, result, details=None):
+        instance = self.launch_supervisor.finish(instance_id, result)
+        view = self.instance_consoles.get(instance_id)
+        if view:
+            view.console.flush_now()
+            view.set_stopped(self.lang_dict.get(f"instance_{result}", result))
+            if instance:
+                view.set_status(self.describe_instance(instance))
+        if instance_id == self.foreground_instance_id:
+            self.foreground_instance_id = None
+        if not self.launch_supervisor.has_active():
+            self.instance_monitor_timer.stop()
+        self.on_launch_finished(result, details)
+
+    def reset_launch_controls(self):
+        self.launch_control_stack.setCurrentIndex(0)
+        self.cancel_button.setEnabled(True)
+        self.cancel_button.setText(self.lang_dict.get("cancel", "Cancel"))
+
     def on_launch_finished(self, result, details=None):
         lang = self.lang_dict
 
-        self.launch_control_stack.setCurrentIndex(0)
+        if self.foreground_instance_id is None:
+            self.reset_launch_controls()
 
         if result == "success":
-            if self.close_launcher_checkbox.isChecked():
+            if self.close_launcher_checkbox.isChecked() and not self.launch_supervisor.has_active():
                 self.close()
             return
-        self.cancel_button.setEnabled(True)
-        self.cancel_button.setText(lang.get("cancel", "Cancel"))
         
         if result == "cancelled":
             self.log_to_console("Launch cancelled.")
@@ -577,7 +707,7 @@ class MinecraftLauncher(QWidget):
                 version_id = details.get("version_id", "selected")
                 dialog = FixErrorDialog(lang["error_file_corruption_title"], lang["error_file_corruption_desc"].format(version_id=version_id), lang["error_file_corruption_fix"], lang, self)
                 if dialog.exec() == QDialog.Accepted:
-                    self.reinstall_version(version_id)
+                    self.repair_version(version_id)
             elif error_type == "invalid_java_path":
                 dialog = FixErrorDialog(lang["error_java_path_title"], lang["error_java_path_desc"], lang["error_java_path_fix"], lang, self)
                 if dialog.exec() == QDialog.Accepted:
@@ -597,17 +727,34 @@ class MinecraftLauncher(QWidget):
         self.tab_widget = QTabWidget()
         self.tab_widget.setFont(self.minecraft_font)
         self.tab_widget.setObjectName("tabWidget")
+        self.deferred_tabs = {}
         
         self.create_news_tab()
-        self.create_mods_tab()
-        self.create_versions_tab()
-        self.create_modpacks_tab()
+        self.mods_tab_widget = self.add_deferred_tab(self.mods_icon, self.create_mods_tab)
+        self.versions_tab_widget = self.add_deferred_tab(self.manage_versions_icon, self.create_versions_tab)
+        self.modpacks_tab_widget = self.add_deferred_tab(self.modpacks_icon, self.create_modpacks_tab)
         self.create_vpn_tab()
         self.create_console_tab()
         self.create_settings_tab()
 
         content_layout.addWidget(self.tab_widget)
 
+    def add_deferred_tab(self, icon, builder):
+        """Adds an empty page; builder(page) fills it the first time the tab is opened."""
+        page = QWidget()
+        self.deferred_tabs[page] = builder
+        self.tab_widget.addTab(page, icon, "")
+        return page
+
+    def ensure_tab_built(self, page):
+        builder = self.deferred_tabs.pop(page, None)
+        if builder is None:
+            return
+        started = time.monotonic()
+        builder(page)
+        self.update_ui_text()
+        logging.info(f"Built tab {self.tab_widget.indexOf(page)} in {(time.monotonic() - started) * 1000:.0f} ms.")
+
     def create_settings_tab(self):
         self.settings_tab_widget = QWidget()
         settings_layout = QVBoxLayout(self.settings_tab_widget)
@@ -639,17 +786,9 @@ class MinecraftLauncher(QWidget):
         self.memory_label.setFont(self.subtitle_font)
         self.memory_slider = QSlider(Qt.Horizontal)
 
-        try:
-            self.total_system_memory = int(psutil.virtual_memory().total / (1024**3))
-            self.memory_slider.setRange(1, self.total_system_memory)
-        except Exception as e:
-            logging.error(f"Unable to determine RAM capacity: {e}")
-            self.total_system_memory = 16
-            self.memory_slider.setRange(1, self.total_system_memory)
-
+        # The real limit comes from detect_system_memory once the window is up
         current_mem = self.settings.get("memory", 4)
-        if current_mem > self.total_system_memory:
-            current_mem = self.total_system_memory
+        self.memory_slider.setRange(1, max(self.total_system_memory, current_mem))
         self.memory_slider.setValue(current_mem)
 
         self.memory_slider.setTickPosition(QSlider.TicksBelow)
@@ -704,6 +843,15 @@ class MinecraftLauncher(QWidget):
         
         self.tab_widget.addTab(self.settings_tab_widget, self.settings_icon, "")
 
+    def detect_system_memory(self):
+        try:
+            self.total_system_memory = int(psutil.virtual_memory().total / (1024**3))
+        except Exception as e:
+            logging.error(f"Unable to determine RAM capacity: {e}")
+            self.total_system_memory = 16
+        # setRange clamps a saved value above the installed RAM
+        self.memory_slider.setRange(1, self.total_system_memory)
+
     def create_placeholder_tab(self, icon, tab_name):
         widget = QWidget()
         widget.setObjectName(tab_name)
@@ -720,9 +868,8 @@ class MinecraftLauncher(QWidget):
     def create_news_tab(self):
         self.create_placeholder_tab(self.news_icon, "news")
 
-    def create_mods_tab(self):
-        self.mods_tab_widget = QWidget()
-        main_layout = QVBoxLayout(self.mods_tab_widget)
+    def create_mods_tab(self, page):
+        main_layout = QVBoxLayout(page)
         main_layout.setContentsMargins(0,0,0,0)
 
         self.mods_sub_tabs = QTabWidget()
@@ -739,7 +886,7 @@ class MinecraftLauncher(QWidget):
         self.mod_sort_label = QLabel()
         self.mod_sort_combo = QComboBox()
         self.mod_refresh_button = QPushButton()
-        self.mod_refresh_button.clicked.connect(lambda: self.update_mod_list(reset_page=True))
+        self.mod_refresh_button.clicked.connect(lambda: self.update_mod_list(reset_page=True, force=True))
         
         filters_layout.addWidget(self.mod_sort_label)
         filters_layout.addWidget(self.mod_sort_combo)
@@ -749,11 +896,20 @@ class MinecraftLauncher(QWidget):
         self.mod_search_input = QLineEdit()
         self.mod_search_input.setObjectName("modSearchInput")
         self.mod_search_input.setFixedHeight(35)
-        self.mod_search_input.returnPressed.connect(lambda: self.update_mod_list(reset_page=True))
-
-        self.mod_results_list = QListWidget()
-        self.mod_results_list.setObjectName("modList")
-        self.mod_results_list.setSpacing(5)
+        self.mod_search_input.returnPressed.connect(self.on_mod_search_submitted)
+        self.mod_search_input.textEdited.connect(self.on_mod_search_text_edited)
+        self.mod_search_debounce = QTimer(self)
+        self.mod_search_debounce.setSingleShot(True)
+        self.mod_search_debounce.setInterval(self.settings.get("mod_search_debounce_ms", 300))
+        self.mod_search_debounce.timeout.connect(lambda: self.update_mod_list(reset_page=True))
+
+        self.mod_results_model = ModListModel("project_id", self)
+        self.mod_search_delegate = ModSearchCardDelegate(self.lang_dict, parent=self)
+        self.mod_search_delegate.install_requested.connect(self.start_mod_download)
+        self.mod_search_delegate.delete_requested.connect(self.delete_mod)
+        self.mod_results_list = ModCardListView()
+        self.mod_results_list.setModel(self.mod_results_model)
+        self.mod_results_list.setItemDelegate(self.mod_search_delegate)
 
         pagination_layout = QHBoxLayout()
         self.prev_page_button = QPushButton("<")
@@ -786,9 +942,15 @@ class MinecraftLauncher(QWidget):
         self.refresh_installed_button.clicked.connect(self.refresh_installed_mods)
         installed_top_bar.addWidget(self.refresh_installed_button)
 
-        self.installed_mods_list = QListWidget()
-        self.installed_mods_list.setObjectName("modList")
-        self.installed_mods_list.setSpacing(5)
+        self.installed_mods_model = ModListModel("filepath", self)
+        self.installed_mod_delegate = InstalledModCardDelegate(
+            self.lang_dict, main_font=self.minecraft_font, bold_font=self.subtitle_font, parent=self
+        )
+        self.installed_mod_delegate.delete_requested.connect(self.handle_mod_delete)
+        self.installed_mod_delegate.toggle_requested.connect(self.handle_mod_toggle)
+        self.installed_mods_list = ModCardListView()
+        self.installed_mods_list.setModel(self.installed_mods_model)
+        self.installed_mods_list.setItemDelegate(self.installed_mod_delegate)
         
         # --- Common bottom bar button for both tabs ---
         open_mods_folder_button_search = QPushButton()
@@ -825,12 +987,11 @@ class MinecraftLauncher(QWidget):
         self.mods_sub_tabs.addTab(search_widget, "")
         self.mods_sub_tabs.addTab(installed_widget, "")
 
-        self.tab_widget.addTab(self.mods_tab_widget, self.mods_icon, "")
         self.mods_sub_tabs.currentChanged.connect(self.on_mods_sub_tab_changed)
+        self.update_pagination_controls()
     
-    def create_versions_tab(self):
-        self.versions_tab_widget = QWidget()
-        versions_layout = QVBoxLayout(self.versions_tab_widget)
+    def create_versions_tab(self, page):
+        versions_layout = QVBoxLayout(page)
         versions_layout.setContentsMargins(10, 10, 10, 10)
         versions_layout.setSpacing(10)
 
@@ -846,7 +1007,7 @@ class MinecraftLauncher(QWidget):
         top_bar_layout.addStretch()
         
         self.refresh_versions_button = QPushButton()
-        self.refresh_versions_button.clicked.connect(self.refresh_installed_versions_list)
+        self.refresh_versions_button.clicked.connect(lambda: self.refresh_installed_versions_list(force=True))
         top_bar_layout.addWidget(self.refresh_versions_button)
         
         size_info_layout = QHBoxLayout()
@@ -865,12 +1026,9 @@ class MinecraftLauncher(QWidget):
         versions_layout.addLayout(size_info_layout)
         versions_layout.addWidget(self.installed_versions_list, 1)
 
-        self.tab_widget.addTab(self.versions_tab_widget, self.manage_versions_icon, "")
-
-    def create_modpacks_tab(self):
-        widget = QWidget()
-        widget.setObjectName("modpacks")
-        layout = QVBoxLayout(widget)
+    def create_modpacks_tab(self, page):
+        page.setObjectName("modpacks")
+        layout = QVBoxLayout(page)
         layout.setContentsMargins(10, 10, 10, 10)
         self.modpacks_tab_label = QLabel()
         self.modpacks_tab_label.setObjectName("wipLabel")
@@ -889,26 +1047,107 @@ class MinecraftLauncher(QWidget):
         layout.addWidget(self.modpacks_tab_label)
         layout.addStretch()
         layout.addLayout(bottom_bar_layout)
-        self.tab_widget.addTab(widget, self.modpacks_icon, "")
 
     def create_vpn_tab(self):
         self.create_placeholder_tab(self.vpn_icon, "vpn")
 
     def create_console_tab(self):
         console_widget = QWidget()
+        self.console_tab_widget = console_widget
         console_layout = QVBoxLayout(console_widget)
+        console_top_bar = QHBoxLayout()
         self.clear_console_button = AnimatedButton("")
         self.clear_console_button.setFont(self.minecraft_font)
         self.clear_console_button.setFixedHeight(35)
         self.clear_console_button.clicked.connect(self.clear_console)
-        self.console_output = QTextEdit()
+        self.console_filter_combo = QComboBox()
+        self.console_filter_combo.setFont(self.minecraft_font)
+        self.console_filter_combo.setFixedHeight(35)
+        self.console_filter_combo.currentIndexChanged.connect(self.on_console_filter_changed)
+        self.launch_history_button = AnimatedButton("")
+        self.launch_history_button.setFont(self.minecraft_font)
+        self.launch_history_button.setFixedHeight(35)
+        self.launch_history_button.clicked.connect(self.open_launch_history)
+        console_top_bar.addWidget(self.clear_console_button, 1)
+        console_top_bar.addWidget(self.launch_history_button)
+        console_top_bar.addWidget(self.console_filter_combo)
+        self.console_output = ConsoleView(max_lines=self.settings.get("console_max_lines", 5000))
         self.console_output.setFont(QFont("Consolas", 9))
         self.console_output.setObjectName("consoleOutput")
-        self.console_output.setReadOnly(True)
-        console_layout.addWidget(self.clear_console_button)
-        console_layout.addWidget(self.console_output)
+        self.console_tabs = QTabWidget()
+        self.console_tabs.setFont(self.minecraft_font)
+        self.console_tabs.setTabsClosable(True)
+        self.console_tabs.tabCloseRequested.connect(self.close_instance_console)
+        self.console_tabs.addTab(self.console_output, "")
+        self.console_tabs.tabBar().setTabButton(0, QTabBar.RightSide, None)
+        console_layout.addLayout(console_top_bar)
+        console_layout.addWidget(self.console_tabs)
         self.tab_widget.addTab(console_widget, self.console_icon, "")
 
+        self.instance_monitor_timer = QTimer(self)
+        self.instance_monitor_timer.setInterval(max(1000, self.settings.get("resource_sample_interval_ms", 1000)))
+        self.instance_monitor_timer.timeout.connect(self.refresh_instance_status)
+
+    def add_instance_console(self, instance):
+        view = InstanceConsole(instance.id, self.settings.get("console_max_lines", 5000), self.minecraft_font)
+        view.console.set_min_level(self.console_output.min_level)
+        view.stop_button.setText(self.lang_dict.get("stop_instance", "Stop"))
+        view.set_status(self.describe_instance(instance))
+        view.set_accent_color(self.current_accent_color)
+        view.stop_requested.connect(self.stop_instance)
+        self.instance_consoles[instance.id] = view
+        self.console_tabs.addTab(view, f"#{instance.id} {instance.username} · {instance.mc_version}")
+        self.console_tabs.setCurrentWidget(view)
+        return view
+
+    def close_instance_console(self, index):
+        view = self.console_tabs.widget(index)
+        if not isinstance(view, InstanceConsole):
+            return
+        instance = self.launch_supervisor.get(view.instance_id)
+        if instance and instance.is_active():
+            self.stop_instance(view.instance_id)
+            return
+        self.launch_supervisor.remove(view.instance_id)
+        self.instance_consoles.pop(view.instance_id, None)
+        self.console_tabs.removeTab(index)
+        view.deleteLater()
+
+    def stop_instance(self, instance_id):
+        self.launch_supervisor.stop(instance_id)
+        view = self.instance_consoles.get(instance_id)
+        if view:
+            view.set_stopped(self.lang_dict.get("cancelling", "Cancelling..."))
+
+    def describe_instance(self, instance):
+        lang = self.lang_dict
+        if instance.state == "starting":
+            return lang.get("instance_starting", "Starting...")
+        usage = instance.usage() if instance.state == "running" else None
+        if not usage:
+            text = f"PID {instance.pid}" if instance.pid else ""
+            if instance.peak_rss:
+                text += f" · {lang.get('instance_peak_ram', 'peak RAM')} {helpers.format_size(instance.peak_rss)}"
+            return text
+        minutes, seconds = divmod(int(usage["uptime"]), 60)
+        return (f"PID {instance.pid} · CPU {usage['cpu_percent']:.0f}% · RAM {helpers.format_size(usage['rss'])}"
+                f" ({lang.get('instance_peak_ram', 'peak RAM')} {helpers.format_size(usage['peak_rss'])}) · {minutes:02d}:{seconds:02d}")
+
+    def refresh_instance_status(self):
+        for instance in self.launch_supervisor.active():
+            view = self.instance_consoles.get(instance.id)
+            if view:
+                view.set_status(self.describe_instance(instance))
+                if instance.sampler:
+                    view.update_resources(instance.sampler.snapshot())
+
+    def on_console_filter_changed(self, index):
+        level = self.console_filter_combo.itemData(index)
+        if level is not None:
+            self.console_output.set_min_level(level)
+            for view in self.instance_consoles.values():
+                view.console.set_min_level(level)
+
     def prev_mod_page(self):
         if self.mod_current_page > 1:
             self.mod_current_page -= 1
@@ -928,11 +1167,27 @@ class MinecraftLauncher(QWidget):
         self.next_page_button.setEnabled(is_next_enabled)
         self.next_page_button.setStyleSheet("opacity: 1.0;" if is_next_enabled else "opacity: 0.4;")
 
-    def update_mod_list(self, reset_page=True):
-        if self.mod_search_worker and self.mod_search_worker.isRunning():
-            return
+    def on_mod_search_text_edited(self, text):
+        """Search as you type: every keystroke restarts the debounce timer, so only a pause in typing sends a query."""
+        self.mod_search_typed_at = time.monotonic()
+        self.mod_search_debounce.start()
+
+    def on_mod_search_submitted(self):
+        self.mod_search_debounce.stop()
+        self.update_mod_list(reset_page=True)
+
+    def update_mod_list(self, reset_page=True, force=False):
+        """
+        Shows a search page, from the search cache when possible. force (the
+        Refresh button) skips the cache. Every call starts a new search
+        generation; results that arrive for an older one are not shown.
+        """
+        self.mod_search_debounce.stop()
+        self.mod_search_generation += 1
+        self.mod_search_started_at = time.monotonic()
         if reset_page:
             self.mod_current_page = 1
+        self.mod_search_key = None
         query = self.mod_search_input.text()
         game_version_full = self.version_combo.currentData(Qt.UserRole)
         if not game_version_full:
@@ -941,59 +1196,110 @@ class MinecraftLauncher(QWidget):
         game_version = game_version_full.split('-')[0]
         loader = self.current_version_type
         if loader == "vanilla":
-            self.mod_results_list.clear()
-            item = QListWidgetItem(self.lang_dict["select_mod_loader"])
-            item.setTextAlignment(Qt.AlignCenter)
-            self.mod_results_list.addItem(item)
+            self.mod_results_model.set_message(self.lang_dict["select_mod_loader"])
             return
         sort_option = self.mod_sort_combo.currentData() or "downloads"
         offset = (self.mod_current_page - 1) * MODS_PER_PAGE
+        key = (query, game_version, loader, sort_option, offset)
+        self.mod_search_key = key
+        self.cancel_superseded_mod_searches(key)
+
+        cached = None if force else search_cache.get_search_cache().get(key)
+        if cached:
+            self.on_mod_search_finished(cached.hits, cached.total_hits)
+            if not cached.fresh:
+                self.fetch_mod_page(key)
+            return
+
         self.mod_refresh_button.setEnabled(False)
-        self.mod_results_list.clear()
-        item = QListWidgetItem(self.lang_dict.get("searching", "Searching..."))
-        item.setTextAlignment(Qt.AlignCenter)
-        self.mod_results_list.addItem(item)
-        self.mod_search_worker = ModSearchWorker(query, game_version, loader, sort_option, self.lang_dict, offset, self)
-        self.mod_search_worker.finished.connect(self.on_mod_search_finished)
-        self.mod_search_worker.start()
+        self.mod_results_model.set_message(self.lang_dict.get("searching", "Searching..."))
+        self.fetch_mod_page(key)
+
+    def fetch_mod_page(self, key):
+        """Returns the running search for a page key, starting one if there is none. Results land in the search cache."""
+        worker = self.mod_page_fetches.get(key)
+        if worker is None or not worker.isRunning() or worker.isInterruptionRequested():
+            query, game_version, loader, sort_option, offset = key
+            worker = ModSearchWorker(query, game_version, loader, sort_option, self.lang_dict, offset, self.mod_search_generation, self)
+            worker.results_ready.connect(partial(self.on_mod_page_fetched, key, worker))
+            worker.finished.connect(worker.deleteLater)
+            self.mod_page_fetches[key] = worker
+            worker.start()
+        return worker
+
+    def cancel_superseded_mod_searches(self, key):
+        """
+        Asks searches for other queries to stop. One that has not sent its
+        request yet returns at once; one already waiting on Modrinth still
+        fills the cache, but on_mod_page_fetched does not show it.
+        """
+        for fetch_key, worker in self.mod_page_fetches.items():
+            if fetch_key[:4] != key[:4]:
+                worker.requestInterruption()
+
+    def on_mod_page_fetched(self, key, worker, results, total_hits):
+        if self.mod_page_fetches.get(key) is worker:
+            del self.mod_page_fetches[key]
+        if worker.isInterruptionRequested() and not results:
+            return
+        if key != self.mod_search_key:
+            # A prefetched next page or a search the user has moved on from; it is in the cache now
+            logging.debug(f"Search generation {worker.generation} finished after generation {self.mod_search_generation} started; not shown.")
+            return
+        shown_key, shown_results = self.mod_results_shown
+        if shown_key == key and (results == shown_results or not results):
+            # Background refresh of a stale page: nothing changed, or the refresh failed and the old page stays
+            return
+        self.on_mod_search_finished(results, total_hits)
+
+    def prefetch_next_mod_page(self):
+        if not self.mod_search_key:
+            return
+        query, game_version, loader, sort_option, offset = self.mod_search_key
+        next_offset = offset + MODS_PER_PAGE
+        if next_offset >= self.mod_total_hits:
+            return
+        next_key = (query, game_version, loader, sort_option, next_offset)
+        cached = search_cache.get_search_cache().get(next_key)
+        if not cached or not cached.fresh:
+            self.fetch_mod_page(next_key)
+
+    def report_mod_search_latency(self):
+        """Logs how long the current search took to render, from the last keystroke when it was typed."""
+        now = time.monotonic()
+        request_ms = (now - self.mod_search_started_at) * 1000 if self.mod_search_started_at else 0
+        if self.mod_search_typed_at is not None:
+            typed_ms = (now - self.mod_search_typed_at) * 1000
+            logging.info(f"Mod search rendered {typed_ms:.0f} ms after the last keystroke "
+                         f"(debounce {max(0.0, typed_ms - request_ms):.0f} ms, search {request_ms:.0f} ms, generation {self.mod_search_generation}).")
+        else:
+            logging.info(f"Mod search rendered in {request_ms:.0f} ms (generation {self.mod_search_generation}).")
+        self.mod_search_typed_at = None
+        self.mod_search_started_at = None
 
     def on_mod_search_finished(self, results, total_hits):
+        if self.mod_search_started_at is not None:
+            self.report_mod_search_latency()
+        self.mod_results_shown = (self.mod_search_key, results)
         self.mod_total_hits = total_hits
-        self.mod_results_list.clear()
-        self.mod_list_item_map.clear()
         self.mod_refresh_button.setEnabled(True)
         try:
             game_version = self.version_combo.currentData(Qt.UserRole).split('-')[0]
         except (AttributeError, IndexError):
             game_version = None
         if not results:
-            item = QListWidgetItem(self.lang_dict["no_mods_found"])
-            item.setTextAlignment(Qt.AlignCenter)
-            self.mod_results_list.addItem(item)
+            self.mod_results_model.set_message(self.lang_dict["no_mods_found"])
         else:
-            installed_mods = self.get_installed_mods_info()
-            for mod_data in results:
-                project_id = mod_data.get("project_id")
-                is_installed = project_id in installed_mods
-                item = QListWidgetItem()
-                item.setSizeHint(QSize(0, 84))
-                card_widget = ModListItemWidget(mod_data, self.lang_dict, is_installed, game_version)
-                card_widget.install_requested.connect(self.start_mod_download)
-                card_widget.page_requested.connect(self.open_mod_page)
-                card_widget.delete_requested.connect(self.delete_mod)
-                self.mod_results_list.addItem(item)
-                self.mod_results_list.setItemWidget(item, card_widget)
-                self.mod_list_item_map[project_id] = card_widget
+            self.mod_search_delegate.game_version = game_version
+            self.mod_results_model.set_mods(results, self.get_installed_mods_info().keys())
         self.update_pagination_controls()
+        self.prefetch_next_mod_page()
 
     def refresh_installed_mods(self):
         if self.local_mods_scanner and self.local_mods_scanner.isRunning():
             return
         mods_folder = os.path.join(self.minecraft_directory, "mods")
-        self.installed_mods_list.clear()
-        item = QListWidgetItem(self.lang_dict.get("scanning", "Scanning..."))
-        item.setTextAlignment(Qt.AlignCenter)
-        self.installed_mods_list.addItem(item)
+        self.installed_mods_model.set_message(self.lang_dict.get("scanning", "Scanning..."))
         
         installed_data = self.get_installed_mods_info()
         self.local_mods_scanner = LocalModsScannerWorker(mods_folder, self.lang_dict, installed_data, self)
@@ -1001,23 +1307,10 @@ class MinecraftLauncher(QWidget):
         self.local_mods_scanner.start()
 
     def on_local_mods_scanned(self, mods_list):
-        self.installed_mods_list.clear()
         if not mods_list:
-            item = QListWidgetItem(self.lang_dict.get("no_local_mods_found", "No mods found in folder."))
-            item.setTextAlignment(Qt.AlignCenter)
-            self.installed_mods_list.addItem(item)
+            self.installed_mods_model.set_message(self.lang_dict.get("no_local_mods_found", "No mods found in folder."))
             return
-        
-        for mod_info in sorted(mods_list, key=lambda x: x['name'].lower()):
-            item = QListWidgetItem()
-            item.setSizeHint(QSize(0, 90))
-            widget = InstalledModListItemWidget(
-                mod_info, self.lang_dict, main_font=self.minecraft_font, bold_font=self.subtitle_font
-                )
-            widget.delete_requested.connect(self.handle_mod_delete)
-            widget.toggle_requested.connect(self.handle_mod_toggle)
-            self.installed_mods_list.addItem(item)
-            self.installed_mods_list.setItemWidget(item, widget)
+        self.installed_mods_model.set_mods(sorted(mods_list, key=lambda x: x['name'].lower()))
 
     def handle_mod_delete(self, filepath):
         filename = os.path.basename(filepath)
@@ -1035,10 +1328,7 @@ class MinecraftLauncher(QWidget):
             
             if project_id_to_update:
                 self.remove_installed_mod_info(project_id_to_update)
-                if project_id_to_update in self.mod_list_item_map:
-                    widget = self.mod_list_item_map[project_id_to_update]
-                    widget.is_installed = False
-                    widget.update_view()
+                self.mod_results_model.set_installed(project_id_to_update, False)
 
         except OSError as e:
             self.log_to_console(f"Error deleting file {filename}: {e}")
@@ -1073,6 +1363,13 @@ class MinecraftLauncher(QWidget):
                 logging.warning("Updater preparation skipped: not running from a compiled executable.")
                 return
             temp_updater_path = os.path.join(sys._MEIPASS, "updater.exe")
+            source_stat = os.stat(temp_updater_path)
+            if self.updater_path.exists():
+                # copy2 keeps the modification time, so an unchanged updater matches on size and mtime
+                target_stat = self.updater_path.stat()
+                if target_stat.st_size == source_stat.st_size and int(target_stat.st_mtime) == int(source_stat.st_mtime):
+                    logging.info(f"Updater at {self.updater_path} is up to date.")
+                    return
             shutil.copy2(temp_updater_path, self.updater_path)
             logging.info(f"Updater prepared at {self.updater_path}")
         except Exception as e:
@@ -1213,8 +1510,9 @@ class MinecraftLauncher(QWidget):
         types_map = {0: "vanilla", 1: "forge", 2: "fabric"}
         self.current_version_type = types_map.get(type_id, "vanilla")
         self.populate_versions(self.current_version_type)
-        self.mod_results_list.clear()
-        self.mod_search_input.clear()
+        if hasattr(self, 'mod_results_list'):
+            self.mod_results_model.clear()
+            self.mod_search_input.clear()
         self.on_tab_changed(self.tab_widget.currentIndex())
 
     def update_ui_text(self):
@@ -1242,6 +1540,10 @@ class MinecraftLauncher(QWidget):
             self.mods_sub_tabs.setTabText(0, lang.get("search", "Search"))
             self.mods_sub_tabs.setTabText(1, lang.get("installed", "Installed"))
             self.refresh_installed_button.setText(lang.get("refresh", "Refresh"))
+            self.mod_search_delegate.lang_dict = lang
+            self.installed_mod_delegate.lang_dict = lang
+            self.mod_results_list.viewport().update()
+            self.installed_mods_list.viewport().update()
         
         if hasattr(self, 'refresh_versions_button'):
             self.refresh_versions_button.setText(lang.get("refresh", "Refresh"))
@@ -1258,12 +1560,26 @@ class MinecraftLauncher(QWidget):
         self.fullscreen_checkbox.setText(lang["fullscreen"])
         self.close_launcher_checkbox.setText(lang["close_launcher"])
         self.clear_console_button.setText(lang["clear_console"])
+        self.launch_history_button.setText(lang.get("launch_history", "Launch History"))
+        self.console_tabs.setTabText(0, lang.get("launcher_log", "Launcher"))
+        for view in self.instance_consoles.values():
+            if view.stop_button.isEnabled():
+                view.stop_button.setText(lang.get("stop_instance", "Stop"))
+        current_filter = self.console_filter_combo.currentData()
+        self.console_filter_combo.blockSignals(True)
+        self.console_filter_combo.clear()
+        self.console_filter_combo.addItem(lang.get("console_filter_all", "All messages"), LEVEL_INFO)
+        self.console_filter_combo.addItem(lang.get("console_filter_warnings", "Warnings and errors"), LEVEL_WARN)
+        self.console_filter_combo.addItem(lang.get("console_filter_errors", "Errors only"), LEVEL_ERROR)
+        self.console_filter_combo.setCurrentIndex(max(0, self.console_filter_combo.findData(current_filter if current_filter is not None else LEVEL_INFO)))
+        self.console_filter_combo.blockSignals(False)
         self.advanced_settings_button.setText(lang["advanced_settings_show"])
         self.resolution_label.setText(lang.get("resolution", "Game Resolution"))
         
-        self.prev_page_button.setToolTip(lang.get("prev_page", "Previous"))
-        self.next_page_button.setToolTip(lang.get("next_page", "Next"))
-        self.page_label.setText(f"{lang.get('page', 'Page')} {self.mod_current_page}")
+        if hasattr(self, 'page_label'):
+            self.prev_page_button.setToolTip(lang.get("prev_page", "Previous"))
+            self.next_page_button.setToolTip(lang.get("next_page", "Next"))
+            self.page_label.setText(f"{lang.get('page', 'Page')} {self.mod_current_page}")
         self.version_type_label.setText(lang["version_type"])
         self.vanilla_radio.setText(lang["vanilla"])
         self.forge_radio.setText(lang["forge"])
@@ -1273,19 +1589,21 @@ class MinecraftLauncher(QWidget):
             open_mods_folder_button_search.setToolTip(lang["open_mods_folder"])
         if hasattr(self, 'open_modpacks_folder_button'):
             self.open_modpacks_folder_button.setToolTip(lang["open_modpacks_folder"])
-        self.modpacks_tab_label.setText(lang["wip_notice"])
-        self.mod_search_input.setPlaceholderText(lang["search_mods_placeholder"])
-        self.mod_sort_label.setText(lang["sort_by"])
-        self.mod_refresh_button.setText(lang["refresh"])
-        
-        current_sort_data = self.mod_sort_combo.currentData()
-        self.mod_sort_combo.clear()
-        self.mod_sort_combo.addItem(lang["downloads"], "downloads")
-        self.mod_sort_combo.addItem(lang["relevance"], "relevance")
-        self.mod_sort_combo.addItem(lang["newest"], "newest")
-        if current_sort_data:
-            index = self.mod_sort_combo.findData(current_sort_data)
-            if index != -1: self.mod_sort_combo.setCurrentIndex(index)
+        if hasattr(self, 'modpacks_tab_label'):
+            self.modpacks_tab_label.setText(lang["wip_notice"])
+        if hasattr(self, 'mod_search_input'):
+            self.mod_search_input.setPlaceholderText(lang["search_mods_placeholder"])
+            self.mod_sort_label.setText(lang["sort_by"])
+            self.mod_refresh_button.setText(lang["refresh"])
+
+            current_sort_data = self.mod_sort_combo.currentData()
+            self.mod_sort_combo.clear()
+            self.mod_sort_combo.addItem(lang["downloads"], "downloads")
+            self.mod_sort_combo.addItem(lang["relevance"], "relevance")
+            self.mod_sort_combo.addItem(lang["newest"], "newest")
+            if current_sort_data:
+                index = self.mod_sort_combo.findData(current_sort_data)
+                if index != -1: self.mod_sort_combo.setCurrentIndex(index)
                 
         for i in range(self.tab_widget.count()):
             tab = self.tab_widget.widget(i)
@@ -1333,9 +1651,14 @@ class MinecraftLauncher(QWidget):
         if self.version_loader and self.version_loader.isRunning():
             self.version_loader.quit()
             self.version_loader.wait()
-        self.version_combo.clear()
-        self.version_combo.setEnabled(False)
-        self.version_combo.addItem(self.lang_dict["loading_versions"])
+
+        cached_versions = catalog_cache.load_catalog(version_type)
+        if cached_versions:
+            self.on_versions_loaded(cached_versions)
+        else:
+            self.version_combo.clear()
+            self.version_combo.setEnabled(False)
+            self.version_combo.addItem(self.lang_dict["loading_versions"])
         
         class VersionLoader(QThread):
             finished = Signal(list)
@@ -1344,16 +1667,11 @@ class MinecraftLauncher(QWidget):
                 super().__init__(parent)
                 self.v_type = v_type
             def run(self):
+                process_priority.enter_background()
                 try:
-                    version_list = []
-                    if self.v_type == "vanilla":
-                        version_list = [v["id"] for v in minecraft_launcher_lib.utils.get_version_list() if v["type"] == "release"]
-                    elif self.v_type == "forge":
-                        raw_versions = minecraft_launcher_lib.forge.list_forge_versions()
-                        version_list = helpers.get_latest_versions(raw_versions)
-                    elif self.v_type == "fabric":
-                        version_list = minecraft_launcher_lib.fabric.get_stable_minecraft_versions()
-                    self.finished.emit(version_list)
+                    version_list, changed = catalog_cache.refresh_catalog(self.v_type)
+                    if changed:
+                        self.finished.emit(version_list)
                 except Exception as e:
                     self.error.emit(str(e))
         
@@ -1363,31 +1681,21 @@ class MinecraftLauncher(QWidget):
         self.version_loader.start()
 
     def on_versions_loaded(self, version_list):
-        self.mod_results_list.clear()
-        self.mod_search_input.clear()
+        self.prefetch_debounce.stop()
+        if hasattr(self, 'mod_results_list'):
+            self.mod_results_model.clear()
+            self.mod_search_input.clear()
         self.version_combo.clear()
-        installed_ids = {v['id'] for v in minecraft_launcher_lib.utils.get_installed_versions(self.minecraft_directory)}
+        catalog = self.version_index.get_catalog()
+        loader = self.current_version_type
         model = QStandardItemModel(self)
         for version_id in version_list:
-            display_text = version_id
-            if self.current_version_type in ["forge", "fabric"]:
-                display_text = version_id.split('-')[0]
+            entry = version_catalog.parse_catalog_id(version_id, loader)
+            display_text = entry.mc_version if loader in ["forge", "fabric"] else version_id
             item = QStandardItem(display_text)
             item.setData(version_id, Qt.UserRole)
-            is_installed = False
-            if self.current_version_type == 'forge':
-                mc_ver, forge_ver_build = version_id.split('-', 1)
-                for installed_id in installed_ids:
-                    if 'forge' in installed_id and installed_id.startswith(mc_ver) and installed_id.endswith(forge_ver_build):
-                        is_installed = True
-                        break
-            elif self.current_version_type == 'fabric':
-                for installed_id in installed_ids:
-                    if 'fabric-loader' in installed_id and version_id in installed_id:
-                        is_installed = True
-                        break
-            else:
-                is_installed = version_id in installed_ids
+            is_installed = catalog.is_installed(entry)
+            item.setData(is_installed, Qt.UserRole + 1)
             if is_installed:
                 item.setIcon(self.installed_icon)
             else:
@@ -1402,6 +1710,28 @@ class MinecraftLauncher(QWidget):
                     break
         self.version_combo.setEnabled(True)
 
+    def on_version_activated(self, index):
+        self.prefetch_debounce.start()
+
+    def on_version_selected(self):
+        """Speculatively installs the selected version in the background when enabled in settings."""
+        if not self.settings.get("background_prefetch", False) or not self.version_combo.isEnabled():
+            return
+        if self.launch_supervisor.has_active():
+            return
+        selected_version = self.version_combo.currentData(Qt.UserRole)
+        if not selected_version:
+            return
+        mod_loader = self.current_version_type if self.current_version_type != "vanilla" else None
+        if self.version_combo.currentData(Qt.UserRole + 1):
+            prefetch.get_prefetch_manager().cancel()
+            return
+        prefetch.get_prefetch_manager().start(
+            self.minecraft_directory, selected_version, mod_loader, self.settings.get("clientToken"),
+            rate_kbps=self.settings.get("prefetch_max_kbps", 2048),
+        )
+        self.log_to_console(f"Installing {selected_version} in the background...")
+
     def on_version_load_error(self, error_msg):
         self.version_combo.clear()
         self.version_combo.addItem("Error loading versions")
@@ -1411,6 +1741,7 @@ class MinecraftLauncher(QWidget):
 
     def on_tab_changed(self, index):
         current_widget = self.tab_widget.widget(index)
+        self.ensure_tab_built(current_widget)
         if current_widget == self.mods_tab_widget:
             self.on_mods_sub_tab_changed(self.mods_sub_tabs.currentIndex())
         elif current_widget == self.versions_tab_widget:
@@ -1418,7 +1749,7 @@ class MinecraftLauncher(QWidget):
 
     def on_mods_sub_tab_changed(self, index):
         if index == 0:
-            if self.mod_results_list.count() == 0:
+            if self.mod_results_model.rowCount() == 0:
                 self.mod_search_input.clear()
                 self.update_mod_list()
         elif index == 1:
@@ -1452,22 +1783,15 @@ class MinecraftLauncher(QWidget):
         self.log_to_console(f"Automatically searching for dependency: {dependency_name}")
         
     def on_mod_download_progress(self, project_id, percentage):
-        if project_id in self.mod_list_item_map:
-            card_widget = self.mod_list_item_map[project_id]
-            if percentage > 100:
-                card_widget.update_view(is_installing=False)
-            else:
-                card_widget.update_view(is_installing=True, progress=percentage)
+        self.mod_results_model.set_progress(project_id, percentage if percentage <= 100 else None)
 
     def on_mod_download_finished(self, project_id, success, message):
         self.log_to_console(message)
         if project_id in self.mod_download_workers:
             del self.mod_download_workers[project_id]
-        if project_id in self.mod_list_item_map:
-            card_widget = self.mod_list_item_map[project_id]
-            if success:
-                card_widget.is_installed = True
-            card_widget.update_view()
+        if success:
+            self.mod_results_model.set_installed(project_id, True)
+        self.mod_results_model.set_progress(project_id, None)
 
     def open_mod_page(self, mod_data):
         project_slug = mod_data.get("slug")
@@ -1516,10 +1840,43 @@ class MinecraftLauncher(QWidget):
                     except OSError as e:
                         self.log_to_console(f"Error deleting file {file_name}: {e}")
             self.remove_installed_mod_info(project_id)
-            if project_id in self.mod_list_item_map:
-                card_widget = self.mod_list_item_map[project_id]
-                card_widget.is_installed = False
-                card_widget.update_view()
+            self.mod_results_model.set_installed(project_id, False)
+
+    def repair_version(self, version_id):
+        if self.launch_supervisor.has_active() or (self.repair_worker and self.repair_worker.isRunning()):
+            return
+        prefetch.get_prefetch_manager().cancel(wait=True)
+        self.log_to_console(f"Verifying files of version {version_id}...")
+        self.launch_control_stack.setCurrentIndex(1)
+        self.progress_bar.setValue(0)
+        self.repair_worker = VersionRepairWorker(version_id, self.minecraft_directory, self.lang_dict, self)
+        self.repair_worker.progress_update.connect(self.update_progress)
+        self.repair_worker.log_message.connect(self.log_to_console)
+        self.repair_worker.finished.connect(partial(self.on_repair_finished, version_id))
+        self.repair_worker.start()
+
+    def on_repair_finished(self, version_id, result, details):
+        lang = self.lang_dict
+        self.launch_control_stack.setCurrentIndex(0)
+        self.cancel_button.setEnabled(True)
+        self.cancel_button.setText(lang.get("cancel", "Cancel"))
+
+        if result == "success":
+            if details:
+                self.log_to_console(lang.get("repair_complete", "Repair of {version_id} finished: {count} files replaced.").format(version_id=version_id, count=details))
+            else:
+                self.log_to_console(lang.get("repair_nothing_to_fix", "All files of {version_id} are intact.").format(version_id=version_id))
+        elif result == "cancelled":
+            self.log_to_console("Repair cancelled.")
+        else:
+            self.log_to_console(f"Repair of {version_id} failed: {details}")
+            reply = QMessageBox.question(
+                self, lang.get("repair_failed_title", "Repair Failed"),
+                lang.get("repair_failed_text", "Could not verify version '{version_id}': {error}\n\nReinstall it completely?").format(version_id=version_id, error=details),
+                QMessageBox.Yes | QMessageBox.No, QMessageBox.No
+            )
+            if reply == QMessageBox.Yes:
+                self.reinstall_version(version_id)
 
     def reinstall_version(self, version_id):
         version_path = os.path.join(self.minecraft_directory, "versions", version_id)
@@ -1527,6 +1884,7 @@ class MinecraftLauncher(QWidget):
         if os.path.exists(version_path):
             try:
                 shutil.rmtree(version_path)
+                self.version_index.invalidate()
                 self.log_to_console(f"Version folder '{version_id}' successfully deleted.")
                 self.populate_versions(self.current_version_type)
             except Exception as e:
@@ -1539,11 +1897,39 @@ class MinecraftLauncher(QWidget):
             self.refresh_installed_versions_list()
 
     def log_to_console(self, message):
-        self.console_output.append(message)
-        logging.info(f"CONSOLE: {message}")
+        self.console_output.append_line(message)
+        if self.settings.get("console_mirror_to_log", False):
+            logging.info(f"CONSOLE: {message}")
+
+    def log_lines_to_console(self, lines):
+        self.console_output.append_lines(lines)
+        if self.settings.get("console_mirror_to_log", False):
+            logging.info("CONSOLE: " + "\n".join(lines))
+
+    def log_to_instance(self, instance_id, message):
+        view = self.instance_consoles.get(instance_id)
+        if not view:
+            self.log_to_console(message)
+            return
+        view.console.append_line(message)
+        if self.settings.get("console_mirror_to_log", False):
+            logging.info(f"CONSOLE #{instance_id}: {message}")
+
+    def log_lines_to_instance(self, instance_id, lines):
+        view = self.instance_consoles.get(instance_id)
+        if not view:
+            self.log_lines_to_console(lines)
+            return
+        view.console.append_lines(lines)
+        if self.settings.get("console_mirror_to_log", False):
+            logging.info(f"CONSOLE #{instance_id}: " + "\n".join(lines))
 
     def clear_console(self):
-        self.console_output.clear()
+        current = self.console_tabs.currentWidget()
+        if isinstance(current, InstanceConsole):
+            current.console.clear_all()
+        else:
+            self.console_output.clear_all()
 
     def update_memory_feedback(self, value):
         self.memory_value_label.setText(f"{value} GB")
@@ -1559,6 +1945,10 @@ class MinecraftLauncher(QWidget):
     def open_advanced_settings(self):
         dialog = AdvancedSettingsDialog(self)
         dialog.exec()
+
+    def open_launch_history(self):
+        dialog = LaunchHistoryDialog(self)
+        dialog.exec()
         
     def on_version_sizes_scanned(self, sizes, total_size):
         total_size_str = helpers.format_size(total_size)
@@ -1574,7 +1964,9 @@ class MinecraftLauncher(QWidget):
             size = grouped_sizes.get(base_version, 0)
             widget.update_size(size)
 
-    def refresh_installed_versions_list(self):
+    def refresh_installed_versions_list(self, force=False):
+        if force:
+            self.version_index.invalidate()
         self.installed_versions_list.clear()
         self.grouped_versions.clear()
         self.version_widget_map.clear()
@@ -1583,7 +1975,7 @@ class MinecraftLauncher(QWidget):
         self.total_versions_size_label.setText(self.lang_dict.get("calculating_size", "Calculating size..."))
 
         try:
-            installed = minecraft_launcher_lib.utils.get_installed_versions(self.minecraft_directory)
+            installed = self.version_index.get_installed_versions()
             
             if not installed:
                 item = QListWidgetItem(self.lang_dict.get("no_versions_installed", "No versions installed."))
@@ -1592,17 +1984,11 @@ class MinecraftLauncher(QWidget):
                 self.total_versions_size_label.setText("")
                 return
 
-            all_version_ids = []
-            for version_info in installed:
-                version_id = version_info['id']
-                all_version_ids.append(version_id)
-                base_v = helpers.get_base_version(version_id)
-                if base_v not in self.grouped_versions:
-                    self.grouped_versions[base_v] = []
-                self.grouped_versions[base_v].append(version_id)
-
-            for base_version, id_list in sorted(self.grouped_versions.items(), key=lambda item: helpers.version_key(item[0]), reverse=True):
-                version_types = sorted(list(set(helpers.get_version_type(vid) for vid in id_list)))
+            catalog = self.version_index.get_catalog()
+            all_version_ids = [record.id for record in catalog.records]
+            for base_version, id_list in catalog.grouped_by_base():
+                self.grouped_versions[base_version] = list(id_list)
+                version_types = sorted(set(helpers.get_version_type(vid) for vid in id_list))
                 
                 item = QListWidgetItem()
                 item.setSizeHint(QSize(0, 85))
@@ -1656,7 +2042,10 @@ class MinecraftLauncher(QWidget):
             confirm_text = self.lang_dict.get(f"confirm_{action_type}_text", "Are you sure?").format(version_id=version_to_act_on)
             reply = QMessageBox.question(self, confirm_title, confirm_text, QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
             if reply == QMessageBox.Yes:
-                self.reinstall_version(version_to_act_on)
+                if action_type == "repair":
+                    self.repair_version(version_to_act_on)
+                else:
+                    self.reinstall_version(version_to_act_on)
         elif action_type == "open_folder":
             version_path = os.path.join(self.minecraft_directory, "versions", version_to_act_on)
             if os.path.exists(version_path):
@@ -1686,10 +2075,24 @@ class MinecraftLauncher(QWidget):
                 worker.wait(500)
         self.mod_download_workers.clear()
         
-        if self.worker and self.worker.isRunning():
-            self.worker.stop()
+        # Waits for each game to be terminated so no session outlives the window
+        self.launch_supervisor.stop_all(wait_ms=STOP_WAIT_MS)
         
-        worker_list = ['worker', 'version_loader', 'mod_search_worker',
+        if self.repair_worker and self.repair_worker.isRunning():
+            self.repair_worker.stop()
+
+        if helpers.is_loaded(prefetch):
+            prefetch.get_prefetch_manager().cancel(wait=True)
+        icon_service.shutdown()
+        if helpers.is_loaded(mod_manager):
+            mod_manager.log_api_stats()
+        
+        for worker in list(self.mod_page_fetches.values()):
+            if worker.isRunning():
+                worker.quit()
+                worker.wait(500)
+
+        worker_list = ['repair_worker', 'version_loader',
                        'update_check_worker', 'local_mods_scanner', 'version_size_scanner']
         for worker_attr in worker_list:
             worker = getattr(self, worker_attr, None)
@@ -1707,6 +2110,24 @@ class MinecraftLauncher(QWidget):
     def show(self):
         super().show()
         self.fade_in_animation.start()
+        QTimer.singleShot(0, self.on_window_shown)
+
+    def on_window_shown(self):
+        """
+        Runs once the event loop has painted the window: records time to
+        interactive, then does the work that used to delay the first frame.
+        """
+        if getattr(self, "startup_reported", False):
+            return
+        self.startup_reported = True
+        time_to_interactive = time.monotonic() - self.started_at
+        message = f"Launcher ready in {time_to_interactive * 1000:.0f} ms (window built in {self.build_time * 1000:.0f} ms)."
+        logging.info(message)
+        self.log_to_console(message)
+
+        self.detect_system_memory()
+        self.on_tab_changed(self.tab_widget.currentIndex())
+        QTimer.singleShot(0, self.prepare_updater)
         
     def on_version_selection_changed(self, base_version, is_selected):
         if is_selected:
@@ -182,7 +182,7 @@ def get_dark_theme(accent_color="#1DB954"):
             margin: -8px 0; 
             border-radius: 9px;
         }}
-        QTextEdit {{
+        QTextEdit, QPlainTextEdit {{
             background-color: #0A0A0A; 
             border: 1px solid #282828;
             border-radius: 8px; 
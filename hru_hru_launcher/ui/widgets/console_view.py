@@ -0,0 +1,97 @@
+# hru_hru_launcher/ui/widgets/console_view.py
+import re
+from collections import deque
+
+from PySide6.QtCore import QTimer
+from PySide6.QtGui import QTextCursor
+from PySide6.QtWidgets import QPlainTextEdit
+
+LEVEL_INFO = 0
+LEVEL_WARN = 1
+LEVEL_ERROR = 2
+
+_LEVEL_PATTERN = re.compile(r"(?:/|\[)(WARN|WARNING|ERROR|FATAL|SEVERE)\]|^(ERROR|WARNING)\b")
+_ERROR_LEVELS = {"ERROR", "FATAL", "SEVERE"}
+
+
+def classify_line(line):
+    match = _LEVEL_PATTERN.search(line)
+    if not match:
+        return LEVEL_INFO
+    level = match.group(1) or match.group(2)
+    return LEVEL_ERROR if level in _ERROR_LEVELS else LEVEL_WARN
+
+
+class ConsoleView(QPlainTextEdit):
+    """
+    Plain-text console with a fixed block limit. Appends are queued and
+    written in one go by a short timer, and the level filter only re-renders
+    the bounded history when it changes.
+    """
+
+    def __init__(self, max_lines=5000, flush_interval_ms=50, parent=None):
+        super().__init__(parent)
+        self.setReadOnly(True)
+        self.setUndoRedoEnabled(False)
+        self.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.setMaximumBlockCount(max_lines)
+
+        self.min_level = LEVEL_INFO
+        self._history = deque(maxlen=max_lines)
+        self._pending = []
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(flush_interval_ms)
+        self._flush_timer.timeout.connect(self._flush)
+
+    def set_max_lines(self, max_lines):
+        self.setMaximumBlockCount(max_lines)
+        self._history = deque(self._history, maxlen=max_lines)
+
+    def append_line(self, line):
+        self.append_lines(line.split("\n"))
+
+    def append_lines(self, lines):
+        for line in lines:
+            level = classify_line(line)
+            self._history.append((level, line))
+            if level >= self.min_level:
+                self._pending.append(line)
+        if self._pending and not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush(self):
+        if not self._pending:
+            return
+        text = "\n".join(self._pending[-self.maximumBlockCount():])
+        self._pending.clear()
+
+        scrollbar = self.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - 2
+        cursor = QTextCursor(self.document())
+        cursor.movePosition(QTextCursor.End)
+        if not self.document().isEmpty():
+            text = "\n" + text
+        cursor.insertText(text)
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
+    def set_min_level(self, level):
+        if level == self.min_level:
+            return
+        self.min_level = level
+        self._flush_timer.stop()
+        self._pending.clear()
+        self.setPlainText("\n".join(line for lvl, line in self._history if lvl >= level))
+        self.verticalScrollBar().setValue(self.verticalScrollBar().maximum())
+
+    def clear_all(self):
+        self._flush_timer.stop()
+        self._pending.clear()
+        self._history.clear()
+        self.clear()
+
+    def flush_now(self):
+        self._flush_timer.stop()
+        self._flush()
@@ -0,0 +1,67 @@
+# hru_hru_launcher/ui/widgets/instance_console.py
+from PySide6.QtCore import Signal
+from PySide6.QtGui import QFont
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel
+
+from hru_hru_launcher.utils import helpers
+from .animated_button import AnimatedButton
+from .console_view import ConsoleView
+from .sparkline import Sparkline
+
+
+class InstanceConsole(QWidget):
+    """Console sub-view of one game instance: its output, resource line and sparklines, and its own stop button."""
+    stop_requested = Signal(int)
+
+    def __init__(self, instance_id, max_lines=5000, font=None, parent=None):
+        super().__init__(parent)
+        self.instance_id = instance_id
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 5, 0, 0)
+        top_bar = QHBoxLayout()
+
+        self.status_label = QLabel()
+        if font:
+            self.status_label.setFont(font)
+        self.stop_button = AnimatedButton("")
+        if font:
+            self.stop_button.setFont(font)
+        self.stop_button.setFixedHeight(30)
+        self.stop_button.clicked.connect(lambda: self.stop_requested.emit(self.instance_id))
+
+        top_bar.addWidget(self.status_label, 1)
+        top_bar.addWidget(self.stop_button)
+
+        sparkline_bar = QHBoxLayout()
+        self.sparklines = {
+            "cpu_percent": Sparkline("CPU", lambda v: f"{v:.0f}%"),
+            "rss": Sparkline("RAM", helpers.format_size),
+            "threads": Sparkline("Threads"),
+            "io_rate": Sparkline("I/O", lambda v: f"{helpers.format_size(v)}/s"),
+        }
+        for sparkline in self.sparklines.values():
+            sparkline_bar.addWidget(sparkline)
+
+        self.console = ConsoleView(max_lines=max_lines)
+        self.console.setFont(QFont("Consolas", 9))
+        self.console.setObjectName("consoleOutput")
+
+        layout.addLayout(top_bar)
+        layout.addLayout(sparkline_bar)
+        layout.addWidget(self.console)
+
+    def set_status(self, text):
+        self.status_label.setText(text)
+
+    def set_accent_color(self, color):
+        for sparkline in self.sparklines.values():
+            sparkline.set_color(color)
+
+    def update_resources(self, snapshot):
+        for field, sparkline in self.sparklines.items():
+            sparkline.set_values(snapshot.get(field, []))
+
+    def set_stopped(self, text):
+        self.stop_button.setEnabled(False)
+        self.stop_button.setText(text)
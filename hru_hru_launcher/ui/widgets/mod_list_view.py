@@ -0,0 +1,420 @@
+# hru_hru_launcher/ui/widgets/mod_list_view.py
+import os
+
+from PySide6.QtCore import Qt, Signal, QSize, QRect, QEvent, QAbstractListModel, QModelIndex
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPixmap, QCursor, QPainter
+from PySide6.QtWidgets import QListView, QStyledItemDelegate, QAbstractItemView
+
+from hru_hru_launcher.ui.icon_service import get_icon_service, decode_icon
+
+ModDataRole = Qt.UserRole + 1
+IconRole = Qt.UserRole + 2
+InstalledRole = Qt.UserRole + 3
+ProgressRole = Qt.UserRole + 4
+MessageRole = Qt.UserRole + 5
+
+SEARCH_CARD_HEIGHT = 84
+INSTALLED_CARD_HEIGHT = 90
+ICON_SIZE = 64
+
+CARD_COLOR = QColor("#2a2d34")
+INSTALL_COLOR, INSTALL_HOVER_COLOR = QColor("#4CAF50"), QColor("#5cb85c")
+DELETE_COLOR, DELETE_HOVER_COLOR = QColor("#f44336"), QColor("#f65c51")
+
+
+class ModListModel(QAbstractListModel):
+    """
+    Rows of mod dicts for the Modrinth results and the Installed tab. Icons are
+    asked from the icon service only when a delegate paints the row, so a long
+    list loads just the visible ones; when an icon arrives only the rows that
+    use it are repainted. A list with no mods shows a single message row.
+    """
+
+    def __init__(self, id_key, parent=None):
+        super().__init__(parent)
+        self.id_key = id_key
+        self._mods = []
+        self._message = None
+        self._rows_by_id = {}
+        self._rows_by_icon = {}
+        self._installed = set()
+        self._progress = {}
+        self._decoded_icons = {}
+        get_icon_service().icon_ready.connect(self._on_icon_ready)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._mods) if self._message is None else 1
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if self._message is not None:
+            return self._message if role in (Qt.DisplayRole, MessageRole) else None
+        mod = self._mods[index.row()]
+        mod_id = mod.get(self.id_key)
+        if role == ModDataRole:
+            return mod
+        if role == Qt.DisplayRole:
+            return mod.get("title") or mod.get("name")
+        if role == IconRole:
+            return self._icon(mod)
+        if role == InstalledRole:
+            return mod_id in self._installed
+        if role == ProgressRole:
+            return self._progress.get(mod_id)
+        return None
+
+    def set_message(self, text):
+        self.beginResetModel()
+        self._clear_rows()
+        self._message = text
+        self.endResetModel()
+
+    def set_mods(self, mods, installed_ids=()):
+        self.beginResetModel()
+        self._clear_rows()
+        self._mods = list(mods)
+        self._installed = set(installed_ids)
+        for row, mod in enumerate(self._mods):
+            self._rows_by_id[mod.get(self.id_key)] = row
+            if mod.get("icon_url"):
+                self._rows_by_icon.setdefault(mod["icon_url"], []).append(row)
+        self.endResetModel()
+
+    def clear(self):
+        self.beginResetModel()
+        self._clear_rows()
+        self.endResetModel()
+
+    def _clear_rows(self):
+        self._mods = []
+        self._message = None
+        self._rows_by_id.clear()
+        self._rows_by_icon.clear()
+        self._installed.clear()
+        # _progress is kept: a download outlives a new search and its row shows it again
+        self._decoded_icons.clear()
+
+    def set_installed(self, mod_id, installed):
+        if installed:
+            self._installed.add(mod_id)
+        else:
+            self._installed.discard(mod_id)
+        self._row_changed(mod_id, [InstalledRole])
+
+    def set_progress(self, mod_id, value):
+        """value is the download percentage, or None when the download is over."""
+        if value is None:
+            self._progress.pop(mod_id, None)
+        else:
+            self._progress[mod_id] = value
+        self._row_changed(mod_id, [ProgressRole])
+
+    def _row_changed(self, mod_id, roles):
+        row = self._rows_by_id.get(mod_id)
+        if row is not None and self._message is None:
+            index = self.index(row)
+            self.dataChanged.emit(index, index, roles)
+
+    def _icon(self, mod):
+        url = mod.get("icon_url")
+        if url:
+            return get_icon_service().request(url)
+        icon_data = mod.get("icon_data")
+        if not icon_data:
+            return None
+        key = mod.get(self.id_key)
+        pixmap = self._decoded_icons.get(key)
+        if pixmap is None:
+            pixmap = QPixmap.fromImage(decode_icon(icon_data))
+            self._decoded_icons[key] = pixmap
+        return pixmap
+
+    def _on_icon_ready(self, url, pixmap):
+        for row in self._rows_by_icon.get(url, ()):
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [IconRole])
+
+
+class ModCardListView(QListView):
+    """List view for painted mod cards: fixed-height rows, no selection, hover repaints the card under the mouse."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("modList")
+        self.setSpacing(5)
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setMouseTracking(True)
+        self._hover_index = QModelIndex()
+
+    def mouseMoveEvent(self, event):
+        super().mouseMoveEvent(event)
+        index = self.indexAt(event.position().toPoint())
+        if self._hover_index.isValid() and self._hover_index != index:
+            self.viewport().update(self.visualRect(self._hover_index))
+        self._hover_index = index
+        if index.isValid():
+            # Buttons inside the card change colour under the mouse
+            self.viewport().update(self.visualRect(index))
+
+    def leaveEvent(self, event):
+        super().leaveEvent(event)
+        if self._hover_index.isValid():
+            self.viewport().update(self.visualRect(self._hover_index))
+        self._hover_index = QModelIndex()
+
+
+class _CardDelegate(QStyledItemDelegate):
+    """Painting helpers and click routing shared by the mod cards. Subclasses paint their own card and provide
+    buttons(rect, index), the {name: QRect} clickable areas, and clicked(name, index)."""
+    card_height = SEARCH_CARD_HEIGHT
+
+    def __init__(self, lang_dict, parent=None):
+        super().__init__(parent)
+        self.lang_dict = lang_dict
+
+    def sizeHint(self, option, index):
+        return QSize(0, self.card_height)
+
+    def paint_background(self, painter, option, index):
+        """Draws the placeholder message or the card background; returns True when the row is a card."""
+        painter.setRenderHint(QPainter.Antialiasing)
+        message = index.data(MessageRole)
+        if message is not None:
+            painter.setPen(QColor("#a0a0a0"))
+            painter.setFont(option.font)
+            painter.drawText(option.rect, Qt.AlignCenter, message)
+            return False
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(CARD_COLOR)
+        painter.drawRoundedRect(option.rect, 8, 8)
+        return True
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton and index.data(MessageRole) is None:
+            pos = event.position().toPoint()
+            for name, rect in self.buttons(option.rect, index).items():
+                if rect.contains(pos):
+                    self.clicked(name, index)
+                    return True
+        return super().editorEvent(event, model, option, index)
+
+    def _mouse_pos(self, option):
+        view = option.widget
+        if view is None or not isinstance(view, QListView):
+            return None
+        return view.viewport().mapFromGlobal(QCursor.pos())
+
+    def paint_icon(self, painter, rect, pixmap):
+        if pixmap is not None and not pixmap.isNull():
+            target = pixmap.size().scaled(rect.size(), Qt.KeepAspectRatio)
+            x = rect.x() + (rect.width() - target.width()) // 2
+            y = rect.y() + (rect.height() - target.height()) // 2
+            painter.drawPixmap(QRect(x, y, target.width(), target.height()), pixmap)
+            return
+        painter.setPen(QColor("#444"))
+        painter.setBrush(Qt.NoBrush)
+        painter.drawRoundedRect(rect.adjusted(1, 1, -1, -1), 8, 8)
+        font = QFont(painter.font())
+        font.setPixelSize(24)
+        painter.setFont(font)
+        painter.setPen(QColor("#888"))
+        painter.drawText(rect, Qt.AlignCenter, "📦")
+
+    def paint_button(self, painter, rect, text, font, color, hover_color, mouse_pos, radius=5, text_color=QColor("white")):
+        hovered = mouse_pos is not None and rect.contains(mouse_pos)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(hover_color if hovered else color)
+        painter.drawRoundedRect(rect, radius, radius)
+        painter.setFont(font)
+        painter.setPen(text_color)
+        painter.drawText(rect, Qt.AlignCenter, text)
+
+    def paint_text(self, painter, rect, text, font, color, flags=Qt.AlignLeft | Qt.AlignVCenter):
+        painter.setFont(font)
+        painter.setPen(color)
+        painter.drawText(rect, flags, QFontMetrics(font).elidedText(text, Qt.ElideRight, rect.width()))
+
+
+class ModSearchCardDelegate(_CardDelegate):
+    """Paints a Modrinth search result: icon, title with the game version badge, author, description, downloads and an Install/Delete button or the download progress."""
+    install_requested = Signal(dict)
+    delete_requested = Signal(dict)
+
+    card_height = SEARCH_CARD_HEIGHT
+    BUTTON_WIDTH = 110
+    BUTTON_HEIGHT = 34
+
+    def __init__(self, lang_dict, game_version=None, parent=None):
+        super().__init__(lang_dict, parent)
+        self.game_version = game_version
+
+    def _content(self, rect):
+        return rect.adjusted(10, 10, -10, -10)
+
+    def buttons(self, rect, index):
+        if index.data(ProgressRole) is not None:
+            return {}
+        return {"delete" if index.data(InstalledRole) else "install": self._button_rect(rect)}
+
+    def _button_rect(self, rect):
+        content = self._content(rect)
+        return QRect(content.right() - self.BUTTON_WIDTH + 1, content.center().y() - self.BUTTON_HEIGHT // 2,
+                     self.BUTTON_WIDTH, self.BUTTON_HEIGHT)
+
+    def clicked(self, name, index):
+        mod_data = index.data(ModDataRole)
+        if name == "install":
+            self.install_requested.emit(mod_data)
+        elif name == "delete":
+            self.delete_requested.emit(mod_data)
+
+    def paint(self, painter, option, index):
+        painter.save()
+        if self.paint_background(painter, option, index):
+            self._paint_card(painter, option, index, self._mouse_pos(option))
+        painter.restore()
+
+    def _paint_card(self, painter, option, index, mouse_pos):
+        mod_data = index.data(ModDataRole)
+        content = self._content(option.rect)
+        self.paint_icon(painter, QRect(content.left(), content.top(), ICON_SIZE, ICON_SIZE), index.data(IconRole))
+
+        button = self._button_rect(option.rect)
+        left = content.left() + ICON_SIZE + 15
+        text_rect = QRect(left, content.top(), button.left() - 15 - left, content.height())
+
+        base_font = QFont(option.font)
+        title_font = QFont(base_font)
+        title_font.setPixelSize(14)
+        title_font.setBold(True)
+        line_height = text_rect.height() // 4
+
+        title = mod_data.get("title", "Unknown Mod")
+        title_rect = QRect(text_rect.left(), text_rect.top(), text_rect.width(), line_height)
+        if self.game_version:
+            badge_font = QFont(base_font)
+            badge_font.setPixelSize(10)
+            badge_font.setBold(True)
+            badge_width = QFontMetrics(badge_font).horizontalAdvance(self.game_version) + 12
+            title_width = max(0, min(QFontMetrics(title_font).horizontalAdvance(title), text_rect.width() - badge_width - 8))
+            self.paint_text(painter, QRect(title_rect.left(), title_rect.top(), title_width, line_height), title, title_font, QColor("#ffffff"))
+            badge = QRect(title_rect.left() + title_width + 8, title_rect.center().y() - 8, badge_width, 16)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor("#44475a"))
+            painter.drawRoundedRect(badge, 4, 4)
+            painter.setFont(badge_font)
+            painter.setPen(QColor("#f8f8f2"))
+            painter.drawText(badge, Qt.AlignCenter, self.game_version)
+        else:
+            self.paint_text(painter, title_rect, title, title_font, QColor("#ffffff"))
+
+        self.paint_text(painter, title_rect.translated(0, line_height), f"by {mod_data.get('author', 'Unknown')}", base_font, QColor("#a0a0a0"))
+        self.paint_text(painter, title_rect.translated(0, line_height * 2), mod_data.get("description", ""), base_font, QColor("#d0d0d0"))
+        self.paint_text(painter, title_rect.translated(0, line_height * 3), f"Downloads: {mod_data.get('downloads', 0):,}", base_font, QColor("#a0a0a0"))
+
+        bold_font = QFont(base_font)
+        bold_font.setBold(True)
+        progress = index.data(ProgressRole)
+        if progress is not None:
+            self._paint_progress(painter, button, progress, bold_font)
+        elif index.data(InstalledRole):
+            self.paint_button(painter, button, self.lang_dict.get("delete", "Delete"), bold_font, DELETE_COLOR, DELETE_HOVER_COLOR, mouse_pos)
+        else:
+            self.paint_button(painter, button, self.lang_dict.get("install", "Install"), bold_font, INSTALL_COLOR, INSTALL_HOVER_COLOR, mouse_pos)
+
+    def _paint_progress(self, painter, rect, progress, font):
+        painter.setPen(QColor("#444"))
+        painter.setBrush(QColor("#3a3d44"))
+        painter.drawRoundedRect(rect, 5, 5)
+        filled = rect.adjusted(1, 1, -1, -1)
+        filled.setWidth(int(filled.width() * max(0, min(progress, 100)) / 100))
+        if filled.width() > 0:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(INSTALL_HOVER_COLOR)
+            painter.drawRoundedRect(filled, 4, 4)
+        painter.setFont(font)
+        painter.setPen(QColor("white"))
+        painter.drawText(rect, Qt.AlignCenter, f"{progress}%")
+
+
+class InstalledModCardDelegate(_CardDelegate):
+    """Paints a mod from the mods folder: icon, name, game version, author, file name, the enable switch and a Delete button."""
+    delete_requested = Signal(str)
+    toggle_requested = Signal(str, bool)
+
+    card_height = INSTALLED_CARD_HEIGHT
+    TOGGLE_SIZE = QSize(50, 25)
+
+    def __init__(self, lang_dict, main_font=None, bold_font=None, parent=None):
+        super().__init__(lang_dict, parent)
+        self.main_font = main_font or QFont()
+        self.title_font = QFont(bold_font or QFont())
+        self.title_font.setPointSize(12)
+        self.details_font = QFont(self.main_font)
+        self.details_font.setPointSize(9)
+        self.filename_font = QFont(self.main_font)
+        self.filename_font.setPointSize(8)
+        self.filename_font.setItalic(True)
+        self.button_font = QFont(self.main_font)
+        self.button_font.setBold(True)
+        self.toggle_font = QFont("Segoe UI Symbol")
+        self.toggle_font.setBold(True)
+
+    def _content(self, rect):
+        return rect.adjusted(10, 5, -10, -5)
+
+    def buttons(self, rect, index):
+        content = self._content(rect)
+        metrics = QFontMetrics(self.button_font)
+        delete_size = QSize(metrics.horizontalAdvance(self.lang_dict.get("delete", "Delete")) + 20, metrics.height() + 10)
+        delete = QRect(content.right() - delete_size.width() + 1, content.center().y() - delete_size.height() // 2,
+                       delete_size.width(), delete_size.height())
+        toggle = QRect(delete.left() - 10 - self.TOGGLE_SIZE.width(), content.center().y() - self.TOGGLE_SIZE.height() // 2,
+                       self.TOGGLE_SIZE.width(), self.TOGGLE_SIZE.height())
+        return {"toggle": toggle, "delete": delete}
+
+    def clicked(self, name, index):
+        mod_info = index.data(ModDataRole)
+        if name == "toggle":
+            self.toggle_requested.emit(mod_info.get("filepath"), not mod_info.get("enabled"))
+        elif name == "delete":
+            self.delete_requested.emit(mod_info.get("filepath"))
+
+    def paint(self, painter, option, index):
+        painter.save()
+        if self.paint_background(painter, option, index):
+            self._paint_card(painter, option, index, self._mouse_pos(option))
+        painter.restore()
+
+    def _paint_card(self, painter, option, index, mouse_pos):
+        mod_info = index.data(ModDataRole)
+        content = self._content(option.rect)
+        icon_rect = QRect(content.left(), content.center().y() - ICON_SIZE // 2, ICON_SIZE, ICON_SIZE)
+        self.paint_icon(painter, icon_rect, index.data(IconRole))
+
+        buttons = self.buttons(option.rect, index)
+        left = icon_rect.right() + 16
+        text_rect = QRect(left, content.top(), buttons["toggle"].left() - 15 - left, content.height())
+        line_height = text_rect.height() // 4
+        line = QRect(text_rect.left(), text_rect.top(), text_rect.width(), line_height)
+
+        self.paint_text(painter, line, mod_info.get("name", "Unknown Mod"), self.title_font, QColor("#ffffff"))
+        self.paint_text(painter, line.translated(0, line_height),
+                        f"{self.lang_dict.get('for_mc', 'For MC:')} {mod_info.get('game_version', 'Unknown')}", self.details_font, QColor("#a0a0a0"))
+        self.paint_text(painter, line.translated(0, line_height * 2),
+                        f"{self.lang_dict.get('author', 'Author:')} {mod_info.get('author', 'Unknown')}", self.details_font, QColor("#a0a0a0"))
+        self.paint_text(painter, line.translated(0, line_height * 3), os.path.basename(mod_info.get("filepath", "")), self.filename_font, QColor("#777"))
+
+        enabled = bool(mod_info.get("enabled"))
+        if enabled:
+            self.paint_button(painter, buttons["toggle"], "✓", self.toggle_font, INSTALL_COLOR, INSTALL_COLOR, mouse_pos, radius=12)
+        else:
+            self.paint_button(painter, buttons["toggle"], "✗", self.toggle_font, QColor("#6272a4"), QColor("#6272a4"), mouse_pos, radius=12, text_color=QColor("#ddd"))
+        self.paint_button(painter, buttons["delete"], self.lang_dict.get("delete", "Delete"), self.button_font, DELETE_COLOR, DELETE_HOVER_COLOR, mouse_pos)
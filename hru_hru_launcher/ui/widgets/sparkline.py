@@ -0,0 +1,48 @@
+# hru_hru_launcher/ui/widgets/sparkline.py
+from PySide6.QtCore import Qt, QPointF
+from PySide6.QtGui import QPainter, QPen, QColor, QPolygonF
+from PySide6.QtWidgets import QWidget
+
+
+class Sparkline(QWidget):
+    """Small line chart of the most recent values with a caption and the current value."""
+
+    def __init__(self, caption="", formatter=None, max_points=120, parent=None):
+        super().__init__(parent)
+        self.caption = caption
+        self.formatter = formatter or (lambda value: f"{value:.0f}")
+        self.max_points = max_points
+        self.values = []
+        self.color = QColor("#1DB954")
+        self.setMinimumSize(110, 38)
+
+    def set_values(self, values):
+        self.values = list(values[-self.max_points:])
+        self.update()
+
+    def set_color(self, color):
+        self.color = QColor(color)
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        rect = self.rect().adjusted(1, 14, -1, -1)
+
+        painter.setPen(QColor("#bd93f9"))
+        label = self.caption
+        if self.values:
+            label += f" {self.formatter(self.values[-1])}"
+        painter.drawText(self.rect().adjusted(2, 0, -2, 0), Qt.AlignLeft | Qt.AlignTop, label)
+
+        if len(self.values) < 2:
+            return
+        low, high = min(self.values), max(self.values)
+        span = (high - low) or 1.0
+        step = rect.width() / (len(self.values) - 1)
+        points = QPolygonF([
+            QPointF(rect.left() + i * step, rect.bottom() - (value - low) / span * rect.height())
+            for i, value in enumerate(self.values)
+        ])
+        painter.setPen(QPen(self.color, 1.5))
+        painter.drawPolyline(points)
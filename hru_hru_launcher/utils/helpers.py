@@ -1,6 +1,11 @@
 # helpers.py
 import math
 import re
+import importlib
+import threading
+from functools import lru_cache
+
+_VERSION_NUMBER_RE = re.compile(r"(\d+\.\d+(\.\d+)?)")
 
 def format_size(size_bytes):
     if size_bytes <= 0: return "0 B"
@@ -13,6 +18,7 @@ def format_size(size_bytes):
     except (ValueError, IndexError):
         return "0 B"
 
+@lru_cache(maxsize=4096)
 def version_key(version_string):
     parts = []
     for part in version_string.split('.'):
@@ -20,17 +26,18 @@ def version_key(version_string):
             parts.append(int(part))
         except ValueError:
             parts.append(0) 
-    return parts
+    return tuple(parts)
 
+@lru_cache(maxsize=4096)
 def get_base_version(version_id):
     version_id_lower = version_id.lower()
 
     if 'fabric' in version_id_lower:
-        matches = re.findall(r"(\d+\.\d+(\.\d+)?)", version_id)
+        matches = _VERSION_NUMBER_RE.findall(version_id)
         if matches:
             return matches[-1][0]
 
-    match = re.match(r"(\d+\.\d+(\.\d+)?)", version_id)
+    match = _VERSION_NUMBER_RE.match(version_id)
     if match:
         return match.group(1)
 
@@ -52,4 +59,42 @@ def get_latest_versions(raw_versions):
         mc_version = version_str.split('-', 1)[0]
         if mc_version not in latest_versions:
             latest_versions[mc_version] = version_str
-    return list(latest_versions.values())
\ No newline at end of file
+    return list(latest_versions.values())
+
+
+class LazyModule:
+    """
+    Stands in for a module and imports it on first attribute access, so
+    startup does not pay for modules (requests, psutil, the game library)
+    that are only needed once the user does something.
+    """
+
+    _import_lock = threading.Lock()
+
+    def __init__(self, name):
+        self.__dict__["_name"] = name
+        self.__dict__["_module"] = None
+
+    def _load(self):
+        module = self.__dict__["_module"]
+        if module is None:
+            with LazyModule._import_lock:
+                module = self.__dict__["_module"] or importlib.import_module(self.__dict__["_name"])
+                self.__dict__["_module"] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        state = "loaded" if self.__dict__["_module"] is not None else "not loaded"
+        return f"<lazy module '{self.__dict__['_name']}' ({state})>"
+
+
+def lazy_import(name):
+    return LazyModule(name)
+
+
+def is_loaded(module):
+    """False for a LazyModule that has not been imported yet."""
+    return not isinstance(module, LazyModule) or module.__dict__["_module"] is not None
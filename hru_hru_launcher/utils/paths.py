@@ -30,4 +30,16 @@ def get_assets_dir():
     if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
         return os.path.join(sys._MEIPASS, "assets")
     else:
-        return os.path.join(os.path.dirname(__file__), '..', '..', 'assets')
\ No newline at end of file
+        return os.path.join(os.path.dirname(__file__), '..', '..', 'assets')
+
+def get_minecraft_directory():
+    """
+    Returns the default .minecraft directory. Same rules as
+    minecraft_launcher_lib.utils.get_minecraft_directory, without importing the library at startup.
+    """
+    if sys.platform == "win32":
+        return os.path.join(os.getenv("APPDATA", os.path.join(os.path.expanduser("~"), "AppData", "Roaming")), ".minecraft")
+    elif sys.platform == "darwin":
+        return os.path.join(os.path.expanduser("~"), "Library", "Application Support", "minecraft")
+    else:
+        return os.path.join(os.path.expanduser("~"), ".minecraft")
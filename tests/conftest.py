@@ -0,0 +1,9 @@
+import os
+import sys
+import tempfile
+
+# Several modules resolve the launcher data folder under ~/Documents when they
+# are imported; keep the test run out of the real one
+os.environ["HOME"] = tempfile.mkdtemp(prefix="hru-tests-home-")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
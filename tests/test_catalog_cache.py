@@ -0,0 +1,72 @@
+import pytest
+import requests
+
+from hru_hru_launcher.core import catalog_cache
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, data=None, headers=None):
+        self.status_code = status_code
+        self._data = data
+        self.headers = headers or {}
+
+    def json(self):
+        return self._data
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}")
+
+
+class FakeSession:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append(headers)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+MANIFEST = {"versions": [{"id": "1.20.1", "type": "release"}, {"id": "23w31a", "type": "snapshot"}]}
+
+
+@pytest.fixture(autouse=True)
+def catalogs_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(catalog_cache, "_catalog_path", lambda version_type: str(tmp_path / f"{version_type}.json"))
+
+
+def test_first_fetch_is_cached():
+    session = FakeSession(FakeResponse(data=MANIFEST, headers={"ETag": '"v1"'}))
+
+    assert catalog_cache.refresh_catalog("vanilla", session=session) == (["1.20.1"], True)
+    assert catalog_cache.load_catalog("vanilla") == ["1.20.1"]
+    assert catalog_cache.refresh_catalog("vanilla", session=FakeSession()) == (["1.20.1"], False)
+
+
+def test_stale_catalog_is_revalidated_with_its_etag():
+    catalog_cache.refresh_catalog("vanilla", session=FakeSession(FakeResponse(data=MANIFEST, headers={"ETag": '"v1"'})))
+    session = FakeSession(FakeResponse(status_code=304))
+
+    assert catalog_cache.refresh_catalog("vanilla", max_age=0, session=session) == (["1.20.1"], False)
+    assert session.requests[0]["If-None-Match"] == '"v1"'
+
+
+def test_changed_catalog_is_reported():
+    catalog_cache.refresh_catalog("fabric", session=FakeSession(FakeResponse(data=[{"version": "1.20.1", "stable": True}])))
+    session = FakeSession(FakeResponse(data=[{"version": "1.20.2", "stable": True}, {"version": "1.20.1", "stable": True}]))
+
+    assert catalog_cache.refresh_catalog("fabric", max_age=0, session=session) == (["1.20.2", "1.20.1"], True)
+
+
+def test_offline_refresh_falls_back_to_the_last_good_catalog():
+    catalog_cache.refresh_catalog("vanilla", session=FakeSession(FakeResponse(data=MANIFEST)))
+
+    offline = FakeSession(requests.ConnectionError("offline"))
+    assert catalog_cache.refresh_catalog("vanilla", max_age=0, session=offline) == (["1.20.1"], False)
+
+    with pytest.raises(requests.ConnectionError):
+        catalog_cache.refresh_catalog("forge", session=FakeSession(requests.ConnectionError("offline")))
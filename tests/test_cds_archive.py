@@ -0,0 +1,65 @@
+import pytest
+
+from hru_hru_launcher.core import cds_archive
+
+COMMAND = ["java", "-cp", "client.jar", "net.minecraft.client.main.Main"]
+
+
+@pytest.fixture(autouse=True)
+def archives_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(cds_archive, "get_archives_dir", lambda: str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cds_archive.time, "time", lambda: now[0])
+    return now
+
+
+def test_archive_is_dumped_after_the_first_successful_run():
+    assert cds_archive.prepare_command(COMMAND, "key") == (COMMAND, None)
+
+    cds_archive.record_run("key", "1.20.1", None, True, 5000)
+    command, mode = cds_archive.prepare_command(COMMAND, "key")
+
+    assert mode == "dump"
+    assert command[1] == f"-XX:ArchiveClassesAtExit={cds_archive.archive_path('key')}"
+    assert command[2:] == COMMAND[1:]
+
+
+def test_existing_archive_is_used():
+    cds_archive.record_run("key", "1.20.1", None, True, 5000)
+    with open(cds_archive.archive_path("key"), "wb") as f:
+        f.write(b"jsa")
+    cds_archive.record_run("key", "1.20.1", "dump", True)
+
+    command, mode = cds_archive.prepare_command(COMMAND, "key")
+
+    assert mode == "use"
+    assert command[1] == f"-XX:SharedArchiveFile={cds_archive.archive_path('key')}"
+
+
+def test_dumping_stops_after_max_attempts():
+    cds_archive.record_run("key", "1.20.1", None, True, 5000)
+    for _ in range(cds_archive.MAX_DUMP_ATTEMPTS):
+        cds_archive.record_run("key", "1.20.1", "dump", False)
+
+    assert cds_archive.prepare_command(COMMAND, "key") == (COMMAND, None)
+
+
+def test_least_recently_used_archive_is_evicted(clock, monkeypatch):
+    monkeypatch.setattr(cds_archive, "MAX_ARCHIVES", 2)
+    cds_archive.record_run("a", "1.20.1", None, True)
+    clock[0] += 1
+    cds_archive.record_run("b", "1.20.1", None, True)
+    with open(cds_archive.archive_path("a"), "wb") as f:
+        f.write(b"jsa")
+    clock[0] += 1
+    # Launching with "a" marks it used even though its run is never recorded
+    cds_archive.prepare_command(COMMAND, "a")
+    clock[0] += 1
+    cds_archive.record_run("c", "1.20.1", None, True)
+
+    assert set(cds_archive._read_index()) == {"a", "c"}
@@ -0,0 +1,66 @@
+from hru_hru_launcher.core.crash_classifier import CrashClassifier, DEFAULT_RULES, MultiPatternMatcher
+
+FABRIC_MISSING_DEPENDENCY = """\
+[12:00:01] [main/INFO]: Loading Minecraft 1.20.1 with Fabric Loader 0.15.0
+[12:00:02] [main/ERROR]: Incompatible mods found!
+net.fabricmc.loader.impl.FormattedException: Some of your mods are incompatible with the game or each other!
+A potential solution has been determined:
+\t - Install fabric-api, any version.
+Unmet dependency listing:
+\t - Mod 'Sodium' (sodium) 0.5.3 requires any version of fabric-api, which is missing!
+"""
+
+FORGE_MISSING_DEPENDENCY = """\
+[12:00:01] [main/INFO] [cp.mo.mo.Launcher/MODLAUNCHER]: ModLauncher running
+[12:00:05] [main/ERROR] [ne.mi.fm.lo.ModSorter/LOADING]: Missing or unsupported mandatory dependencies:
+\tMod ID: 'architectury', Requested by: 'rei', Expected range: '[9.1.12,)', Actual version: '[MISSING]'
+"""
+
+OUT_OF_MEMORY_AFTER_MIXIN_WARNING = """\
+[12:00:01] [main/WARN]: Mixin prepare failed for optional mixin config
+Exception in thread "Render thread" java.lang.OutOfMemoryError: Java heap space
+"""
+
+
+def classify(text):
+    classifier = CrashClassifier(rules=DEFAULT_RULES)
+    for line in text.splitlines():
+        classifier.feed(line)
+    return classifier.result()
+
+
+def test_matcher_finds_every_pattern():
+    matcher = MultiPatternMatcher(["he", "she", "hers", "his"])
+
+    assert matcher.search("ushers") == {0, 1, 2}
+    assert matcher.search("nothing") == set()
+
+
+def test_fabric_missing_dependency():
+    result = classify(FABRIC_MISSING_DEPENDENCY)
+
+    assert result["type"] == "fabric_dependency_error"
+    assert result["rule"] == "fabric_missing_dependency"
+    assert result["dependency"] == "fabric-api"
+
+
+def test_forge_missing_dependency_reads_the_id_after_the_header():
+    result = classify(FORGE_MISSING_DEPENDENCY)
+
+    assert result["rule"] == "forge_missing_dependency"
+    assert result["dependency"] == "architectury"
+
+
+def test_ordinary_lines_do_not_look_like_missing_dependencies():
+    assert classify("[main/INFO]: Accepting any version.\n[main/INFO]: Mod ID: 'sodium' loaded\n") is None
+
+
+def test_highest_priority_rule_wins():
+    result = classify(OUT_OF_MEMORY_AFTER_MIXIN_WARNING)
+
+    assert result["type"] == "out_of_memory"
+    assert "message" in result
+
+
+def test_long_lines_are_cut():
+    assert classify("x" * 100000 + " java.lang.OutOfMemoryError") is None
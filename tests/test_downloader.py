@@ -0,0 +1,128 @@
+import hashlib
+import json
+import os
+
+import pytest
+
+from hru_hru_launcher.core import downloader
+
+
+@pytest.fixture
+def on_linux(monkeypatch):
+    monkeypatch.setattr(downloader, "_os_name", lambda: "linux")
+
+
+def _write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    raw = json.dumps(data).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(raw)
+    return hashlib.sha1(raw).hexdigest()
+
+
+def test_rules_allow_without_rules():
+    assert downloader._rules_allow(None)
+    assert downloader._rules_allow([])
+
+
+def test_rules_allow_last_matching_rule_wins(on_linux):
+    rules = [{"action": "allow"}, {"action": "disallow", "os": {"name": "osx"}}]
+    assert downloader._rules_allow(rules)
+    rules = [{"action": "allow"}, {"action": "disallow", "os": {"name": "linux"}}]
+    assert not downloader._rules_allow(rules)
+
+
+def test_rules_allow_only_listed_os(on_linux):
+    assert not downloader._rules_allow([{"action": "allow", "os": {"name": "windows"}}])
+    assert downloader._rules_allow([{"action": "allow", "os": {"name": "linux"}}])
+
+
+def test_rules_allow_ignores_feature_rules(on_linux):
+    assert not downloader._rules_allow([{"action": "allow", "features": {"is_demo_user": True}}])
+
+
+def test_collect_version_downloads(tmp_path, on_linux):
+    minecraft_dir = str(tmp_path)
+    index_sha1 = _write_json(
+        os.path.join(minecraft_dir, "assets", "indexes", "5.json"),
+        {"objects": {
+            "icons/a.png": {"hash": "ab" + "0" * 38, "size": 10},
+            "icons/b.png": {"hash": "ab" + "0" * 38, "size": 10},
+            "sounds/c.ogg": {"hash": "cd" + "1" * 38, "size": 20},
+        }},
+    )
+    version_data = {
+        "id": "1.20.1",
+        "downloads": {"client": {"url": "https://example.com/client.jar", "sha1": "c" * 40, "size": 100}},
+        "assetIndex": {"id": "5", "url": "https://example.com/5.json", "sha1": index_sha1},
+        "logging": {"client": {"file": {"id": "client-1.12.xml", "url": "https://example.com/log.xml", "sha1": "l" * 40, "size": 5}}},
+        "libraries": [
+            {"downloads": {"artifact": {"url": "https://example.com/lib.jar", "path": "org/lib/1/lib-1.jar", "sha1": "1" * 40, "size": 1}}},
+            {
+                "downloads": {"artifact": {"url": "https://example.com/mac.jar", "path": "org/mac/1/mac-1.jar"}},
+                "rules": [{"action": "allow", "os": {"name": "osx"}}],
+            },
+            {
+                "downloads": {"classifiers": {"natives-linux": {"url": "https://example.com/n.jar", "path": "org/n/1/n-1-natives-linux.jar"}}},
+                "natives": {"linux": "natives-linux"},
+            },
+        ],
+    }
+
+    tasks = downloader.collect_version_downloads("1.20.1", minecraft_dir, version_data=version_data)
+    paths = {os.path.relpath(task["path"], minecraft_dir).replace(os.sep, "/") for task in tasks}
+
+    assert paths == {
+        "versions/1.20.1/1.20.1.jar",
+        "libraries/org/lib/1/lib-1.jar",
+        "libraries/org/n/1/n-1-natives-linux.jar",
+        "assets/objects/ab/ab" + "0" * 38,
+        "assets/objects/cd/cd" + "1" * 38,
+        "assets/log_configs/client-1.12.xml",
+    }
+
+
+def test_collect_version_downloads_follows_inherits_from(tmp_path, on_linux):
+    minecraft_dir = str(tmp_path)
+    _write_json(
+        os.path.join(minecraft_dir, "versions", "1.20.1", "1.20.1.json"),
+        {"id": "1.20.1", "downloads": {"client": {"url": "https://example.com/client.jar"}}},
+    )
+    loader_data = {
+        "id": "fabric-loader-0.15.0-1.20.1",
+        "inheritsFrom": "1.20.1",
+        "libraries": [{"name": "net.fabricmc:fabric-loader:0.15.0", "url": "https://maven.fabricmc.net/"}],
+    }
+
+    tasks = downloader.collect_version_downloads("fabric-loader-0.15.0-1.20.1", minecraft_dir, version_data=loader_data)
+    urls = {task["url"] for task in tasks}
+
+    assert urls == {
+        "https://maven.fabricmc.net/net/fabricmc/fabric-loader/0.15.0/fabric-loader-0.15.0.jar",
+        "https://example.com/client.jar",
+    }
+
+
+def test_rules_allow_matches_os_version(on_linux, monkeypatch):
+    monkeypatch.setattr(downloader, "_os_version", lambda: "10.0")
+    assert not downloader._rules_allow([{"action": "allow", "os": {"name": "linux", "version": "^6\\."}}])
+    assert downloader._rules_allow([{"action": "allow", "os": {"name": "linux", "version": "^10\\."}}])
+
+
+def test_legacy_assets_are_copied_by_name(tmp_path):
+    minecraft_dir = str(tmp_path)
+    object_hash = "ab" + "0" * 38
+    object_path = os.path.join(minecraft_dir, "assets", "objects", "ab", object_hash)
+    os.makedirs(os.path.dirname(object_path))
+    with open(object_path, "wb") as f:
+        f.write(b"sound")
+    _write_json(
+        os.path.join(minecraft_dir, "assets", "indexes", "pre-1.6.json"),
+        {"virtual": True, "map_to_resources": True, "objects": {"sound/step.ogg": {"hash": object_hash, "size": 5}}},
+    )
+
+    downloader._copy_legacy_assets({"assetIndex": {"id": "pre-1.6"}}, minecraft_dir)
+
+    for copy in (("assets", "virtual", "pre-1.6", "sound", "step.ogg"), ("resources", "sound", "step.ogg")):
+        with open(os.path.join(minecraft_dir, *copy), "rb") as f:
+            assert f.read() == b"sound"
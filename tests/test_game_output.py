@@ -0,0 +1,55 @@
+import io
+
+from hru_hru_launcher.core import game_output
+from hru_hru_launcher.core.game_output import GameOutputReader
+
+
+def _read(data, log_path=None, line_callback=None):
+    reader = GameOutputReader(io.BytesIO(data), log_path, line_callback)
+    reader.run()
+    return reader
+
+
+def test_lines_are_split_across_chunks_and_utf8_boundaries(monkeypatch):
+    monkeypatch.setattr(game_output, "READ_CHUNK_SIZE", 3)
+    seen = []
+
+    reader = _read("first\r\nпривет\nlast without newline".encode("utf-8"), line_callback=seen.append)
+
+    assert seen == ["first", "привет", "last without newline"]
+    assert reader.total_lines == 3
+
+
+def test_full_output_goes_to_the_log_file(tmp_path):
+    log_path = tmp_path / "game.log"
+
+    _read(b"a\nb\n", log_path=str(log_path))
+
+    assert log_path.read_text(encoding="utf-8") == "a\nb\n"
+
+
+def test_tail_keeps_the_last_lines(monkeypatch):
+    monkeypatch.setattr(game_output, "RING_BUFFER_LINES", 3)
+
+    reader = _read(b"".join(f"line {i}\n".encode() for i in range(10)))
+
+    assert reader.get_tail_text() == "line 7\nline 8\nline 9"
+
+
+def test_drain_returns_capped_batches():
+    reader = _read(b"".join(f"{i}\n".encode() for i in range(5)))
+
+    assert reader.drain(max_lines=2) == (["0", "1"], 0)
+    assert reader.drain(max_lines=2) == (["2", "3"], 0)
+    assert reader.drain(max_lines=2) == (["4"], 0)
+    assert not reader.has_pending()
+
+
+def test_lines_the_ui_cannot_keep_up_with_are_dropped_and_counted(monkeypatch):
+    monkeypatch.setattr(game_output, "MAX_PENDING_LINES", 4)
+
+    reader = _read(b"".join(f"{i}\n".encode() for i in range(10)))
+
+    assert reader.drain() == (["6", "7", "8", "9"], 6)
+    assert reader.drain() == ([], 0)
+    assert reader.total_lines == 10
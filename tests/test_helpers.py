@@ -0,0 +1,10 @@
+from hru_hru_launcher.utils import helpers
+
+
+def test_version_key_orders_numerically():
+    assert helpers.version_key("1.20.1") == (1, 20, 1)
+    assert helpers.version_key("1.9") < helpers.version_key("1.10") < helpers.version_key("1.10.2")
+
+
+def test_version_key_treats_non_numeric_parts_as_zero():
+    assert helpers.version_key("1.20.1-pre1") == (1, 20, 0)
@@ -0,0 +1,52 @@
+import pytest
+
+from hru_hru_launcher.core import install_journal
+
+
+@pytest.fixture(autouse=True)
+def journals_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(install_journal, "get_journals_dir", lambda: str(tmp_path))
+    return tmp_path
+
+
+def test_round_trip():
+    journal = install_journal.InstallJournal("/games/mc", "1.20.1")
+    journal.begin_step("base")
+    journal.plan([{"path": "/games/mc/a.jar", "sha1": "a" * 40}, {"path": "/games/mc/b.jar", "sha1": None}])
+    journal.mark_completed("/games/mc/a.jar")
+    journal.save()
+
+    resumed = install_journal.InstallJournal("/games/mc", "1.20.1")
+
+    assert resumed.exists()
+    assert resumed.steps == ["base"]
+    assert resumed.planned == {"/games/mc/a.jar": "a" * 40, "/games/mc/b.jar": None}
+    assert resumed.is_completed("/games/mc/a.jar")
+    assert not resumed.is_completed("/games/mc/b.jar")
+    assert resumed.progress_text() == "1/2 files"
+
+
+def test_finish_removes_the_journal():
+    journal = install_journal.InstallJournal("/games/mc", "1.20.1")
+    journal.begin_step("base")
+    journal.finish()
+
+    assert not journal.exists()
+    assert install_journal.InstallJournal("/games/mc", "1.20.1").steps == []
+
+
+def test_base_journal_is_shared_by_loaders():
+    install_journal.base_journal("/games/mc", "1.20.1-47.2.0", "forge").begin_step("base")
+
+    assert install_journal.has_pending_install("/games/mc", "1.20.1", None)
+    assert install_journal.has_pending_install("/games/mc", "1.20.1-47.2.0", "forge")
+    assert not install_journal.has_pending_install("/games/mc", "1.19.4", None)
+
+
+def test_loader_journal():
+    assert install_journal.loader_journal("/games/mc", "1.20.1", None) is None
+
+    install_journal.loader_journal("/games/mc", "1.20.1", "fabric").begin_step("fabric")
+
+    assert install_journal.has_pending_install("/games/mc", "1.20.1", "fabric")
+    assert not install_journal.has_pending_install("/games/mc", "1.20.1", None)
@@ -0,0 +1,47 @@
+import json
+
+from hru_hru_launcher.core import java_runtime
+
+
+def _runtime(major, arch="amd64", source="system", path=None):
+    return {"major": major, "arch": arch, "source": source, "path": path or f"/jvm/{major}-{arch}-{source}/bin/java"}
+
+
+def test_parse_major_version():
+    assert java_runtime.parse_major_version("1.8.0_392") == 8
+    assert java_runtime.parse_major_version("17.0.9") == 17
+    assert java_runtime.parse_major_version("21") == 21
+    assert java_runtime.parse_major_version("") is None
+    assert java_runtime.parse_major_version(None) is None
+
+
+def test_select_runtime_prefers_the_exact_major():
+    runtimes = [_runtime(21), _runtime(17), _runtime(8)]
+
+    assert java_runtime.select_runtime(17, runtimes)["major"] == 17
+
+
+def test_select_runtime_falls_back_to_the_closest_newer_major():
+    runtimes = [_runtime(21), _runtime(8), _runtime(25)]
+
+    assert java_runtime.select_runtime(17, runtimes)["major"] == 21
+    assert java_runtime.select_runtime(26, runtimes) is None
+
+
+def test_select_runtime_ties_prefer_64_bit_then_mojang():
+    runtimes = [_runtime(17, arch="x86", source="mojang"), _runtime(17, source="path"), _runtime(17, source="mojang")]
+
+    assert java_runtime.select_runtime(17, runtimes) == _runtime(17, source="mojang")
+
+
+def test_required_major_follows_inherits_from(tmp_path):
+    for version_id, data in {
+        "1.20.1": {"javaVersion": {"majorVersion": 17}},
+        "fabric-loader-0.15.0-1.20.1": {"inheritsFrom": "1.20.1"},
+    }.items():
+        version_dir = tmp_path / "versions" / version_id
+        version_dir.mkdir(parents=True)
+        (version_dir / f"{version_id}.json").write_text(json.dumps(data))
+
+    assert java_runtime.get_required_major("fabric-loader-0.15.0-1.20.1", str(tmp_path)) == 17
+    assert java_runtime.get_required_major("1.7.10", str(tmp_path)) == java_runtime.DEFAULT_JAVA_MAJOR
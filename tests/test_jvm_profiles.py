@@ -0,0 +1,36 @@
+from hru_hru_launcher.core import jvm_profiles
+
+
+def test_custom_flag_replaces_profile_flag():
+    merged = jvm_profiles.merge_args(["-Xmx4G", "-Xms4G", "-XX:MaxGCPauseMillis=50"], ["-Xmx6G", "-XX:MaxGCPauseMillis=100"])
+
+    assert merged == ["-Xms4G", "-Xmx6G", "-XX:MaxGCPauseMillis=100"]
+
+
+def test_custom_gc_drops_profile_gc_tuning():
+    merged = jvm_profiles.merge_args(["-Xmx4G", "-XX:+UseG1GC", "-XX:G1NewSizePercent=20", "-Dfile.encoding=UTF-8"], ["-XX:+UseZGC"])
+
+    assert merged == ["-Xmx4G", "-Dfile.encoding=UTF-8", "-XX:+UseZGC"]
+
+
+def test_system_properties_merge_by_name():
+    merged = jvm_profiles.merge_args(["-Dlog4j2.formatMsgNoLookups=true"], ["-Dlog4j2.formatMsgNoLookups=false"])
+
+    assert merged == ["-Dlog4j2.formatMsgNoLookups=false"]
+
+
+def test_heap_is_clamped_to_physical_ram():
+    _, args = jvm_profiles.build_jvm_args(jvm_profiles.PROFILE_NONE, 16, 17, hardware=(8, 7.6))
+
+    assert jvm_profiles.effective_max_heap(args) == "-Xmx6G"
+
+
+def test_effective_max_heap_is_the_last_one():
+    assert jvm_profiles.effective_max_heap(["-Xmx4G", "-Xms4G", "-Xmx6G"]) == "-Xmx6G"
+    assert jvm_profiles.effective_max_heap(["-Xms4G"]) is None
+
+
+def test_shenandoah_is_unlocked_before_java_15():
+    _, args = jvm_profiles.build_jvm_args(jvm_profiles.PROFILE_LARGE_HEAP, 16, 14, java_vendor="Eclipse Adoptium", hardware=(8, 32))
+
+    assert args.index("-XX:+UnlockExperimentalVMOptions") < args.index("-XX:+UseShenandoahGC")
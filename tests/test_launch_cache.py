@@ -0,0 +1,84 @@
+import json
+import os
+import sys
+
+import pytest
+
+from hru_hru_launcher.core import launch_cache
+
+
+@pytest.fixture
+def minecraft_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(launch_cache, "CACHE_FILE_PATH", str(tmp_path / "launch_cache.json"))
+    minecraft_dir = tmp_path / "minecraft"
+    _write_version(minecraft_dir, "1.20.1", {"id": "1.20.1"})
+    _write_version(minecraft_dir, "fabric-loader-0.15.0-1.20.1", {"id": "fabric-loader-0.15.0-1.20.1", "inheritsFrom": "1.20.1"})
+    (minecraft_dir / "libraries").mkdir()
+    (minecraft_dir / "libraries" / "lib.jar").write_bytes(b"jar")
+    return minecraft_dir
+
+
+def _write_version(minecraft_dir, version_id, data):
+    version_dir = minecraft_dir / "versions" / version_id
+    version_dir.mkdir(parents=True)
+    (version_dir / f"{version_id}.json").write_text(json.dumps(data))
+
+
+def _command(minecraft_dir):
+    return [sys.executable, "-cp", str(minecraft_dir / "libraries" / "lib.jar"), "net.minecraft.client.main.Main"]
+
+
+def _save(minecraft_dir, key="key"):
+    launch_cache.save_plan(str(minecraft_dir), key, "fabric-loader-0.15.0-1.20.1", _command(minecraft_dir))
+
+
+def test_make_key_changes_with_options():
+    base = launch_cache.make_key("/games/mc", "1.20.1", None, {"jvmArguments": ["-Xmx4G"]})
+
+    assert base == launch_cache.make_key("/games/mc", "1.20.1", None, {"jvmArguments": ["-Xmx4G"]})
+    assert base != launch_cache.make_key("/games/mc", "1.20.1", None, {"jvmArguments": ["-Xmx6G"]})
+    assert base != launch_cache.make_key("/games/mc", "1.20.1", "fabric", {"jvmArguments": ["-Xmx4G"]})
+
+
+def test_load_plan(minecraft_dir):
+    _save(minecraft_dir)
+
+    plan = launch_cache.load_plan(str(minecraft_dir), "key")
+
+    assert plan["version_id"] == "fabric-loader-0.15.0-1.20.1"
+    assert plan["command"] == _command(minecraft_dir)
+    assert set(plan["chain"]) == {"fabric-loader-0.15.0-1.20.1", "1.20.1"}
+
+
+def test_plan_is_dropped_when_a_parent_version_json_changes(minecraft_dir):
+    _save(minecraft_dir)
+    (minecraft_dir / "versions" / "1.20.1" / "1.20.1.json").write_text(json.dumps({"id": "1.20.1", "mainClass": "x"}))
+
+    assert launch_cache.load_plan(str(minecraft_dir), "key") is None
+    assert "key" not in launch_cache._read_cache()
+
+
+def test_plan_is_dropped_when_a_classpath_entry_is_missing(minecraft_dir):
+    _save(minecraft_dir)
+    os.remove(minecraft_dir / "libraries" / "lib.jar")
+
+    assert launch_cache.load_plan(str(minecraft_dir), "key") is None
+
+
+def test_plan_is_dropped_when_java_is_missing(minecraft_dir):
+    command = [str(minecraft_dir / "java" / "bin" / "java")] + _command(minecraft_dir)[1:]
+    launch_cache.save_plan(str(minecraft_dir), "key", "1.20.1", command)
+
+    assert launch_cache.load_plan(str(minecraft_dir), "key") is None
+
+
+def test_invalidate(minecraft_dir):
+    _save(minecraft_dir, "a")
+    _save(minecraft_dir, "b")
+
+    launch_cache.invalidate("a")
+    assert launch_cache.load_plan(str(minecraft_dir), "a") is None
+    assert launch_cache.load_plan(str(minecraft_dir), "b") is not None
+
+    launch_cache.invalidate()
+    assert launch_cache.load_plan(str(minecraft_dir), "b") is None
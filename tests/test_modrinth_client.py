@@ -0,0 +1,94 @@
+import pytest
+import requests
+
+from hru_hru_launcher.core import modrinth_client
+from hru_hru_launcher.core.modrinth_client import ModrinthClient
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, data=None, headers=None):
+        self.status_code = status_code
+        self._data = data
+        self.headers = headers or {}
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    def json(self):
+        return self._data
+
+    def close(self):
+        pass
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise requests.HTTPError(f"HTTP {self.status_code}")
+
+
+class FakeSession:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+
+    def get(self, url, params=None, timeout=None, stream=False):
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock; sleeping advances it and is recorded."""
+    state = {"now": 100.0, "sleeps": []}
+
+    def sleep(seconds):
+        state["sleeps"].append(seconds)
+        state["now"] += seconds
+
+    monkeypatch.setattr(modrinth_client.time, "monotonic", lambda: state["now"])
+    monkeypatch.setattr(modrinth_client.time, "sleep", sleep)
+    monkeypatch.setattr(modrinth_client.random, "uniform", lambda low, high: high)
+    return state
+
+
+def _client(*responses):
+    client = ModrinthClient(max_retries=3)
+    client.session = FakeSession(*responses)
+    return client
+
+
+def test_server_errors_are_retried_with_exponential_backoff(clock):
+    client = _client(FakeResponse(503), requests.ConnectionError("reset"), FakeResponse(data={"hits": []}))
+
+    assert client.get("search", "/search") == {"hits": []}
+    assert clock["sleeps"] == [modrinth_client.RETRY_BASE_DELAY, modrinth_client.RETRY_BASE_DELAY * 2]
+    assert client.stats()["search"]["retries"] == 2
+    assert client.stats()["search"]["errors"] == 2
+
+
+def test_gives_up_after_max_retries(clock):
+    client = _client(*[FakeResponse(502)] * 4)
+
+    with pytest.raises(requests.HTTPError):
+        client.get("project", "/project/sodium")
+    assert client.stats()["project"]["requests"] == 4
+
+
+def test_rate_limited_request_waits_for_the_reset(clock):
+    client = _client(FakeResponse(429, headers={"X-Ratelimit-Remaining": "0", "X-Ratelimit-Reset": "12"}), FakeResponse(data=[]))
+
+    assert client.get("search", "/search") == []
+    assert clock["sleeps"] == [12.0]
+
+
+def test_low_remaining_budget_blocks_the_next_request(clock):
+    client = _client(
+        FakeResponse(data=1, headers={"X-Ratelimit-Limit": "300", "X-Ratelimit-Remaining": "1", "X-Ratelimit-Reset": "5"}),
+        FakeResponse(data=2),
+    )
+
+    assert client.get("search", "/search") == 1
+    assert client.rate_limit == {"limit": 300, "remaining": 1, "reset": 5.0}
+    assert client.get("search", "/search") == 2
+    assert clock["sleeps"] == [5.0]
@@ -0,0 +1,33 @@
+import pytest
+
+from hru_hru_launcher.core import search_cache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(search_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_page_goes_stale_then_expires(clock):
+    cache = search_cache.SearchCache(fresh_seconds=10, max_age_seconds=60)
+    cache.put("key", ["sodium"], 1)
+
+    assert cache.get("key") == search_cache.CachedPage(["sodium"], 1, True)
+    clock[0] += 30
+    assert cache.get("key") == search_cache.CachedPage(["sodium"], 1, False)
+    clock[0] += 31
+    assert cache.get("key") is None
+
+
+def test_least_recently_used_page_is_evicted(clock):
+    cache = search_cache.SearchCache(max_entries=2)
+    cache.put("a", [], 0)
+    cache.put("b", [], 0)
+    cache.get("a")
+    cache.put("c", [], 0)
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
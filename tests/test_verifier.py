@@ -0,0 +1,77 @@
+import hashlib
+import os
+
+import pytest
+
+from hru_hru_launcher.core import verifier
+from hru_hru_launcher.core.hash_db import HashDatabase
+
+
+def _sha1(data):
+    return hashlib.sha1(data).hexdigest()
+
+
+@pytest.fixture
+def hash_db(tmp_path, monkeypatch):
+    db = HashDatabase(str(tmp_path / "verified_hashes.json"))
+    monkeypatch.setattr(verifier, "get_hash_db", lambda: db)
+    return db
+
+
+@pytest.fixture
+def tasks(tmp_path, monkeypatch):
+    files = tmp_path / "minecraft"
+    files.mkdir()
+    (files / "good.jar").write_bytes(b"good")
+    (files / "short.jar").write_bytes(b"shor")
+    (files / "corrupt.jar").write_bytes(b"bad!")
+    tasks = [
+        {"url": "https://example.com/good.jar", "path": str(files / "good.jar"), "sha1": _sha1(b"good"), "size": 4},
+        {"url": "https://example.com/short.jar", "path": str(files / "short.jar"), "sha1": _sha1(b"short"), "size": 5},
+        {"url": "https://example.com/corrupt.jar", "path": str(files / "corrupt.jar"), "sha1": _sha1(b"good"), "size": 4},
+        {"url": "https://example.com/missing.jar", "path": str(files / "missing.jar"), "sha1": _sha1(b"x"), "size": 1},
+    ]
+    monkeypatch.setattr(verifier.downloader, "collect_version_downloads", lambda version_id, minecraft_dir: tasks)
+    return tasks
+
+
+def test_hash_db_remembers_unchanged_files(tmp_path):
+    path = tmp_path / "lib.jar"
+    path.write_bytes(b"one")
+    db = HashDatabase(str(tmp_path / "db.json"))
+
+    assert db.get_sha1(str(path)) == _sha1(b"one")
+    db.save()
+    assert HashDatabase(str(tmp_path / "db.json")).lookup(str(path)) == _sha1(b"one")
+
+    path.write_bytes(b"changed")
+    assert db.lookup(str(path)) is None
+    assert db.get_sha1(str(path)) == _sha1(b"changed")
+
+
+def test_verify_reports_only_broken_files(tasks, hash_db, tmp_path):
+    broken = verifier.verify_version("1.20.1", str(tmp_path))
+
+    reasons = {os.path.basename(task["path"]): reason for task, reason in broken}
+    assert reasons == {"short.jar": "size mismatch", "corrupt.jar": "hash mismatch", "missing.jar": "missing"}
+
+
+def test_repair_downloads_only_broken_files(tasks, hash_db, tmp_path, monkeypatch):
+    downloaded = []
+
+    class FakeEngine:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def download_all(self, tasks, status_text):
+            downloaded.extend(os.path.basename(task["path"]) for task in tasks)
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(verifier.downloader, "DownloadEngine", FakeEngine)
+
+    assert verifier.repair_version("1.20.1", str(tmp_path), log=lambda message: None) == 3
+    assert sorted(downloaded) == ["corrupt.jar", "missing.jar", "short.jar"]
+    assert os.path.isfile(tasks[0]["path"])
+    assert not os.path.exists(tasks[2]["path"])
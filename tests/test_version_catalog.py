@@ -0,0 +1,25 @@
+from hru_hru_launcher.core import version_catalog
+from hru_hru_launcher.core.version_catalog import LOADER_FABRIC, LOADER_FORGE, LOADER_VANILLA
+
+
+def test_parse_vanilla_id():
+    record = version_catalog.parse_installed_id("1.20.1")
+
+    assert (record.mc_version, record.loader, record.build, record.sort_key) == ("1.20.1", LOADER_VANILLA, None, (1, 20, 1))
+
+
+def test_parse_fabric_id():
+    record = version_catalog.parse_installed_id("fabric-loader-0.15.0-1.20.1")
+
+    assert (record.mc_version, record.loader, record.build) == ("1.20.1", LOADER_FABRIC, "0.15.0")
+
+
+def test_parse_forge_id():
+    record = version_catalog.parse_installed_id("1.20.1-forge-47.2.0")
+
+    assert (record.mc_version, record.loader) == ("1.20.1", LOADER_FORGE)
+
+
+def test_base_mc_version():
+    assert version_catalog.base_mc_version("1.20.1-47.2.0", LOADER_FORGE) == "1.20.1"
+    assert version_catalog.base_mc_version("1.20.1", LOADER_FABRIC) == "1.20.1"
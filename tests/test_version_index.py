@@ -0,0 +1,72 @@
+import json
+import shutil
+
+import pytest
+
+from hru_hru_launcher.core.version_index import VersionIndex
+
+
+@pytest.fixture
+def minecraft_dir(tmp_path):
+    minecraft_dir = tmp_path / "minecraft"
+    (minecraft_dir / "versions").mkdir(parents=True)
+    return minecraft_dir
+
+
+def _write_version(minecraft_dir, version_id, **data):
+    version_dir = minecraft_dir / "versions" / version_id
+    version_dir.mkdir(exist_ok=True)
+    (version_dir / f"{version_id}.json").write_text(json.dumps(dict(data, id=version_id)))
+
+
+def _index(minecraft_dir, tmp_path):
+    return VersionIndex(str(minecraft_dir), str(tmp_path / "versions_index.json"))
+
+
+def test_lists_installed_versions(minecraft_dir, tmp_path):
+    _write_version(minecraft_dir, "1.20.1", type="release")
+    _write_version(minecraft_dir, "fabric-loader-0.15.0-1.20.1", inheritsFrom="1.20.1")
+
+    index = _index(minecraft_dir, tmp_path)
+
+    assert index.get_installed_ids() == {"1.20.1", "fabric-loader-0.15.0-1.20.1"}
+    assert index.get_version_info("fabric-loader-0.15.0-1.20.1")["inheritsFrom"] == "1.20.1"
+    assert index.get_version_info("1.19.4") is None
+
+
+def test_unchanged_versions_are_not_parsed_again(minecraft_dir, tmp_path, monkeypatch):
+    _write_version(minecraft_dir, "1.20.1")
+    _index(minecraft_dir, tmp_path).get_installed_ids()
+
+    parsed = []
+    original = VersionIndex._parse_version_json
+    monkeypatch.setattr(VersionIndex, "_parse_version_json", staticmethod(lambda path: parsed.append(path) or original(path)))
+    index = _index(minecraft_dir, tmp_path)
+
+    assert index.get_installed_ids() == {"1.20.1"}
+    assert parsed == []
+
+
+def test_folder_without_json_shows_up_once_its_json_is_written(minecraft_dir, tmp_path):
+    (minecraft_dir / "versions" / "1.20.1").mkdir()
+    index = _index(minecraft_dir, tmp_path)
+    assert index.get_installed_ids() == set()
+
+    _write_version(minecraft_dir, "1.20.1")
+
+    assert index.get_installed_ids() == {"1.20.1"}
+
+
+def test_removed_and_changed_versions_after_invalidate(minecraft_dir, tmp_path):
+    _write_version(minecraft_dir, "1.20.1", type="release")
+    _write_version(minecraft_dir, "1.19.4")
+    index = _index(minecraft_dir, tmp_path)
+    catalog = index.get_catalog()
+
+    shutil.rmtree(minecraft_dir / "versions" / "1.19.4")
+    _write_version(minecraft_dir, "1.20.1", type="snapshot", releaseTime="2023-06-12")
+    index.invalidate()
+
+    assert index.get_installed_ids() == {"1.20.1"}
+    assert index.get_version_info("1.20.1")["type"] == "snapshot"
+    assert index.get_catalog() is not catalog